@@ -1,17 +1,101 @@
-from dataclasses import asdict
-from typing import List
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+from typing import List, Optional, Tuple
 
 from pydantic import BaseModel, ConfigDict, StrictStr
 
 from core.agents.base import BaseAgent
 from core.agents.convo import AgentConvo
 from core.agents.response import AgentResponse
+from core.config import get_config
 from core.llm.parser import JSONParser
 from core.log import get_logger
-from core.web import BraveSearchError, brave_search
+from core.web import BraveSearchError, WebResult, brave_search
 
 log = get_logger(__name__)
 
+# Generated queries keyed by sha256 of (model, task description), so repeated
+# runs of the same task skip the query-generation LLM roundtrip.
+QUERY_CACHE_SIZE = 128
+_query_cache: "OrderedDict[str, List[str]]" = OrderedDict()
+
+# Brave responses keyed by (query, max content length), stored with the
+# monotonic time they were fetched.
+SEARCH_CACHE_SIZE = 256
+SEARCH_CACHE_TTL = 24 * 60 * 60
+_search_cache: "OrderedDict[Tuple[str, Optional[int]], Tuple[float, List[WebResult]]]" = OrderedDict()
+
+# Queries whose token sets overlap at least this much are treated as duplicates.
+QUERY_SIMILARITY_THRESHOLD = 0.9
+
+
+def _dedupe_similar_queries(queries: List[str], threshold: float = QUERY_SIMILARITY_THRESHOLD) -> List[str]:
+    """
+    Drop queries that are near-duplicates of an earlier query.
+
+    Similarity is the Jaccard index of the lowercased word sets, so reordered
+    paraphrases like "python asyncio tutorial" and "asyncio tutorial python"
+    collapse into one search. The first query of each group is kept.
+    """
+    kept: List[str] = []
+    kept_tokens: List[frozenset] = []
+    for query in queries:
+        tokens = frozenset(query.lower().split())
+        for other in kept_tokens:
+            if len(tokens & other) >= threshold * len(tokens | other):
+                log.debug("WebSearch: dropping near-duplicate query %r", query)
+                break
+        else:
+            kept.append(query)
+            kept_tokens.append(tokens)
+    return kept
+
+
+async def cached_brave_search(
+    query: str,
+    ttl: float = SEARCH_CACHE_TTL,
+    max_content_length: Optional[int] = None,
+) -> List[WebResult]:
+    """
+    Run :func:`brave_search`, reusing a cached response younger than ``ttl`` seconds.
+
+    If ``max_content_length`` is set, page contents are truncated before
+    caching so the cache does not hold on to text that is never used.
+    Failed searches are not cached.
+    """
+    key = (query, max_content_length)
+    now = time.monotonic()
+    cached = _search_cache.get(key)
+    if cached is not None and now - cached[0] < ttl:
+        _search_cache.move_to_end(key)
+        return list(cached[1])
+
+    results = await brave_search(query)
+    if max_content_length is not None:
+        for r in results:
+            if r.content and len(r.content) > max_content_length:
+                r.content = r.content[:max_content_length]
+
+    _search_cache[key] = (now, results)
+    _search_cache.move_to_end(key)
+    if len(_search_cache) > SEARCH_CACHE_SIZE:
+        _search_cache.popitem(last=False)
+    return list(results)
+
+
+def _result_to_dict(result: WebResult, max_len: int) -> dict:
+    """Convert a search result into the plain dict stored in project state."""
+    return {
+        "url": result.url,
+        "title": result.title,
+        "content": (result.content or "")[:max_len],
+        "snippet": result.snippet,
+        "trusted": result.trusted,
+        "verified": result.verified,
+    }
+
 
 class WebQueries(BaseModel):
     model_config = ConfigDict(strict=True, extra="forbid")
@@ -19,6 +103,11 @@ class WebQueries(BaseModel):
     queries: List[StrictStr]
 
 
+# Shared by all WebSearch runs; parsing is synchronous, so the per-call
+# ``original_response`` it stores is never observed by another run.
+_WEB_QUERIES_PARSER = JSONParser(WebQueries)
+
+
 class WebSearch(BaseAgent):
     """Agent responsible for performing web searches for the current task."""
 
@@ -26,6 +115,7 @@ class WebSearch(BaseAgent):
     display_name = "Web search"
 
     MAX_CONTENT_LENGTH = 2000
+    MAX_CONCURRENT_SEARCHES = 8
 
     async def run(self) -> AgentResponse:
         if self.current_state.specification.example_project:
@@ -39,39 +129,70 @@ class WebSearch(BaseAgent):
             self.next_state.web = []
             return AgentResponse.done(self)
 
-        llm = self.get_llm(stream_output=False)
-        convo = (
-            AgentConvo(self)
-            .template(
-                "create_queries",
-                task_description=task_desc,
-            )
-            .require_schema(WebQueries)
-        )
         await self.send_message("Searching the web for relevant information...")
-        queries: WebQueries = await llm(convo, parser=JSONParser(WebQueries))
-
-        raw_queries = getattr(queries, "queries", None) or []
-        deduped_queries = list(dict.fromkeys([q for q in raw_queries if isinstance(q, str) and q.strip()]))
+        deduped_queries = await self.create_queries(task_desc)
         if not deduped_queries:
             self.next_state.web = []
             return AgentResponse.done(self)
 
-        results: List[dict] = []
-        for q in deduped_queries:
-            try:
-                search_results = await brave_search(q)
-            except BraveSearchError:
-                log.warning("Web search failed", exc_info=True)
+        sem = asyncio.Semaphore(self.MAX_CONCURRENT_SEARCHES)
+
+        async def search(q: str):
+            async with sem:
+                return await cached_brave_search(q, max_content_length=self.MAX_CONTENT_LENGTH)
+
+        responses = await asyncio.gather(*(search(q) for q in deduped_queries), return_exceptions=True)
+
+        # Keyed by URL so pages returned for several queries are kept only once
+        results: dict[str, dict] = {}
+        for search_results in responses:
+            if isinstance(search_results, BraveSearchError):
+                log.warning("Web search failed", exc_info=search_results)
                 continue
+            if isinstance(search_results, BaseException):
+                raise search_results
             for r in search_results:
-                data = asdict(r)
-                if len(data.get("content", "")) > self.MAX_CONTENT_LENGTH:
-                    data["content"] = data["content"][: self.MAX_CONTENT_LENGTH]
-                results.append(data)
+                if r.url not in results:
+                    results[r.url] = _result_to_dict(r, self.MAX_CONTENT_LENGTH)
 
         if not results:
             await self.send_message("Web search failed to retrieve any results.")
 
-        self.next_state.web = results
+        self.next_state.web = list(results.values())
         return AgentResponse.done(self)
+
+    async def create_queries(self, task_desc: str) -> List[str]:
+        """
+        Ask the LLM for search queries relevant to the task.
+
+        Results are cached in-process by model and task description.
+
+        :param task_desc: Description of the current task.
+        :return: Deduplicated, non-empty search queries.
+        """
+        model = get_config().llm_for_agent(self.__class__.__name__).model
+        key = hashlib.sha256(f"{model}|{task_desc}".encode("utf-8")).hexdigest()
+        if key in _query_cache:
+            _query_cache.move_to_end(key)
+            log.debug("WebSearch: reusing cached queries for task")
+            return list(_query_cache[key])
+
+        llm = self.get_llm(stream_output=False)
+        convo = (
+            AgentConvo(self)
+            .template(
+                "create_queries",
+                task_description=task_desc,
+            )
+            .require_schema(WebQueries)
+        )
+        queries: WebQueries = await llm(convo, parser=_WEB_QUERIES_PARSER)
+
+        raw_queries = getattr(queries, "queries", None) or []
+        deduped_queries = list(dict.fromkeys([q for q in raw_queries if isinstance(q, str) and q.strip()]))
+        deduped_queries = _dedupe_similar_queries(deduped_queries)
+        if deduped_queries:
+            _query_cache[key] = deduped_queries
+            if len(_query_cache) > QUERY_CACHE_SIZE:
+                _query_cache.popitem(last=False)
+        return list(deduped_queries)
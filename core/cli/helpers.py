@@ -315,7 +315,7 @@ def init() -> tuple[UIBase, SessionManager, Namespace]:
     elif config.ui.type == UIAdapter.VIRTUAL:
         ui = VirtualUI(config.ui.inputs)
     else:
-        ui = PlainConsoleUI()
+        ui = PlainConsoleUI(show_progress=config.ui.show_progress)
 
     run_migrations(config.db)
     db = SessionManager(config.db)
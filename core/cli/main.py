@@ -8,6 +8,7 @@ from core.agents.orchestrator import Orchestrator
 from core.cli.helpers import delete_project, init, list_projects, list_projects_json, load_project, show_config
 from core.config import LLMProvider, get_config
 from core.db.session import SessionManager
+from core.git.github import aclose_async_client
 from core.llm.anthropic_client import CustomAssertionError
 from core.llm.base import APIError, BaseLLMClient
 from core.log import get_logger
@@ -20,6 +21,7 @@ log = get_logger(__name__)
 
 async def cleanup(ui: UIBase):
     await telemetry.send()
+    await aclose_async_client()
     await ui.stop()
 
 
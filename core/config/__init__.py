@@ -236,6 +236,13 @@ class DBConfig(_StrictModel):
         description="Database connection URL",
     )
     debug_sql: bool = Field(False, description="Log all SQL queries to the console")
+    pool_size: int = Field(20, ge=1, description="Number of connections kept open in the connection pool")
+    max_overflow: int = Field(10, ge=0, description="Extra connections allowed above pool_size under load")
+    statement_cache_size: int = Field(
+        1024,
+        ge=0,
+        description="Number of prepared statements cached per connection (0 disables the cache)",
+    )
 
     @field_validator("url")
     @classmethod
@@ -255,6 +262,7 @@ class PlainUIConfig(_StrictModel):
     """
 
     type: Literal[UIAdapter.PLAIN] = UIAdapter.PLAIN
+    show_progress: bool = Field(True, description="Print task and step progress updates")
 
 
 class LocalIPCConfig(_StrictModel):
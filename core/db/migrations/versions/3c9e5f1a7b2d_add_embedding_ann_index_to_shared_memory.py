@@ -0,0 +1,66 @@
+"""add embedding ANN index to shared_memory
+
+Revision ID: 3c9e5f1a7b2d
+Revises: da904e0f1c0e
+Create Date: 2026-10-14 09:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3c9e5f1a7b2d"
+down_revision: Union[str, None] = "da904e0f1c0e"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _pgvector_version(bind) -> Union[tuple[int, ...], None]:
+    """Return the installed pgvector version if shared_memory.embedding is a vector column."""
+    udt_name = bind.execute(
+        sa.text(
+            "SELECT udt_name FROM information_schema.columns "
+            "WHERE table_name = 'shared_memory' AND column_name = 'embedding'"
+        )
+    ).scalar()
+    if udt_name != "vector":
+        return None
+
+    version = bind.execute(sa.text("SELECT extversion FROM pg_extension WHERE extname = 'vector'")).scalar()
+    if not version:
+        return None
+    return tuple(int(part) for part in version.split(".") if part.isdigit())
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    version = _pgvector_version(bind)
+    if version is None:
+        return
+
+    # HNSW is available since pgvector 0.5.0; older versions only support IVFFlat.
+    if version >= (0, 5):
+        op.execute(
+            "CREATE INDEX IF NOT EXISTS ix_shared_memory_embedding_hnsw ON shared_memory "
+            "USING hnsw (embedding vector_cosine_ops) WITH (m = 16, ef_construction = 64)"
+        )
+    else:
+        op.execute(
+            "CREATE INDEX IF NOT EXISTS ix_shared_memory_embedding_ivfflat ON shared_memory "
+            "USING ivfflat (embedding vector_cosine_ops) WITH (lists = 100)"
+        )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    op.execute("DROP INDEX IF EXISTS ix_shared_memory_embedding_hnsw")
+    op.execute("DROP INDEX IF EXISTS ix_shared_memory_embedding_ivfflat")
@@ -0,0 +1,27 @@
+"""add agent_type index to shared_memory
+
+Revision ID: 5b8d2e4f6a1c
+Revises: 3c9e5f1a7b2d
+Create Date: 2026-10-14 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5b8d2e4f6a1c"
+down_revision: Union[str, None] = "3c9e5f1a7b2d"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("shared_memory", schema=None) as batch_op:
+        batch_op.create_index(batch_op.f("ix_shared_memory_agent_type"), ["agent_type"], unique=False)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("shared_memory", schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f("ix_shared_memory_agent_type"))
@@ -0,0 +1,83 @@
+"""store fallback embeddings as float32 blobs
+
+Revision ID: 7e4a9c3b1d5f
+Revises: 5b8d2e4f6a1c
+Create Date: 2026-10-14 11:00:00.000000
+
+"""
+
+import json
+import sys
+from array import array
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7e4a9c3b1d5f"
+down_revision: Union[str, None] = "5b8d2e4f6a1c"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _embedding_type(bind) -> sa.types.TypeEngine:
+    columns = {col["name"]: col for col in sa.inspect(bind).get_columns("shared_memory")}
+    return columns["embedding"]["type"]
+
+
+def _to_blob(embedding) -> bytes:
+    packed = array("f", embedding)
+    if sys.byteorder == "big":  # pragma: no cover
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def _from_blob(blob: bytes) -> list:
+    unpacked = array("f")
+    unpacked.frombytes(blob)
+    if sys.byteorder == "big":  # pragma: no cover
+        unpacked.byteswap()
+    return unpacked.tolist()
+
+
+def _convert_column(bind, new_type: sa.types.TypeEngine, convert) -> None:
+    """Replace shared_memory.embedding with a column of ``new_type``, converting each row."""
+    with op.batch_alter_table("shared_memory", schema=None) as batch_op:
+        batch_op.add_column(sa.Column("embedding_new", new_type, nullable=True))
+
+    table = sa.table(
+        "shared_memory",
+        sa.column("id", sa.String()),
+        sa.column("embedding"),
+        sa.column("embedding_new", new_type),
+    )
+    rows = bind.execute(sa.select(table.c.id, table.c.embedding)).all()
+    for row_id, embedding in rows:
+        bind.execute(table.update().where(table.c.id == row_id).values(embedding_new=convert(embedding)))
+
+    with op.batch_alter_table("shared_memory", schema=None) as batch_op:
+        batch_op.drop_column("embedding")
+        batch_op.alter_column("embedding_new", new_column_name="embedding", nullable=False)
+
+
+def upgrade() -> None:
+    # Only the JSON fallback (pgvector not installed) is converted; vector columns stay as-is.
+    bind = op.get_bind()
+    if not isinstance(_embedding_type(bind), sa.JSON):
+        return
+
+    def convert(embedding):
+        if isinstance(embedding, str):
+            embedding = json.loads(embedding)
+        return _to_blob(embedding)
+
+    _convert_column(bind, sa.LargeBinary(), convert)
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if not isinstance(_embedding_type(bind), sa.LargeBinary):
+        return
+
+    _convert_column(bind, sa.JSON(), _from_blob)
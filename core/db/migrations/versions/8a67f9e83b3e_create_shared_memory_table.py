@@ -1,4 +1,9 @@
-"""create shared memory table"""
+"""create shared memory table
+
+Revision ID: 8a67f9e83b3e
+Revises: f708791b9270
+
+"""
 
 from typing import Sequence, Union
 
@@ -13,7 +18,7 @@ except Exception:  # pragma: no cover - optional dependency
 
 # revision identifiers, used by Alembic.
 revision: str = "8a67f9e83b3e"
-down_revision: Union[str, Sequence[str], None] = ("f708791b9270", "ff891d366761")
+down_revision: Union[str, None] = "f708791b9270"
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
@@ -0,0 +1,45 @@
+"""generate shared_memory ids server-side
+
+Revision ID: 9d2f6b8e4c3a
+Revises: 7e4a9c3b1d5f
+Create Date: 2026-10-14 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9d2f6b8e4c3a"
+down_revision: Union[str, None] = "7e4a9c3b1d5f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Tables created without pgvector used a varchar id with app-level
+    # generation; bring them in line with the native UUID + server default.
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    data_type, default = bind.execute(
+        sa.text(
+            "SELECT data_type, column_default FROM information_schema.columns "
+            "WHERE table_name = 'shared_memory' AND column_name = 'id'"
+        )
+    ).one()
+    if data_type == "uuid" and default:
+        return
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pgcrypto")
+    if data_type != "uuid":
+        op.execute("ALTER TABLE shared_memory ALTER COLUMN id TYPE uuid USING id::uuid")
+    op.execute("ALTER TABLE shared_memory ALTER COLUMN id SET DEFAULT gen_random_uuid()")
+
+
+def downgrade() -> None:
+    # The UUID type and default from the pgvector branch of 8a67f9e83b3e are kept.
+    pass
@@ -0,0 +1,34 @@
+"""index project_states.web as jsonb
+
+Revision ID: b1e7d3a9c5f2
+Revises: 9d2f6b8e4c3a
+Create Date: 2026-10-14 13:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b1e7d3a9c5f2"
+down_revision: Union[str, None] = "9d2f6b8e4c3a"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # jsonb supports containment queries (`web @> ...`) that a GIN index can serve
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.execute("ALTER TABLE project_states ALTER COLUMN web TYPE jsonb USING web::jsonb")
+    op.create_index("ix_project_states_web", "project_states", ["web"], postgresql_using="gin")
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.drop_index("ix_project_states_web", table_name="project_states")
+    op.execute("ALTER TABLE project_states ALTER COLUMN web TYPE json USING web::json")
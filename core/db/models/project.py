@@ -4,7 +4,8 @@ from typing import TYPE_CHECKING, Optional, Union
 from unicodedata import normalize
 from uuid import UUID, uuid4
 
-from sqlalchemy import and_, delete, inspect, select
+from sqlalchemy import Row, and_, delete, inspect, literal_column, select
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Mapped, mapped_column, relationship, selectinload
 from sqlalchemy.sql import func
@@ -102,6 +103,46 @@ class Project(Base):
         results = await session.execute(query)
         return results.scalars().all()
 
+    @staticmethod
+    async def get_branch_summaries(session: "AsyncSession") -> list[Row]:
+        """
+        Get a summary of every project branch, without loading its states.
+
+        The steps are aggregated by the database. Each row has ``project_id``,
+        ``project_name``, ``branch_id``, ``branch_name``, ``last_updated``
+        (newest state creation time, or None), and ``step_indices`` and
+        ``step_actions`` (lists ordered by step index, empty if the branch has
+        no states). Rows are ordered by project and branch name.
+
+        :param session: The SQLAlchemy session.
+        :return: List of branch summary rows.
+        """
+        from core.db.models import Branch, ProjectState
+
+        def steps(column):
+            # Ordered by step; an empty array (instead of NULL) for branches without states
+            aggregate = func.array_agg(aggregate_order_by(column, ProjectState.step_index))
+            return func.coalesce(aggregate.filter(ProjectState.id.is_not(None)), literal_column("'{}'"))
+
+        query = (
+            select(
+                Project.id.label("project_id"),
+                Project.name.label("project_name"),
+                Branch.id.label("branch_id"),
+                Branch.name.label("branch_name"),
+                func.max(ProjectState.created_at).label("last_updated"),
+                steps(ProjectState.step_index).label("step_indices"),
+                steps(ProjectState.action).label("step_actions"),
+            )
+            .join(Branch, Branch.project_id == Project.id)
+            .outerjoin(ProjectState, ProjectState.branch_id == Branch.id)
+            .group_by(Project.id, Branch.id)
+            .order_by(Project.name, Project.id, Branch.name)
+        )
+
+        results = await session.execute(query)
+        return results.all()
+
     @staticmethod
     def get_folder_from_project_name(name: str):
         """
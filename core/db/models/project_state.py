@@ -3,7 +3,8 @@ from datetime import datetime
 from typing import TYPE_CHECKING, Optional, Union
 from uuid import UUID, uuid4
 
-from sqlalchemy import ForeignKey, UniqueConstraint, delete, inspect
+from sqlalchemy import JSON, ForeignKey, Index, UniqueConstraint, delete, inspect
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.orm.attributes import flag_modified
@@ -51,6 +52,7 @@ class ProjectState(Base):
     __table_args__ = (
         UniqueConstraint("prev_state_id"),
         UniqueConstraint("branch_id", "step_index"),
+        Index("ix_project_states_web", "web", postgresql_using="gin"),
     )
 
     # ID and parent FKs
@@ -70,7 +72,7 @@ class ProjectState(Base):
     relevant_files: Mapped[Optional[list[str]]] = mapped_column(default=None)
     modified_files: Mapped[dict] = mapped_column(default=dict)
     docs: Mapped[Optional[list[dict]]] = mapped_column(default=None)
-    web: Mapped[Optional[list[dict]]] = mapped_column(default=None)
+    web: Mapped[Optional[list[dict]]] = mapped_column(JSONB().with_variant(JSON(), "sqlite"), default=None)
     run_command: Mapped[Optional[str]] = mapped_column()
     action: Mapped[Optional[str]] = mapped_column()
 
@@ -244,7 +246,8 @@ class ProjectState(Base):
             relevant_files=deepcopy(self.relevant_files),
             modified_files=deepcopy(self.modified_files),
             docs=deepcopy(self.docs),
-            web=deepcopy(self.web),
+            # Web results are flat dicts of immutable values, a per-row copy is enough
+            web=[dict(result) for result in self.web] if self.web is not None else None,
             run_command=self.run_command,
         )
 
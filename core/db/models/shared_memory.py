@@ -1,10 +1,14 @@
 from __future__ import annotations
 
-from typing import List
-from uuid import uuid4
+import sys
+from array import array
+from typing import Any, List, Optional, Sequence
 
-from sqlalchemy import JSON, String, Text
+from sqlalchemy import LargeBinary, String, Text, insert, text
+from sqlalchemy.dialects import postgresql as pg
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.types import TypeDecorator
 
 from .base import Base
 
@@ -14,22 +18,82 @@ except Exception:  # pragma: no cover - optional dependency
     PGVector = None  # type: ignore
 
 
-# Always use string UUIDs at ORM level to avoid premature dialect binding issues.
-_ID_TYPE = String(36)
+# String UUIDs at ORM level, stored natively as UUID in PostgreSQL (matching
+# the migrations). IDs are generated by the database via `gen_random_uuid()`.
+_ID_TYPE = String(36).with_variant(pg.UUID(as_uuid=False), "postgresql")
 
 
-def _generate_id() -> str:
-    """Return a random UUID4 string."""
-    return str(uuid4())
+def to_blob(embedding: Sequence[float]) -> bytes:
+    """
+    Pack an embedding into little-endian float32 bytes.
 
+    Float32 buffers (``array("f")``, float32 NumPy arrays) are copied as-is
+    instead of being converted element by element.
+    """
+    if sys.byteorder == "little":
+        try:
+            view = memoryview(embedding)
+        except TypeError:
+            pass
+        else:
+            if view.format == "f" and view.ndim == 1:
+                return view.tobytes()
+    packed = array("f", embedding)
+    if sys.byteorder == "big":  # pragma: no cover - little-endian hosts
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def from_blob(blob: bytes) -> List[float]:
+    """Unpack little-endian float32 bytes produced by :func:`to_blob`."""
+    unpacked = array("f")
+    unpacked.frombytes(blob)
+    if sys.byteorder == "big":  # pragma: no cover - little-endian hosts
+        unpacked.byteswap()
+    return unpacked.tolist()
+
+
+class Float32Blob(TypeDecorator):
+    """
+    Embedding stored as a fixed-length float32 blob.
+
+    Used when pgvector is not available. Compared to a JSON array this is
+    4 bytes per dimension and decodes without parsing text.
+    """
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value: Optional[Sequence[float]], dialect) -> Optional[bytes]:
+        return None if value is None else to_blob(value)
+
+    def process_result_value(self, value: Optional[bytes], dialect) -> Optional[List[float]]:
+        return None if value is None else from_blob(value)
 
-_ID_DEFAULT = _generate_id
 
-# Use pgvector when available.
 if PGVector is not None:
-    _EMBEDDING_TYPE = JSON().with_variant(PGVector(1536), "postgresql")
+
+    class BinaryVector(PGVector):
+        """
+        pgvector column sent in the binary format on asyncpg.
+
+        :class:`~core.db.session.SessionManager` registers pgvector's binary
+        codec on asyncpg connections, so values are passed to the driver
+        as-is instead of being formatted as ``"[0.1,0.2,...]"`` text.
+        """
+
+        cache_ok = True
+
+        def bind_processor(self, dialect):
+            if dialect.driver == "asyncpg":
+                return None
+            return super().bind_processor(dialect)
+
+    # Use pgvector when available. It has to be the base type (not a variant)
+    # for its comparator, which provides ``cosine_distance()``, to be used.
+    _EMBEDDING_TYPE = BinaryVector(1536).with_variant(Float32Blob(), "sqlite")
 else:  # pragma: no cover - pgvector not installed
-    _EMBEDDING_TYPE = JSON()
+    _EMBEDDING_TYPE = Float32Blob()
 
 
 class SharedMemory(Base):
@@ -40,10 +104,27 @@ class SharedMemory(Base):
     id: Mapped[str] = mapped_column(
         _ID_TYPE,
         primary_key=True,
-        default=_ID_DEFAULT,
-        # Rely on SQLAlchemy's Python-side default generation for cross-dialect
-        # compatibility. PostgreSQL uses `gen_random_uuid()` via migrations.
+        server_default=text("gen_random_uuid()"),
     )
-    agent_type: Mapped[str] = mapped_column(String(50), nullable=False)
+    agent_type: Mapped[str] = mapped_column(String(50), nullable=False, index=True)
     content: Mapped[str] = mapped_column(Text, nullable=False)
     embedding: Mapped[List[float]] = mapped_column(_EMBEDDING_TYPE, nullable=False)
+
+    @classmethod
+    async def bulk_insert(cls, session: AsyncSession, rows: List[dict[str, Any]]) -> List[str]:
+        """
+        Insert many shared memory records in a single executemany round-trip.
+
+        Rows without an ``id`` get one generated by the database; the IDs are
+        read back with ``RETURNING`` so the caller can reference the inserted
+        records without reloading them.
+
+        :param session: The database session.
+        :param rows: Dicts with ``agent_type``, ``content`` and ``embedding`` keys.
+        :return: IDs of the inserted records, in input order.
+        """
+        if not rows:
+            return []
+
+        result = await session.execute(insert(cls).returning(cls.id, sort_by_parameter_order=True), rows)
+        return [str(row_id) for row_id in result.scalars()]
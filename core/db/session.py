@@ -1,11 +1,40 @@
+from typing import Any, Optional
+
 from sqlalchemy import event
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 
 from core.config import DBConfig
 from core.log import get_logger
 
 log = get_logger(__name__)
 
+try:  # pragma: no cover - optional dependency
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore
+
+try:  # pragma: no cover - optional dependency
+    from pgvector.asyncpg import register_vector
+except ImportError:  # pragma: no cover - optional dependency
+    register_vector = None  # type: ignore
+
+# Database URLs for which the pgvector extension has already been ensured
+# in this process, so new pooled connections skip the DDL roundtrip.
+_vector_extension_ensured: set[str] = set()
+
+
+async def _create_vector_extension(conn) -> None:
+    await conn.execute("CREATE EXTENSION IF NOT EXISTS vector")
+
+
+async def _has_vector_type(conn) -> bool:
+    return await conn.fetchval("SELECT to_regtype('vector') IS NOT NULL")
+
+
+def _orjson_dumps(value: Any) -> str:
+    # Non-string keys are accepted (and stringified) like the stdlib json module does
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+
 
 class SessionManager:
     """
@@ -18,33 +47,97 @@ class SessionManager:
     ...     # Do something with the session
     """
 
-    def __init__(self, config: DBConfig):
+    def __init__(self, config: DBConfig, *, engine: Optional[AsyncEngine] = None):
         """
         Initialize the session manager with the given configuration.
 
         :param config: Database configuration.
+        :param engine: Engine (and connection pool) of another session manager
+            to use, instead of creating a new one. Each session manager holds
+            one session at a time, so concurrent tasks need their own, but they
+            can share the engine.
         """
         self.config = config
-        self.engine = create_async_engine(
-            self.config.url,
+        if engine is None:
+            engine = self._create_engine(config)
+            event.listen(engine.sync_engine, "connect", self._on_connect)
+        self.engine = engine
+        self.SessionClass = async_sessionmaker(self.engine, expire_on_commit=False, class_=AsyncSession)
+        self.session = None
+
+    @staticmethod
+    def _create_engine(config: DBConfig) -> AsyncEngine:
+        engine_args = {}
+        if config.url.startswith("postgresql+asyncpg"):
+            engine_args["connect_args"] = {
+                "statement_cache_size": config.statement_cache_size,
+                "prepared_statement_cache_size": config.statement_cache_size,
+                # JIT compilation only pays off for long analytical queries
+                "server_settings": {"jit": "off"},
+            }
+        if orjson is not None:
+            engine_args["json_serializer"] = _orjson_dumps
+            engine_args["json_deserializer"] = orjson.loads
+        return create_async_engine(
+            config.url,
             echo=config.debug_sql,
             echo_pool="debug" if config.debug_sql else None,
             pool_pre_ping=True,
+            pool_size=config.pool_size,
+            max_overflow=config.max_overflow,
+            pool_recycle=1800,
+            **engine_args,
         )
-        self.SessionClass = async_sessionmaker(self.engine, expire_on_commit=False, class_=AsyncSession)
-        self.session = None
-
-        event.listen(self.engine.sync_engine, "connect", self._on_connect)
 
     def _on_connect(self, dbapi_connection, _):
         """Connection event handler"""
         log.debug(f"Connected to database {self.config.url}")
 
-        if self.config.url.startswith("postgresql"):
+        if self.config.url.startswith("postgresql") and self.config.url not in _vector_extension_ensured:
+            # The adapted asyncpg connection has no execute(); run the DDL on
+            # the driver connection it wraps.
             try:
-                dbapi_connection.execute("CREATE EXTENSION IF NOT EXISTS vector")
+                dbapi_connection.run_async(_create_vector_extension)
             except Exception:
-                log.debug("pgvector extension already installed or cannot be installed")
+                log.debug("pgvector extension cannot be installed", exc_info=True)
+            else:
+                _vector_extension_ensured.add(self.config.url)
+
+        if register_vector is not None and self.config.url.startswith("postgresql+asyncpg"):
+            # Send and receive embeddings as binary float4 instead of text; the
+            # SharedMemory model's vector type leaves encoding to this codec.
+            try:
+                dbapi_connection.run_async(register_vector)
+            except Exception as err:
+                self._handle_vector_codec_error(dbapi_connection, err)
+
+    @staticmethod
+    def _handle_vector_codec_error(dbapi_connection, err: Exception) -> None:
+        """
+        Deal with a connection on which the pgvector codec couldn't be registered.
+
+        Embeddings are bound without text encoding on asyncpg (see
+        :class:`~core.db.models.shared_memory.BinaryVector`), so if the vector
+        type exists, this connection can't be used for them: close it and
+        re-raise, so the pool doesn't keep it and the next checkout retries.
+        Without the vector type, vector columns can't be used on any
+        connection, so the connection is kept for everything else.
+        """
+        try:
+            has_vector_type = dbapi_connection.run_async(_has_vector_type)
+        except Exception:
+            has_vector_type = True
+
+        if not has_vector_type:
+            log.warning("pgvector extension not available, vector columns will not work")
+            return
+
+        log.warning("Could not register the pgvector codec, discarding the database connection", exc_info=err)
+        try:
+            dbapi_connection.close()
+        except Exception:
+            log.debug("Error closing database connection", exc_info=True)
+        raise err
 
     async def start(self) -> AsyncSession:
         if self.session is not None:
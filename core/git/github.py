@@ -2,15 +2,69 @@
 
 from __future__ import annotations
 
+import asyncio
+import configparser
 import os
-import re
 import subprocess
-from typing import Optional, Tuple
-
+import time
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Iterable, Optional, Tuple
+from urllib.parse import urlsplit
+
+import httpx
 import requests
-
-
-def clone_repository(repo_url: str, destination: str, branch: Optional[str] = None) -> None:
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Shared session so repeated GitHub API calls reuse pooled TCP/TLS connections.
+# Retry keeps urllib3's default idempotent methods, so a POST that may have
+# reached GitHub is never resent; failed connection attempts are retried.
+_session = requests.Session()
+_session.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=10,
+        max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504]),
+    ),
+)
+_session.headers.update(
+    {
+        "Accept": "application/vnd.github+json",
+        "X-GitHub-Api-Version": "2022-11-28",
+    }
+)
+
+_GITHUB_HOSTS = {"github.com"}
+
+# Async API clients per event loop (see _get_async_client) and rate limit
+# state. When at most RATE_LIMIT_MIN_REMAINING requests are left, async calls
+# wait until the epoch time in _rate_limit_resume_at.
+_async_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = weakref.WeakKeyDictionary()
+RATE_LIMIT_MIN_REMAINING = 10
+_rate_limit_resume_at = 0.0
+
+# Conditional GET cache: (url, token) -> (etag, decoded body). GitHub doesn't
+# count 304 Not Modified responses against the rate limit.
+ETAG_CACHE_SIZE = 256
+_etag_cache: "OrderedDict[Tuple[str, str], Tuple[str, Any]]" = OrderedDict()
+
+# Seconds to wait between retries of a rate limited GET request.
+RATE_LIMIT_BACKOFF = (1, 2, 4, 8, 16, 32)
+
+
+def clone_repository(
+    repo_url: str,
+    destination: str,
+    branch: Optional[str] = None,
+    depth: Optional[int] = None,
+    filter_spec: Optional[str] = None,
+    recurse_submodules: bool = False,
+    jobs: Optional[int] = None,
+) -> None:
     """Clone ``repo_url`` into ``destination``.
 
     Parameters
@@ -23,20 +77,64 @@ def clone_repository(repo_url: str, destination: str, branch: Optional[str] = No
         Branch to checkout after cloning. The ``-b`` flag is inserted before
         the repository URL and destination to satisfy the ``git clone``
         command's argument ordering requirements.
+    depth: Optional[int]
+        Create a shallow clone with history truncated to ``depth`` commits.
+    filter_spec: Optional[str]
+        Partial clone filter, e.g. ``"blob:none"`` to fetch file contents
+        lazily on checkout.
+    recurse_submodules: bool
+        Also clone submodules.
+    jobs: Optional[int]
+        Number of submodules fetched in parallel. Only used with
+        ``recurse_submodules``; defaults to the CPU count, capped at 8.
     """
 
     cmd = ["git", "clone"]
     if branch:
         cmd.extend(["-b", branch])
+    if depth is not None:
+        cmd.append(f"--depth={depth}")
+    if filter_spec:
+        cmd.append(f"--filter={filter_spec}")
+    if recurse_submodules:
+        cmd.append("--recurse-submodules")
+        cmd.append(f"--jobs={jobs or min(8, os.cpu_count() or 4)}")
     cmd.extend([repo_url, destination])
     subprocess.run(cmd, check=True, shell=False)
 
 
-def commit_all(repo_path: str, message: str) -> None:
-    """Stage all changes in ``repo_path`` and create a commit."""
+def commit_all(repo_path: str, message: str, include_untracked: bool = True) -> None:
+    """Stage all changes in ``repo_path`` and create a commit.
+
+    With ``include_untracked=False`` tracked changes are staged by
+    ``git commit -a`` itself, saving the separate ``git add`` invocation;
+    new files are then left out of the commit.
+    """
+
+    if include_untracked:
+        subprocess.run(["git", "add", "."], cwd=repo_path, check=True, shell=False)
+        subprocess.run(["git", "commit", "-m", message], cwd=repo_path, check=True, shell=False)
+    else:
+        subprocess.run(["git", "commit", "-a", "-m", message], cwd=repo_path, check=True, shell=False)
+
+
+def commit_all_many(
+    repo_paths: Iterable[str],
+    message: str,
+    include_untracked: bool = True,
+    max_workers: Optional[int] = None,
+) -> None:
+    """Run :func:`commit_all` in each of ``repo_paths`` concurrently.
+
+    The git processes run in a thread pool of ``max_workers`` threads
+    (defaults to the CPU count). The first failure is re-raised once all
+    commits have finished.
+    """
 
-    subprocess.run(["git", "add", "."], cwd=repo_path, check=True, shell=False)
-    subprocess.run(["git", "commit", "-m", message], cwd=repo_path, check=True, shell=False)
+    with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+        futures = [executor.submit(commit_all, path, message, include_untracked) for path in repo_paths]
+    for future in futures:
+        future.result()
 
 
 def push(repo_path: str, branch: str, remote: str = "origin") -> None:
@@ -45,6 +143,22 @@ def push(repo_path: str, branch: str, remote: str = "origin") -> None:
     subprocess.run(["git", "push", remote, branch], cwd=repo_path, check=True, shell=False)
 
 
+def commit_and_push(
+    repo_path: str,
+    message: str,
+    branch: str,
+    remote: str = "origin",
+    include_untracked: bool = True,
+) -> None:
+    """Commit all changes in ``repo_path`` and push ``branch`` to ``remote``.
+
+    See :func:`commit_all` for the meaning of ``include_untracked``.
+    """
+
+    commit_all(repo_path, message, include_untracked=include_untracked)
+    push(repo_path, branch, remote=remote)
+
+
 def set_pre_commit_hook(repo_path: str, script: str) -> None:
     """Create a pre-commit hook with ``script`` inside ``repo_path``."""
 
@@ -61,38 +175,199 @@ def set_pre_commit_hook(repo_path: str, script: str) -> None:
     os.chmod(hook_path, os.stat(hook_path).st_mode | 0o111)
 
 
+def _parse_github_url(url: str) -> Optional[Tuple[str, str]]:
+    """Return (owner, name) from a GitHub remote URL, or ``None``.
+
+    Accepts scp-like SSH (``git@github.com:owner/name``), HTTPS and
+    ``ssh://`` URLs, with or without the ``.git`` suffix.
+    """
+
+    if url.startswith("git@"):
+        host, _, path = url[len("git@") :].partition(":")
+    else:
+        parts = urlsplit(url)
+        if parts.scheme == "https" and not parts.username:
+            host, path = parts.hostname, parts.path
+        elif parts.scheme == "ssh" and parts.username == "git":
+            host, path = parts.hostname, parts.path
+        else:
+            return None
+
+    if host not in _GITHUB_HOSTS:
+        return None
+
+    path = path.strip("/")
+    if path.endswith(".git"):
+        path = path[: -len(".git")]
+    owner, _, name = path.partition("/")
+    if not owner or not name or "/" in name:
+        return None
+    return owner, name
+
+
+@lru_cache(maxsize=32)
+def _read_remote_url(config_path: str, mtime_ns: int) -> Optional[str]:
+    """Return the ``origin`` remote URL from a git config file.
+
+    Falls back to the first remote with a URL if there is no ``origin``.
+    ``mtime_ns`` is only part of the cache key, so edits to the config
+    invalidate the cached value.
+
+    :raises configparser.Error: If the config file can't be parsed.
+    """
+
+    parser = configparser.ConfigParser(strict=False, interpolation=None, allow_no_value=True)
+    parser.read(config_path, encoding="utf-8")
+
+    if parser.has_option('remote "origin"', "url"):
+        return parser.get('remote "origin"', "url").strip()
+    for section in parser.sections():
+        if section.startswith("remote ") and parser.has_option(section, "url"):
+            return parser.get(section, "url").strip()
+    return None
+
+
+def _git_config_path(repo_path: str) -> Optional[str]:
+    """Return the path of the git config file for ``repo_path``, if any.
+
+    In worktrees and submodules ``.git`` is a file with a ``gitdir:`` line
+    pointing to the actual git directory; worktrees additionally share the
+    config of the main repository through the ``commondir`` file.
+    """
+
+    git_dir = os.path.join(repo_path, ".git")
+    if os.path.isfile(git_dir):
+        with open(git_dir, encoding="utf-8") as f:
+            first_line = f.readline().strip()
+        if not first_line.startswith("gitdir:"):
+            return None
+        git_dir = os.path.join(repo_path, first_line[len("gitdir:") :].strip())
+
+        commondir_path = os.path.join(git_dir, "commondir")
+        if os.path.isfile(commondir_path):
+            with open(commondir_path, encoding="utf-8") as f:
+                git_dir = os.path.join(git_dir, f.read().strip())
+
+    config_path = os.path.join(git_dir, "config")
+    return config_path if os.path.isfile(config_path) else None
+
+
 def _get_repo_owner_and_name(repo_path: str) -> Tuple[str, str]:
     """Return (owner, name) for repository at ``repo_path``.
 
     The function reads the ``remote.origin.url`` from the git config and
-    extracts owner and repository name if it points to GitHub.
+    extracts owner and repository name if it points to GitHub. The config
+    file is parsed directly; ``git config`` is only run if it can't be found
+    or parsed.
     """
 
-    config_path = os.path.join(repo_path, ".git", "config")
-    if not os.path.isfile(config_path):
-        raise ValueError("Could not find git config.")
+    remote_url = None
+    config_path = _git_config_path(repo_path)
+    if config_path is not None:
+        try:
+            remote_url = _read_remote_url(config_path, os.stat(config_path).st_mtime_ns)
+        except configparser.Error:
+            config_path = None
+    if config_path is None:
+        try:
+            result = subprocess.run(
+                ["git", "config", "--get", "remote.origin.url"],
+                cwd=repo_path,
+                capture_output=True,
+                text=True,
+                shell=False,
+            )
+        except OSError as err:
+            # Missing repository directory or no git binary
+            raise ValueError("Could not find git config.") from err
+        remote_url = result.stdout.strip() if result.returncode == 0 else None
+
+    if not remote_url:
+        raise ValueError("Could not find remote URL in git config.")
 
-    with open(config_path, "r", encoding="utf-8") as f:
-        content = f.read()
+    owner_and_name = _parse_github_url(remote_url)
+    if owner_and_name:
+        return owner_and_name
 
-    match = re.search(r"url\s*=\s*(.+)", content)
-    if not match:
-        raise ValueError("Could not find remote URL in git config.")
+    raise ValueError(f"Unsupported or non-GitHub remote URL format: {remote_url}")
 
-    remote_url = match.group(1).strip()
 
-    patterns = [
-        r"git@github\.com:(?P<owner>[^/]+)/(?P<name>[^/.]+)(\.git)?$",
-        r"https://github\.com/(?P<owner>[^/]+)/(?P<name>[^/.]+)(\.git)?$",
-        r"ssh://git@github\.com/(?P<owner>[^/]+)/(?P<name>[^/.]+)(\.git)?$",
-    ]
+def _pull_request_args(
+    repo_path: str,
+    branch: str,
+    title: str,
+    body: str,
+    token: str,
+    base: str,
+) -> Tuple[str, dict, dict]:
+    """Return the (url, payload, headers) of a create pull request API call."""
+
+    owner, name = _get_repo_owner_and_name(repo_path)
+    url = f"https://api.github.com/repos/{owner}/{name}/pulls"
+    headers = {"Authorization": f"Bearer {token}"} if token else {}
+    payload = {"title": title, "body": body, "head": branch, "base": base}
+    return url, payload, headers
 
-    for pattern in patterns:
-        match = re.match(pattern, remote_url)
-        if match:
-            return match.group("owner"), match.group("name")
 
-    raise ValueError(f"Unsupported or non-GitHub remote URL format: {remote_url}")
+def _is_rate_limited(response: requests.Response) -> bool:
+    if response.status_code == 429:
+        return True
+    return response.status_code == 403 and response.headers.get("X-RateLimit-Remaining") == "0"
+
+
+def _get_json(url: str, token: str, params: Optional[dict] = None) -> Any:
+    """GET a GitHub API resource, revalidating cached responses with their ETag.
+
+    Rate limited requests are retried with the delays in ``RATE_LIMIT_BACKOFF``.
+    """
+
+    if params:
+        url = requests.Request("GET", url, params=params).prepare().url
+    key = (url, token or "")
+    headers = {"Authorization": f"Bearer {token}"} if token else {}
+    cached = _etag_cache.get(key)
+    if cached is not None:
+        headers["If-None-Match"] = cached[0]
+
+    for delay in (*RATE_LIMIT_BACKOFF, None):
+        response = _session.get(url, headers=headers, timeout=10)
+        if delay is None or not _is_rate_limited(response):
+            break
+        time.sleep(delay)
+
+    if response.status_code == 304 and cached is not None:
+        _etag_cache.move_to_end(key)
+        return cached[1]
+
+    response.raise_for_status()
+    data = response.json()
+    etag = response.headers.get("ETag")
+    if etag:
+        _etag_cache[key] = (etag, data)
+        _etag_cache.move_to_end(key)
+        if len(_etag_cache) > ETAG_CACHE_SIZE:
+            _etag_cache.popitem(last=False)
+    return data
+
+
+def list_pull_requests(
+    repo_path: str,
+    token: str,
+    head: Optional[str] = None,
+    state: str = "open",
+) -> list:
+    """List pull requests of the GitHub repository at ``repo_path``.
+
+    ``head`` filters by source branch (``branch`` or ``user:branch``; a bare
+    branch name refers to the repository owner). Unchanged listings are
+    revalidated by ETag, so repeated lookups don't use up the rate limit.
+    """
+
+    owner, name = _get_repo_owner_and_name(repo_path)
+    params = {"state": state}
+    if head:
+        params["head"] = head if ":" in head else f"{owner}:{head}"
+    return _get_json(f"https://api.github.com/repos/{owner}/{name}/pulls", token, params=params)
 
 
 def create_pull_request(
@@ -105,11 +380,82 @@ def create_pull_request(
 ) -> dict:
     """Create a pull request for ``branch`` against ``base``."""
 
-    owner, name = _get_repo_owner_and_name(repo_path)
-    url = f"https://api.github.com/repos/{owner}/{name}/pulls"
-    headers = {"Authorization": f"Bearer {token}"} if token else {}
-    payload = {"title": title, "body": body, "head": branch, "base": base}
-    response = requests.post(url, json=payload, headers=headers, timeout=10)
+    url, payload, headers = _pull_request_args(repo_path, branch, title, body, token, base)
+    response = _session.post(url, json=payload, headers=headers, timeout=10)
+    response.raise_for_status()
+    return response.json()
+
+
+def _get_async_client() -> httpx.AsyncClient:
+    """Return the async GitHub API client of the running event loop, creating it on first use.
+
+    httpx connections are bound to the loop that opened them, so each loop
+    gets its own client.
+    """
+
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            headers=_session.headers.copy(),
+            timeout=10,
+            transport=httpx.AsyncHTTPTransport(
+                retries=3,
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+            ),
+        )
+        _async_clients[loop] = client
+    return client
+
+
+async def aclose_async_client() -> None:
+    """Close the async GitHub API client of the running event loop, if any."""
+
+    client = _async_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+def _record_rate_limit(headers: httpx.Headers) -> None:
+    """Pause further async API calls until the reset time if the budget is nearly used up."""
+
+    global _rate_limit_resume_at
+
+    remaining = headers.get("X-RateLimit-Remaining")
+    reset = headers.get("X-RateLimit-Reset")
+    if remaining is None or reset is None:
+        return
+    try:
+        if int(remaining) <= RATE_LIMIT_MIN_REMAINING:
+            _rate_limit_resume_at = max(_rate_limit_resume_at, float(reset))
+    except ValueError:
+        return
+
+
+async def create_pull_request_async(
+    repo_path: str,
+    branch: str,
+    title: str,
+    body: str,
+    token: str,
+    base: str = "main",
+) -> dict:
+    """Async variant of :func:`create_pull_request`.
+
+    Uses a shared ``httpx.AsyncClient`` so several pull requests can be
+    opened concurrently over pooled connections. When GitHub reports that
+    fewer than ``RATE_LIMIT_MIN_REMAINING`` requests are left, further calls
+    wait until the rate limit resets.
+    """
+
+    url, payload, headers = _pull_request_args(repo_path, branch, title, body, token, base)
+
+    delay = _rate_limit_resume_at - time.time()
+    if delay > 0:
+        await asyncio.sleep(delay)
+
+    response = await _get_async_client().post(url, json=payload, headers=headers)
+    _record_rate_limit(response.headers)
     response.raise_for_status()
     return response.json()
 
@@ -117,8 +463,12 @@ def create_pull_request(
 __all__ = [
     "clone_repository",
     "commit_all",
+    "commit_all_many",
+    "commit_and_push",
     "push",
     "set_pre_commit_hook",
     "_get_repo_owner_and_name",
     "create_pull_request",
+    "create_pull_request_async",
+    "list_pull_requests",
 ]
@@ -1,6 +1,13 @@
 """Client for interacting with a local Ollama server."""
 
+import asyncio
+import hashlib
 import importlib.metadata
+import io
+import os
+import weakref
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Any, Optional
 
 import httpx
@@ -18,15 +25,69 @@ try:  # pragma: no cover - optional dependency
 except Exception:  # pragma: no cover - optional dependency
     tokenizer = None  # type: ignore
 
-try:  # pragma: no cover - best effort version detection
-    _ollama_version = version.parse(importlib.metadata.version("ollama"))
-except Exception:  # pragma: no cover - package metadata missing
-    _ollama_version = version.parse("0")
 
-# ``ollama`` 0.3.0+ accepts ``httpx.Timeout`` objects on the client. Older
-# releases only allow primitive timeout values. We detect the installed version
-# once at import time to pick the correct strategy.
-OLLAMA_SUPPORTS_TIMEOUT_OBJECT = _ollama_version >= version.parse("0.3.0")
+@lru_cache(maxsize=1)
+def ollama_supports_timeout_object() -> bool:
+    """
+    Check whether the installed ``ollama`` accepts ``httpx.Timeout`` objects.
+
+    ``ollama`` 0.3.0+ accepts ``httpx.Timeout`` objects on the client. Older
+    releases only allow primitive timeout values. Looking up the package
+    metadata scans ``sys.path``, so it is done on first use rather than at
+    import time, and only once.
+    """
+    try:  # pragma: no cover - best effort version detection
+        ollama_version = version.parse(importlib.metadata.version("ollama"))
+    except Exception:  # pragma: no cover - package metadata missing
+        ollama_version = version.parse("0")
+    return ollama_version >= version.parse("0.3.0")
+
+
+# Token counts keyed by a digest of the counted text. The conversation history
+# is resent with every request, so most prompt messages were counted before.
+TOKEN_CACHE_SIZE = 4096
+_token_cache: "OrderedDict[bytes, int]" = OrderedDict()
+
+
+def _count_tokens(*texts: str) -> int:
+    """
+    Count the total number of tokens in ``texts``.
+
+    Counts for previously seen texts are reused; the remaining texts are
+    encoded in a single multi-threaded ``encode_ordinary_batch`` call.
+    """
+
+    total = 0
+    # Uncached texts and how many times each occurs in ``texts``
+    missing: dict[bytes, list] = {}
+    for text in texts:
+        key = hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+        count = _token_cache.get(key)
+        if count is not None:
+            _token_cache.move_to_end(key)
+            total += count
+        elif key in missing:
+            missing[key][1] += 1
+        else:
+            missing[key] = [text, 1]
+
+    if not missing:
+        return total
+
+    missing_texts = [text for text, _ in missing.values()]
+    if tokenizer is None:
+        counts = [len(text.split()) for text in missing_texts]
+    else:
+        counts = [
+            len(tokens) for tokens in tokenizer.encode_ordinary_batch(missing_texts, num_threads=os.cpu_count() or 4)
+        ]
+
+    for (key, (_, occurrences)), count in zip(missing.items(), counts):
+        _token_cache[key] = count
+        total += count * occurrences
+    while len(_token_cache) > TOKEN_CACHE_SIZE:
+        _token_cache.popitem(last=False)
+    return total
 
 
 class OllamaClient(BaseLLMClient):
@@ -34,27 +95,57 @@ class OllamaClient(BaseLLMClient):
 
     provider = LLMProvider.OLLAMA
 
+    # Shared clients keyed by event loop and then by (host, connect timeout,
+    # read timeout), so pooled keep-alive connections to the server are reused
+    # across client instances. httpx connections are bound to the loop that
+    # opened them; a loop's clients are dropped together with the loop.
+    _clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[tuple, AsyncClient]] = (
+        weakref.WeakKeyDictionary()
+    )
+
     def _init_client(self) -> None:
-        """Initialize the Ollama AsyncClient.
+        """Prepare the settings of the shared Ollama AsyncClient.
 
         ``ollama`` has changed its timeout semantics across releases. For
         versions prior to 0.3.0 the client only accepts primitive timeout values
         (floats) and an ``httpx.Timeout`` instance would raise ``TypeError``.
         Newer versions support the richer timeout configuration. We detect the
-        installed version at import time and pick the appropriate strategy.
+        installed version on first use and pick the appropriate strategy.
+
+        Clients with the same host and timeouts share one ``AsyncClient`` per
+        event loop (see ``client``). A ``unix:///path/to/ollama.sock`` base URL
+        connects over that UNIX domain socket instead of TCP.
         """
 
-        host = self.config.base_url or "http://localhost:11434"
-        if OLLAMA_SUPPORTS_TIMEOUT_OBJECT:
-            timeout = httpx.Timeout(
-                connect=self.config.connect_timeout,
-                read=self.config.read_timeout,
-            )
-            self.client = AsyncClient(host=host, timeout=timeout)
-            self._use_request_timeout = False
+        base_url = self.config.base_url or "http://localhost:11434"
+        self._use_request_timeout = not ollama_supports_timeout_object()
+        if self._use_request_timeout:
+            self._client_key = (base_url, None, None)
         else:
-            self.client = AsyncClient(host=host)
-            self._use_request_timeout = True
+            self._client_key = (base_url, self.config.connect_timeout, self.config.read_timeout)
+
+    @property
+    def client(self) -> AsyncClient:
+        """The shared Ollama AsyncClient for the running event loop."""
+
+        clients = OllamaClient._clients.setdefault(asyncio.get_running_loop(), {})
+        if self._client_key not in clients:
+            base_url, connect_timeout, read_timeout = self._client_key
+            host = base_url
+            client_kwargs: dict[str, Any] = {}
+            if base_url.startswith("unix://"):
+                # Local server listening on a UNIX domain socket; the host is
+                # only used to build request URLs.
+                host = "http://localhost"
+                client_kwargs["transport"] = httpx.AsyncHTTPTransport(uds=base_url[len("unix://") :])
+            if not self._use_request_timeout:
+                client_kwargs["timeout"] = httpx.Timeout(
+                    max(connect_timeout, read_timeout),
+                    connect=connect_timeout,
+                    read=read_timeout,
+                )
+            clients[self._client_key] = AsyncClient(host=host, **client_kwargs)
+        return clients[self._client_key]
 
     async def _make_request(
         self,
@@ -68,7 +159,11 @@ class OllamaClient(BaseLLMClient):
         if json_mode:
             kwargs["format"] = "json"
 
-        response_chunks: list[str] = []
+        # Stream chunks are typically a single token, so accumulating them in a
+        # buffer avoids keeping one str object (~50 bytes overhead) per token.
+        response_buffer = io.StringIO()
+        # Reported by the server in the final chunk
+        completion_tokens: Optional[int] = None
         try:
             chat_kwargs: dict[str, Any] = {
                 "model": self.config.model,
@@ -86,12 +181,15 @@ class OllamaClient(BaseLLMClient):
                 stream = await self.client.chat(**chat_kwargs)
 
             async for chunk in stream:
+                if chunk.get("done") and chunk.get("eval_count") is not None:
+                    completion_tokens = chunk["eval_count"]
+
                 message = chunk.get("message", {})
                 content = message.get("content")
                 if not content:
                     continue
 
-                response_chunks.append(content)
+                response_buffer.write(content)
                 if self.stream_handler:
                     await self.stream_handler(content)
         except httpx.HTTPError:
@@ -101,15 +199,15 @@ class OllamaClient(BaseLLMClient):
             if self.stream_handler:
                 await self.stream_handler(None)
 
-        full_response = "".join(response_chunks)
-
-        def _count_tokens(text: str) -> int:
-            if tokenizer is None:
-                return len(text.split())
-            return len(tokenizer.encode(text))
+        full_response = response_buffer.getvalue()
+        # Local token counts are only used for usage reporting; set the
+        # provider's "track_tokens" extra option to false to skip them.
+        if not (self.config.extra or {}).get("track_tokens", True):
+            return full_response, 0, completion_tokens or 0
 
-        prompt_tokens = sum(_count_tokens(msg.get("content", "")) for msg in convo.messages)
-        completion_tokens = _count_tokens(full_response)
+        prompt_tokens = _count_tokens(*(msg.get("content", "") for msg in convo.messages))
+        if completion_tokens is None:
+            completion_tokens = _count_tokens(full_response)
 
         return full_response, prompt_tokens, completion_tokens
 
@@ -1,65 +1,172 @@
 from __future__ import annotations
 
 import asyncio
-import contextlib
+import bisect
+from collections import deque
 from dataclasses import dataclass, field
+from typing import Optional, Sequence
 
 
-@dataclass(order=True)
+@dataclass(eq=False)
 class OllamaJob:
-    """Represents a job executed via an Ollama model."""
+    """Represents a job executed via an Ollama model.
+
+    Jobs compare and hash by identity; ordering is kept by the scheduler's
+    per-priority FIFO queues rather than by comparing jobs.
+    """
 
     priority: int
-    prompt: str = field(compare=False, default="")
-    model: str = field(compare=False, default="")
-    cpu_threads: int = field(compare=False, default=1)
-    gpu_mem_mb: int = field(compare=False, default=1)
-    sleep_ms: int = field(compare=False, default=0)
-    _future: asyncio.Future[str] = field(init=False, repr=False, compare=False)
-    _done: asyncio.Event = field(init=False, repr=False, compare=False)
+    prompt: str = ""
+    model: str = ""
+    cpu_threads: int = 1
+    gpu_mem_mb: int = 1
+    sleep_ms: int = 0
+    result: Optional[str] = field(init=False, default=None)
+    exception: Optional[BaseException] = field(init=False, default=None)
+    _done: asyncio.Event = field(init=False, repr=False)
+    _cancelled: asyncio.Event = field(init=False, repr=False)
 
 
 class WeightedSemaphore:
-    """Semaphore that allows acquiring multiple units at once."""
+    """Semaphore that allows acquiring multiple units at once.
+
+    All ``n`` units are taken in one step once enough are available, so a
+    waiter never holds part of its request while blocking others. Like
+    :class:`asyncio.Semaphore`, ``release`` is synchronous.
+    """
 
     def __init__(self, value: int) -> None:
-        self.sem = asyncio.Semaphore(value)
+        self._value = value
+        # Blocked acquire() calls as (units, future), oldest first
+        self._waiters: deque[tuple[int, asyncio.Future[None]]] = deque()
+
+    @property
+    def value(self) -> int:
+        """Number of units currently available."""
+        return self._value
 
     async def acquire(self, n: int) -> None:
-        for _ in range(n):
-            await self.sem.acquire()
+        if self._value >= n:
+            self._value -= n
+            return
+
+        fut = asyncio.get_running_loop().create_future()
+        waiter = (n, fut)
+        self._waiters.append(waiter)
+        try:
+            await fut
+        except asyncio.CancelledError:
+            if fut.done() and not fut.cancelled():
+                # Units were granted just before the cancellation; hand them back
+                self.release(n)
+            else:
+                self._waiters.remove(waiter)
+            raise
 
     def release(self, n: int) -> None:
-        for _ in range(n):
-            self.sem.release()
+        self._value += n
+        for waiter in list(self._waiters):
+            units, fut = waiter
+            # A cancelled waiter removes itself once its task resumes
+            if not fut.done() and self._value >= units:
+                self._waiters.remove(waiter)
+                self._value -= units
+                fut.set_result(None)
 
 
 class OllamaScheduler:
     """Cooperative scheduler for CPU/GPU bound Ollama jobs.
 
-    Jobs are executed in two phases: a CPU preprocessing stage followed by a
-    GPU inference stage.  CPU threads are managed by a standard semaphore while
-    GPU memory is tracked via a weighted semaphore so multiple jobs can share
-    the GPU concurrently as long as sufficient memory is available.
+    Before it runs, a job reserves its CPU threads and GPU memory together in
+    a single step, and holds both until it finishes. Multiple jobs share the
+    GPU concurrently as long as sufficient threads and memory are available,
+    and a job never holds one resource while waiting for the other.
+
+    At most ``max_queue_size`` jobs wait in the queue; further submissions
+    block until there is room. Only the last ``max_completed`` finished jobs
+    are kept in ``completed``.
+
+    If the highest priority job doesn't fit in the free resources, the first
+    job among the next ``BEST_FIT_WINDOW`` queued ones that does fit is run
+    instead, so small jobs aren't blocked behind a large one. Pass
+    ``strict_priority=True`` to always wait for the head of the queue.
+
+    With ``gpu_bin_sizes``, each job's GPU memory request is rounded up to the
+    smallest bin that holds it (requests larger than every bin are reserved
+    as-is). Uniform reservation sizes leave fewer odd-sized gaps as jobs come
+    and go, at the cost of some over-reservation, which
+    :attr:`fragmentation_ratio` reports.
+
+    Jobs are run by ``num_workers`` long-lived worker tasks (by default one
+    per CPU thread), which also caps how many jobs run at once. Raise it if
+    jobs that need no CPU threads should run with more concurrency.
     """
 
-    def __init__(self, total_cpu_threads: int, total_gpu_mem: int) -> None:
+    BEST_FIT_WINDOW = 8
+
+    def __init__(
+        self,
+        total_cpu_threads: int,
+        total_gpu_mem: int,
+        max_queue_size: int = 10_000,
+        max_completed: int = 1024,
+        strict_priority: bool = False,
+        gpu_bin_sizes: Optional[Sequence[int]] = None,
+        num_workers: Optional[int] = None,
+    ) -> None:
+        if gpu_bin_sizes is not None and any(size <= 0 for size in gpu_bin_sizes):
+            raise ValueError("gpu_bin_sizes must be positive")
+        if num_workers is not None and num_workers < 1:
+            raise ValueError("num_workers must be at least 1")
         self.total_cpu_threads = total_cpu_threads
         self.total_gpu_mem = total_gpu_mem
-        self._cpu_sem = asyncio.Semaphore(total_cpu_threads)
-        self._gpu_ws = WeightedSemaphore(total_gpu_mem)
-        self._queue: asyncio.PriorityQueue[OllamaJob] = asyncio.PriorityQueue()
-        self.completed: list[OllamaJob] = []
+        self._cpu_free = total_cpu_threads
+        self._gpu_free = total_gpu_mem
+        self.max_queue_size = max_queue_size
+        self.strict_priority = strict_priority
+        self.gpu_bin_sizes = sorted(gpu_bin_sizes) if gpu_bin_sizes else None
+        # GPU memory requested by the running jobs, before rounding up to bins
+        self._gpu_requested = 0
+        # Pending jobs in a FIFO bucket per priority, plus the sorted list of
+        # priorities that have pending jobs. There are only a few distinct
+        # priorities, so this avoids heap operations on every push and pop.
+        self._buckets: dict[int, deque[OllamaJob]] = {}
+        self._priorities: list[int] = []
+        self._pending_count = 0
+        # Replaced with a fresh event whenever a job is queued or dequeued or
+        # resources are released, waking everyone waiting on the previous one.
+        # Wake-ups are coalesced: changes made within one event loop iteration
+        # wake the waiters once.
+        self._wakeup = asyncio.Event()
+        self._wake_pending = False
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.num_workers = num_workers or max(1, total_cpu_threads)
+        self._workers: list[asyncio.Task] = []
+        self.completed: deque[OllamaJob] = deque(maxlen=max_completed)
+        self.completed_count = 0
         self._gpu_active = 0
         self.max_gpu_concurrency = 0
 
     @property
     def cpu_free(self) -> int:
-        return self._cpu_sem._value
+        return self._cpu_free
 
     @property
     def gpu_mem_free(self) -> int:
-        return self._gpu_ws.sem._value
+        return self._gpu_free
+
+    @property
+    def fragmentation_ratio(self) -> float:
+        """Share of the reserved GPU memory that running jobs didn't request."""
+        reserved = self.total_gpu_mem - self._gpu_free
+        if reserved <= 0:
+            return 0.0
+        return 1 - self._gpu_requested / reserved
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of jobs waiting to be run."""
+        return self._pending_count
 
     async def submit(self, job: OllamaJob) -> str:
         """Submit a job and wait for its completion."""
@@ -70,52 +177,193 @@ class OllamaScheduler:
             raise ValueError("prompt must be a non-empty string")
         if job.cpu_threads > self.total_cpu_threads or job.gpu_mem_mb > self.total_gpu_mem:
             raise ValueError("Requested resources exceed scheduler limits")
+        if getattr(job, "_done", None) is not None and not job._done.is_set():
+            raise ValueError("Job is already queued or running")
 
-        loop = asyncio.get_running_loop()
-        job._future = loop.create_future()
+        job.result = None
+        job.exception = None
         job._done = asyncio.Event()
-        await self._queue.put(job)
-        # start worker to process queue
-        asyncio.create_task(self._worker())
+        job._cancelled = asyncio.Event()
+        if not self._workers:
+            # Long-lived workers, started on first use
+            self._loop = asyncio.get_running_loop()
+            self._workers = [asyncio.create_task(self._worker()) for _ in range(self.num_workers)]
+
         try:
-            return await job._future
+            while self._pending_count >= self.max_queue_size:
+                await self._wakeup.wait()
         except asyncio.CancelledError:
-            job._future.cancel()
+            job._done.set()
+            raise
+
+        self._push(job)
+        try:
+            await job._done.wait()
+        except asyncio.CancelledError:
+            job._cancelled.set()
+            if self._remove(job):
+                job._done.set()
             await job._done.wait()
             raise
+        if job.exception is not None:
+            raise job.exception
+        return job.result
 
-    async def _worker(self) -> None:
-        while not self._queue.empty():
-            job: OllamaJob = await self._queue.get()
+    async def aclose(self) -> None:
+        """
+        Stop the worker tasks.
 
-            # CPU phase
-            await self._cpu_sem.acquire()
-            try:
-                await asyncio.sleep(0)  # Simulate CPU bound work
-            finally:
-                self._cpu_sem.release()
+        Running jobs are interrupted and jobs still queued are not run; their
+        submitters get a :class:`RuntimeError`.
+        """
 
-            if job._future.cancelled():
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+        for bucket in self._buckets.values():
+            for job in bucket:
+                job.exception = RuntimeError("OllamaScheduler was closed before the job ran")
                 job._done.set()
-                continue
+        self._buckets.clear()
+        self._priorities.clear()
+        self._pending_count = 0
+        if self._loop is not None:
+            self._wake()
 
-            # GPU phase
-            await self._gpu_ws.acquire(job.gpu_mem_mb)
-            self._gpu_active += 1
-            self.max_gpu_concurrency = max(self.max_gpu_concurrency, self._gpu_active)
-            sleep_task = asyncio.create_task(asyncio.sleep(job.sleep_ms / 1000))
+    def _wake(self) -> None:
+        if self._wake_pending:
+            return
+        self._wake_pending = True
+        self._loop.call_soon(self._flush_wake)
+
+    def _flush_wake(self) -> None:
+        self._wake_pending = False
+        wakeup, self._wakeup = self._wakeup, asyncio.Event()
+        wakeup.set()
+
+    async def _worker(self) -> None:
+        while True:
+            job = self._next_job()
+            if job is None:
+                await self._wakeup.wait()
+                continue
             try:
-                await asyncio.wait({sleep_task, job._future}, return_when=asyncio.FIRST_COMPLETED)
-                if not job._future.cancelled():
-                    self.completed.append(job)
-                    job._future.set_result(job.prompt)
+                await self._run(job)
+            except asyncio.CancelledError:
+                # Closing the scheduler; the submitter must not see a result
+                job.exception = RuntimeError("OllamaScheduler was closed while the job was running")
+                raise
+            except Exception as err:
+                job.exception = err
             finally:
-                sleep_task.cancel()
-                with contextlib.suppress(asyncio.CancelledError):
-                    await sleep_task
-                self._gpu_active -= 1
-                self._gpu_ws.release(job.gpu_mem_mb)
+                self._release(job)
                 job._done.set()
 
+    def _push(self, job: OllamaJob) -> None:
+        bucket = self._buckets.get(job.priority)
+        if bucket is None:
+            bucket = self._buckets[job.priority] = deque()
+            bisect.insort(self._priorities, job.priority)
+        bucket.append(job)
+        self._pending_count += 1
+        self._wake()
+
+    def _pop(self, priority: int, index: int = 0) -> OllamaJob:
+        bucket = self._buckets[priority]
+        job = bucket[index]
+        del bucket[index]
+        if not bucket:
+            del self._buckets[priority]
+            self._priorities.remove(priority)
+        self._pending_count -= 1
+        self._wake()
+        return job
+
+    def _remove(self, job: OllamaJob) -> bool:
+        """Remove a pending job from its bucket; return whether it was pending."""
+
+        bucket = self._buckets.get(job.priority, ())
+        for i, pending in enumerate(bucket):
+            if pending is job:
+                del bucket[i]
+                if not bucket:
+                    del self._buckets[job.priority]
+                    self._priorities.remove(job.priority)
+                self._pending_count -= 1
+                self._wake()
+                return True
+        return False
+
+    def _next_job(self) -> Optional[OllamaJob]:
+        """Dequeue the next job whose resources can be reserved, if any.
+
+        A job is only popped once the reservation succeeded, so the head of
+        the queue keeps its place while it waits.
+        """
+
+        window = 1 if self.strict_priority else self.BEST_FIT_WINDOW
+        for priority in self._priorities:
+            for index, job in enumerate(self._buckets[priority]):
+                if self._try_reserve(job):
+                    return self._pop(priority, index)
+                window -= 1
+                if window == 0:
+                    return None
+        return None
+
+    def _gpu_reservation(self, job: OllamaJob) -> int:
+        """GPU memory reserved for ``job``: its request rounded up to a bin."""
+
+        if not self.gpu_bin_sizes or not job.gpu_mem_mb:
+            return job.gpu_mem_mb
+        index = bisect.bisect_left(self.gpu_bin_sizes, job.gpu_mem_mb)
+        if index == len(self.gpu_bin_sizes):
+            return job.gpu_mem_mb
+        return min(self.gpu_bin_sizes[index], self.total_gpu_mem)
+
+    def _try_reserve(self, job: OllamaJob) -> bool:
+        """Reserve the job's CPU threads and GPU memory if both are available.
+
+        There is no await between the check and the update, so no lock is
+        needed to make the reservation atomic.
+        """
+
+        gpu_mem = self._gpu_reservation(job)
+        if self._cpu_free < job.cpu_threads or self._gpu_free < gpu_mem:
+            return False
+        self._cpu_free -= job.cpu_threads
+        self._gpu_free -= gpu_mem
+        self._gpu_requested += job.gpu_mem_mb
+        return True
+
+    def _release(self, job: OllamaJob) -> None:
+        self._cpu_free += job.cpu_threads
+        self._gpu_free += self._gpu_reservation(job)
+        self._gpu_requested -= job.gpu_mem_mb
+        self._wake()
+
+    async def _run(self, job: OllamaJob) -> None:
+        """Run a job whose resources have been reserved by :meth:`_next_job`.
+
+        The worker releases the resources once this returns or raises.
+        """
+
+        self._gpu_active += 1
+        self.max_gpu_concurrency = max(self.max_gpu_concurrency, self._gpu_active)
+        try:
+            # Wait out the job, returning early if the submitter cancels it
+            try:
+                await asyncio.wait_for(job._cancelled.wait(), timeout=job.sleep_ms / 1000)
+            except asyncio.TimeoutError:
+                pass
+            if not job._cancelled.is_set():
+                self.completed.append(job)
+                self.completed_count += 1
+                job.result = job.prompt
+        finally:
+            self._gpu_active -= 1
+
 
 __all__ = ["OllamaJob", "OllamaScheduler", "WeightedSemaphore"]
@@ -1,6 +1,7 @@
 import json
 import re
 from enum import Enum
+from functools import lru_cache
 from typing import List, Optional, Union
 
 from pydantic import BaseModel, ValidationError, create_model
@@ -131,6 +132,21 @@ class OptionalCodeBlockParser:
         return text
 
 
+@lru_cache(maxsize=None)
+def _extended_model(spec: type[BaseModel]) -> type[BaseModel]:
+    """
+    Build (once per spec) a model with the spec fields plus the original response.
+
+    Building a pydantic model compiles its validator, which is much slower than
+    validating the data, so the result is reused across parser calls.
+    """
+    return create_model(
+        f"Extended{spec.__name__}",
+        original_response=(str, ...),
+        **{field_name: (field.annotation, field.default) for field_name, field in spec.model_fields.items()},
+    )
+
+
 class JSONParser:
     def __init__(self, spec: Optional[BaseModel] = None, strict: bool = True):
         self.spec = spec
@@ -181,12 +197,8 @@ class JSONParser:
         except Exception as err:
             raise ValueError(f"Error parsing JSON: {err}") from err
 
-        # Create a new model that includes the original model fields and the original text
-        ExtendedModel = create_model(
-            f"Extended{self.spec.__name__}",
-            original_response=(str, ...),
-            **{field_name: (field.annotation, field.default) for field_name, field in self.spec.model_fields.items()},
-        )
+        # Model that includes the original model fields and the original text
+        ExtendedModel = _extended_model(self.spec)
 
         # Instantiate the extended model
         extended_model = ExtendedModel(original_response=self.original_response, **model.model_dump())
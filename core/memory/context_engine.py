@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import heapq
 from dataclasses import dataclass
 from math import exp
-from typing import List
+from operator import itemgetter
+from typing import List, Tuple
 
 from core.memory.shared_memory import SharedMemory
 
@@ -19,6 +21,9 @@ class ContextItem:
 class ContextEngine:
     """Advanced context retrieval using pgvector similarity and heuristics."""
 
+    # Score multiplier for records from the requested agent type
+    AGENT_BOOST = 1.1
+
     def __init__(self, memory: SharedMemory, decay: float = 0.01):
         self.memory = memory
         self.decay = decay
@@ -35,20 +40,35 @@ class ContextEngine:
         The score combines cosine similarity from pgvector with an exponential
         decay factor that prefers more recent entries. Results matching the
         requested agent type receive a small boost.
+
+        With pgvector the scoring runs in the database and only the top
+        ``limit`` rows are fetched.
         """
 
-        records = await self.memory.search_with_scores(query_embedding, limit * 4)
-        items: List[ContextItem] = []
-        for idx, (rec, dist) in enumerate(records):
-            similarity = 1.0 - dist
-            recency = exp(-self.decay * idx)
-            score = similarity * recency
+        if self.memory.supports_ranked_search:
+            rows = await self.memory.search_ranked(
+                query_embedding,
+                limit=limit,
+                candidates=limit * 4,
+                decay=self.decay,
+                agent_type=agent_type,
+                agent_boost=self.AGENT_BOOST,
+            )
+            return [ContextItem(content, rec_agent_type, score) for content, rec_agent_type, score in rows]
+
+        # exp(-decay * idx) as a running product: one exp() call per gather
+        step = exp(-self.decay)
+        recency = 1.0
+        scored: List[Tuple[float, str, str]] = []
+        async for rec, dist in self.memory.search_iter(query_embedding, limit * 4):
+            score = (1.0 - dist) * recency
             if agent_type and rec.agent_type == agent_type:
-                score *= 1.1
-            items.append(ContextItem(rec.content, rec.agent_type, score))
+                score *= self.AGENT_BOOST
+            scored.append((score, rec.content, rec.agent_type))
+            recency *= step
 
-        items.sort(key=lambda i: i.score, reverse=True)
-        return items[:limit]
+        top = heapq.nlargest(limit, scored, key=itemgetter(0))
+        return [ContextItem(content, rec_agent_type, score) for score, content, rec_agent_type in top]
 
 
 __all__ = ["ContextEngine", "ContextItem"]
@@ -1,13 +1,79 @@
 from __future__ import annotations
 
-from typing import List, Tuple
+from typing import AsyncIterator, Iterable, List, Optional, Sequence, Tuple
 
 import sqlalchemy as sa
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer
 
 from core.db.models.shared_memory import SharedMemory as SharedMemoryModel
 from core.db.session import SessionManager
 
+# Bounds for the HNSW candidate list size: pgvector's default, and the
+# largest value pgvector accepts for hnsw.ef_search
+HNSW_EF_SEARCH_MIN = 40
+HNSW_EF_SEARCH_MAX = 1000
+
+
+async def _set_ef_search(session: AsyncSession, candidates: int):
+    """
+    Size the HNSW candidate list for the current transaction.
+
+    The index can only return ``hnsw.ef_search`` rows, so it has to be at
+    least as large as the number of rows requested. It is capped at
+    :data:`HNSW_EF_SEARCH_MAX`, so larger requests may return fewer rows
+    from the index.
+    """
+    ef = min(HNSW_EF_SEARCH_MAX, max(HNSW_EF_SEARCH_MIN, candidates))
+    await session.execute(_SET_EF_SEARCH_STMT, {"ef": str(ef)})
+
+
+# Statements are built once and only their parameters are bound per query.
+_SET_EF_SEARCH_STMT = select(sa.func.set_config("hnsw.ef_search", bindparam("ef", type_=sa.Text), True))
+
+_FALLBACK_SEARCH_STMT = (
+    select(SharedMemoryModel, sa.literal(1.0).label("dist"))
+    .options(defer(SharedMemoryModel.embedding))
+    .order_by(SharedMemoryModel.id.desc())
+    .limit(bindparam("limit"))
+)
+
+if hasattr(SharedMemoryModel.embedding, "cosine_distance"):
+    _query = bindparam("query", type_=SharedMemoryModel.embedding.type)
+    _dist = SharedMemoryModel.embedding.cosine_distance(_query).label("dist")
+
+    _SEARCH_STMT = (
+        select(SharedMemoryModel, _dist)
+        .options(defer(SharedMemoryModel.embedding))
+        .order_by(_dist)
+        .limit(bindparam("limit"))
+    )
+
+    _nearest = (
+        select(SharedMemoryModel.content, SharedMemoryModel.agent_type, _dist)
+        .order_by(_dist)
+        .limit(bindparam("candidates"))
+        .subquery("nearest")
+    )
+    _rank = sa.func.row_number().over(order_by=_nearest.c.dist) - 1
+    # When agent_type is NULL the comparison is NULL and no row is boosted
+    _score = (
+        (1.0 - _nearest.c.dist)
+        * sa.func.exp(-bindparam("decay", type_=sa.Float) * _rank)
+        * sa.case(
+            (_nearest.c.agent_type == bindparam("agent_type", type_=sa.String), bindparam("boost", type_=sa.Float)),
+            else_=sa.literal(1.0, sa.Float),
+        )
+    ).label("score")
+    _RANKED_SEARCH_STMT = (
+        select(_nearest.c.content, _nearest.c.agent_type, _score)
+        .order_by(sa.desc("score"), _nearest.c.dist)
+        .limit(bindparam("limit"))
+    )
+else:  # pragma: no cover - pgvector not installed
+    _SEARCH_STMT = _RANKED_SEARCH_STMT = None
+
 
 class SharedMemory:
     """Vector-based shared memory accessible to all agents."""
@@ -15,13 +81,31 @@ class SharedMemory:
     def __init__(self, session_manager: SessionManager, embedding_dim: int = 1536):
         self.session_manager = session_manager
         self.embedding_dim = embedding_dim
+        self._use_pgvector: Optional[bool] = None
 
     @property
     def enabled(self) -> bool:
         # Search requires pgvector; storage works with JSON fallback
         return True
 
+    @property
+    def supports_ranked_search(self) -> bool:
+        """Whether :meth:`search_ranked` is available (requires pgvector)."""
+        return self._pgvector_available()
+
+    def _pgvector_available(self) -> bool:
+        if self._use_pgvector is None:
+            try:
+                dialect = self.session_manager.engine.dialect.name
+            except Exception:
+                dialect = ""
+            self._use_pgvector = _SEARCH_STMT is not None and dialect == "postgresql"
+        return self._use_pgvector
+
     def _validate_embedding(self, embedding: List[float]):
+        # Embeddings may also be 1-D NumPy arrays or array("f") buffers
+        if getattr(embedding, "ndim", 1) != 1:
+            raise ValueError(f"Embedding must be one-dimensional, got {embedding.ndim} dimensions")
         if len(embedding) != self.embedding_dim:
             raise ValueError(f"Embedding length must be {self.embedding_dim}, got {len(embedding)}")
 
@@ -33,31 +117,99 @@ class SharedMemory:
             await session.commit()
             return record
 
-    async def search_with_scores(self, embedding: List[float], limit: int = 5) -> List[Tuple[SharedMemoryModel, float]]:
-        """Return records with their cosine distances for advanced scoring."""
+    async def add_many(self, agent_type: str, items: Iterable[Tuple[str, List[float]]]) -> List[str]:
+        """Store many ``(content, embedding)`` pairs with a single bulk insert."""
+
+        rows = []
+        for content, embedding in items:
+            self._validate_embedding(embedding)
+            rows.append({"agent_type": agent_type, "content": content, "embedding": embedding})
+        if not rows:
+            return []
+        async with self.session_manager as session:
+            ids = await SharedMemoryModel.bulk_insert(session, rows)
+            await session.commit()
+            return ids
+
+    async def _execute_search(self, session: AsyncSession, embedding: List[float], limit: int):
+        if self._pgvector_available():
+            await _set_ef_search(session, limit)
+            return await session.execute(_SEARCH_STMT, {"query": embedding, "limit": limit})
+        return await session.execute(_FALLBACK_SEARCH_STMT, {"limit": limit})
+
+    async def search_with_scores(
+        self, embedding: List[float], limit: int = 5
+    ) -> Sequence[Tuple[SharedMemoryModel, float]]:
+        """
+        Return records with their cosine distances for advanced scoring.
+
+        The embedding column of the returned records is not loaded.
+        """
 
         self._validate_embedding(embedding)
         async with self.session_manager as session:
-            try:
-                dialect = self.session_manager.engine.dialect.name
-            except Exception:
-                dialect = ""
-            embedding_col = SharedMemoryModel.embedding
-            if hasattr(embedding_col, "cosine_distance") and dialect == "postgresql":
-                stmt = (
-                    select(SharedMemoryModel, embedding_col.cosine_distance(embedding).label("dist"))
-                    .order_by("dist")
-                    .limit(limit)
-                )
-            else:
-                stmt = (
-                    select(SharedMemoryModel, sa.literal(1.0).label("dist"))
-                    .order_by(SharedMemoryModel.id.desc())
-                    .limit(limit)
-                )
-            result = await session.execute(stmt)
+            result = await self._execute_search(session, embedding, limit)
             return [(row[0], float(row[1])) for row in result]
 
-    async def search(self, embedding: List[float], limit: int = 5) -> List[SharedMemoryModel]:
-        results = await self.search_with_scores(embedding, limit)
-        return [record for record, _ in results]
+    async def search_iter(
+        self, embedding: List[float], limit: int = 5
+    ) -> AsyncIterator[Tuple[SharedMemoryModel, float]]:
+        """
+        Yield ``(record, distance)`` pairs like :meth:`search_with_scores`.
+
+        Lets callers score rows in a single pass without building an
+        intermediate list. The rows are fetched in one round trip; the
+        result sets are small, so a server-side cursor would only add more.
+        """
+
+        self._validate_embedding(embedding)
+        async with self.session_manager as session:
+            result = await self._execute_search(session, embedding, limit)
+            for row in result:
+                yield row[0], float(row[1])
+
+    async def search_ranked(
+        self,
+        embedding: List[float],
+        *,
+        limit: int = 5,
+        candidates: Optional[int] = None,
+        decay: float = 0.01,
+        agent_type: Optional[str] = None,
+        agent_boost: float = 1.1,
+    ) -> Sequence[Tuple[str, str, float]]:
+        """
+        Return the best ``(content, agent_type, score)`` matches, scored in the database.
+
+        The ``candidates`` nearest records (default ``4 * limit``) are fetched by
+        cosine distance, which can use the vector index. Each is scored as
+        ``(1 - distance) * exp(-decay * rank)``, where rank is its position by
+        distance, and multiplied by ``agent_boost`` if its agent type matches
+        ``agent_type``. Only the top ``limit`` rows are returned.
+
+        Requires pgvector, see :attr:`supports_ranked_search`.
+        """
+
+        self._validate_embedding(embedding)
+        if not self._pgvector_available():
+            raise RuntimeError("Ranked search requires pgvector")
+
+        candidates = candidates or limit * 4
+        params = {
+            "query": embedding,
+            "candidates": candidates,
+            "limit": limit,
+            "decay": decay,
+            "agent_type": agent_type or None,
+            "boost": agent_boost,
+        }
+        async with self.session_manager as session:
+            await _set_ef_search(session, candidates)
+            result = await session.execute(_RANKED_SEARCH_STMT, params)
+            return [(row[0], row[1], float(row[2])) for row in result]
+
+    async def search(self, embedding: List[float], limit: int = 5) -> Sequence[SharedMemoryModel]:
+        self._validate_embedding(embedding)
+        async with self.session_manager as session:
+            result = await self._execute_search(session, embedding, limit)
+            return result.scalars().all()
@@ -1,6 +1,6 @@
 """Messaging utilities for agent communication."""
 
 from .chat import Chat
-from .message_broker import MessageBroker
+from .message_broker import BroadcastSubscription, Channel, MessageBroker
 
-__all__ = ["MessageBroker", "Chat"]
+__all__ = ["MessageBroker", "BroadcastSubscription", "Channel", "Chat"]
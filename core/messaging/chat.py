@@ -1,9 +1,8 @@
 from __future__ import annotations
 
-import asyncio
 from typing import Any, Optional
 
-from .message_broker import MessageBroker
+from .message_broker import Channel, MessageBroker
 
 
 class Chat:
@@ -12,13 +11,13 @@ class Chat:
     The class provides a tiny abstraction over a broker topic so that agents
     and the orchestrator can exchange chat style messages without depending on
     a concrete transport.  Messages are published to a single topic and every
-    instance maintains its own subscription queue.
+    instance maintains its own subscription channel.
     """
 
     def __init__(self, broker: MessageBroker, topic: str = "chat") -> None:
         self._broker = broker
         self._topic = topic
-        self._queue: asyncio.Queue[Any] = broker.subscribe(topic)
+        self._channel: Channel = broker.subscribe_channel(topic)
 
     async def publish(self, message: Any) -> None:
         """Publish ``message`` to the chat topic."""
@@ -26,8 +25,8 @@ class Chat:
 
     async def receive(self) -> Any:
         """Wait for and return the next chat message."""
-        return await self._broker.get(self._queue)
+        return await self._channel.get()
 
     async def get_nowait(self) -> Optional[Any]:
         """Return the next message if available, otherwise ``None``."""
-        return await self.receive() if self._broker.queue_length(self._queue) else None
+        return self._channel.get_nowait() if self._channel.qsize() else None
@@ -1,13 +1,142 @@
 from __future__ import annotations
 
 import asyncio
-from collections import defaultdict
-from typing import Any, DefaultDict
+from collections import deque
+from typing import Any, Callable, Literal, Optional, Sequence, Union
 
 from core.log import get_logger
 
+# ``asyncio.timeout()`` (3.11+) awaits the put directly; ``wait_for`` wraps it
+# in a separate task first.
+_HAS_ASYNCIO_TIMEOUT = hasattr(asyncio, "timeout")
+
 PUBLISH_PUT_TIMEOUT = 0.5  # seconds
 
+# What publish() does when a subscriber's queue is full
+OverflowPolicy = Literal["block", "drop_oldest", "drop_new", "coalesce"]
+_OVERFLOW_POLICIES = ("block", "drop_oldest", "drop_new", "coalesce")
+
+# Combines the newest queued message with a new one, for the "coalesce" policy
+MergeFunction = Callable[[Any, Any], Any]
+
+
+class Channel:
+    """Bounded subscriber queue backed by a deque and an event.
+
+    Meant for a single consumer such as :class:`~core.messaging.Chat`. It
+    implements the subset of the ``asyncio.Queue`` interface the broker uses,
+    but plain puts and gets only touch the deque: no locks, waiter futures or
+    condition notifications. Several concurrent consumers still work, each
+    message is received once, but all of them wake up on every message.
+    """
+
+    __slots__ = ("_maxsize", "_items", "_not_empty", "_not_full")
+
+    def __init__(self, maxsize: int = 0) -> None:
+        self._maxsize = maxsize
+        self._items: deque[Any] = deque()
+        self._not_empty = asyncio.Event()
+        self._not_full = asyncio.Event()
+        self._not_full.set()
+
+    def qsize(self) -> int:
+        return len(self._items)
+
+    def empty(self) -> bool:
+        return not self._items
+
+    def full(self) -> bool:
+        return 0 < self._maxsize <= len(self._items)
+
+    def put_nowait(self, item: Any) -> None:
+        if self.full():
+            raise asyncio.QueueFull
+        self._items.append(item)
+        self._not_empty.set()
+
+    async def put(self, item: Any) -> None:
+        while self.full():
+            self._not_full.clear()
+            await self._not_full.wait()
+        self.put_nowait(item)
+
+    def get_nowait(self) -> Any:
+        if not self._items:
+            raise asyncio.QueueEmpty
+        item = self._items.popleft()
+        self._not_full.set()
+        return item
+
+    async def get(self) -> Any:
+        while not self._items:
+            self._not_empty.clear()
+            await self._not_empty.wait()
+        return self.get_nowait()
+
+
+class _BroadcastLog:
+    """The last ``maxsize`` messages of a broadcast topic, shared by its subscribers."""
+
+    def __init__(self, maxsize: int) -> None:
+        self.items: deque[Any] = deque(maxlen=maxsize)
+        # Number of messages ever appended; subscriber cursors count in these
+        self.end = 0
+        self.subscribers: set[BroadcastSubscription] = set()
+        # Replaced on every append, waking everyone waiting on the previous one
+        self._appended = asyncio.Event()
+
+    def append(self, message: Any) -> None:
+        self.items.append(message)
+        self.end += 1
+        appended, self._appended = self._appended, asyncio.Event()
+        appended.set()
+
+    async def wait(self) -> None:
+        await self._appended.wait()
+
+
+class BroadcastSubscription:
+    """Read cursor into a broadcast topic, see :meth:`MessageBroker.subscribe_broadcast`.
+
+    Supports the same ``get``/``get_nowait``/``qsize``/``empty`` calls as a
+    subscriber queue. Publishing never waits for it: a subscriber that falls
+    more than ``maxsize`` messages behind skips the ones it missed.
+    """
+
+    __slots__ = ("_log", "_cursor")
+
+    def __init__(self, log: _BroadcastLog) -> None:
+        self._log = log
+        self._cursor = log.end
+
+    def qsize(self) -> int:
+        return min(self._log.end - self._cursor, len(self._log.items))
+
+    def empty(self) -> bool:
+        return self._cursor == self._log.end
+
+    def get_nowait(self) -> Any:
+        log = self._log
+        start = log.end - len(log.items)
+        if self._cursor < start:
+            self._cursor = start
+        if self._cursor == log.end:
+            raise asyncio.QueueEmpty
+        item = log.items[self._cursor - start]
+        self._cursor += 1
+        return item
+
+    async def get(self) -> Any:
+        while self.empty():
+            await self._log.wait()
+        return self.get_nowait()
+
+
+Subscription = Union[asyncio.Queue[Any], Channel]
+
+# Overflow handling of a single subscriber, if it differs from the broker's
+_Overflow = tuple[OverflowPolicy, Optional[MergeFunction]]
+
 
 class MessageBroker:
     """A simple asynchronous message broker.
@@ -17,41 +146,232 @@ class MessageBroker:
     subscriber gets every published message. Queues have a configurable
     ``maxsize`` to avoid unbounded growth when subscribers are slow or
     unavailable. Subscribers can be removed with :meth:`unsubscribe`.
+    Single consumers can use a cheaper :class:`Channel` instead of a queue,
+    see :meth:`subscribe_channel`. Topics with many subscribers can be read
+    through :meth:`subscribe_broadcast`, where all of them share one message
+    log and a publish costs the same regardless of their number.
+
+    When a queue is full, ``policy`` decides what happens: ``"block"`` waits
+    up to ``publish_put_timeout`` seconds for room and then drops the message,
+    ``"drop_oldest"`` discards the oldest queued message to make room, and
+    ``"drop_new"`` drops the new message right away. Subscribers can
+    override it when subscribing, and can also ask for ``"coalesce"``: the
+    newest queued message is replaced by ``merge(queued, message)``, for
+    example to keep only the latest progress update.
     """
 
-    def __init__(self, maxsize: int = 1000, publish_put_timeout: float = PUBLISH_PUT_TIMEOUT) -> None:
+    __slots__ = ("_maxsize", "_publish_put_timeout", "_policy", "_queues", "_broadcasts", "_logger")
+
+    def __init__(
+        self,
+        maxsize: int = 1000,
+        publish_put_timeout: float = PUBLISH_PUT_TIMEOUT,
+        policy: OverflowPolicy = "block",
+    ) -> None:
+        if policy == "coalesce":
+            raise ValueError("The coalesce policy needs a merge function, pass it to subscribe()")
+        if policy not in _OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy: {policy}")
         self._maxsize = maxsize
         self._publish_put_timeout = publish_put_timeout
-        self._queues: DefaultDict[str, list[asyncio.Queue[Any]]] = defaultdict(list)
+        self._policy = policy
+        # Subscribers per topic, in subscription order, mapped to their own
+        # overflow handling (None to use the broker's). Queues hash by
+        # identity, so unsubscribing doesn't scan a list. publish() never
+        # awaits while iterating, so they don't need copying.
+        self._queues: dict[str, dict[Subscription, Optional[_Overflow]]] = {}
+        self._broadcasts: dict[str, _BroadcastLog] = {}
         self._logger = get_logger(__name__)
 
     async def publish(self, topic: str, message: Any) -> None:
-        """Publish ``message`` to all subscribers of ``topic``."""
-        for queue in self._queues[topic]:
-            try:
-                await asyncio.wait_for(queue.put(message), timeout=self._publish_put_timeout)
-            except asyncio.TimeoutError:
+        """
+        Publish ``message`` to all subscribers of ``topic``.
+
+        Queues with room get the message immediately. With the ``"block"``
+        policy, full queues are waited on concurrently, so one slow consumer
+        does not delay delivery to the others.
+        """
+        log = self._broadcasts.get(topic)
+        if log is not None:
+            log.append(message)
+
+        queues = self._queues.get(topic)
+        if not queues:
+            return
+
+        full = [queue for queue, overflow in queues.items() if not self._offer(topic, queue, overflow, message)]
+        if full:
+            await asyncio.gather(*(self._put_with_timeout(topic, queue, message) for queue in full))
+
+    async def publish_many(self, topic: str, messages: Sequence[Any]) -> None:
+        """
+        Publish ``messages``, in order, to all subscribers of ``topic``.
+
+        Equivalent to calling :meth:`publish` for each message, but every
+        subscriber takes the whole batch in one pass, and subscribers that
+        fall behind are waited on concurrently. With the ``"block"`` policy,
+        the remainder of the batch is dropped for a subscriber once a put to
+        it times out.
+        """
+        log = self._broadcasts.get(topic)
+        if log is not None:
+            for message in messages:
+                log.append(message)
+
+        queues = self._queues.get(topic)
+        if not queues or not messages:
+            return
+
+        behind: list[tuple[Subscription, int]] = []
+        for queue, overflow in queues.items():
+            for index, message in enumerate(messages):
+                if not self._offer(topic, queue, overflow, message):
+                    behind.append((queue, index))
+                    break
+
+        if behind:
+            await asyncio.gather(*(self._drain(topic, queue, messages[index:]) for queue, index in behind))
+
+    def _offer(self, topic: str, queue: Subscription, overflow: Optional[_Overflow], message: Any) -> bool:
+        """
+        Put ``message`` into ``queue`` without waiting.
+
+        Returns False if the queue is full and the ``"block"`` policy means
+        the caller has to wait for room.
+        """
+        try:
+            queue.put_nowait(message)
+        except asyncio.QueueFull:
+            policy, merge = overflow or (self._policy, None)
+            if policy == "drop_oldest":
+                queue.get_nowait()
+                queue.put_nowait(message)
+            elif policy == "coalesce":
+                # A full queue is never empty. asyncio.Queue has no public
+                # way to reach its newest item, so use its deque directly.
+                items = queue._items if isinstance(queue, Channel) else queue._queue
+                items[-1] = merge(items[-1], message)
+            elif policy == "drop_new":
                 self._logger.warning("dropping message on topic %s: slow consumer", topic)
+            else:
+                return False
+        return True
 
-    def subscribe(self, topic: str) -> asyncio.Queue[Any]:
-        """Create and return a new bounded queue for ``topic`` messages."""
+    async def _put_with_timeout(self, topic: str, queue: Subscription, message: Any) -> bool:
+        try:
+            if _HAS_ASYNCIO_TIMEOUT:
+                async with asyncio.timeout(self._publish_put_timeout):
+                    await queue.put(message)
+            else:  # pragma: no cover - Python < 3.11
+                await asyncio.wait_for(queue.put(message), timeout=self._publish_put_timeout)
+            return True
+        except asyncio.TimeoutError:
+            self._logger.warning("dropping message on topic %s: slow consumer", topic)
+            return False
+
+    async def _drain(self, topic: str, queue: Subscription, messages: Sequence[Any]) -> None:
+        for index, message in enumerate(messages):
+            try:
+                queue.put_nowait(message)
+            except asyncio.QueueFull:
+                if not await self._put_with_timeout(topic, queue, message):
+                    if index + 1 < len(messages):
+                        self._logger.warning(
+                            "dropping %d more messages on topic %s: slow consumer", len(messages) - index - 1, topic
+                        )
+                    return
+
+    def subscribe(
+        self,
+        topic: str,
+        policy: Optional[OverflowPolicy] = None,
+        merge: Optional[MergeFunction] = None,
+    ) -> asyncio.Queue[Any]:
+        """
+        Create and return a new bounded queue for ``topic`` messages.
+
+        :param policy: Overflow policy for this subscriber (default: the broker's).
+        :param merge: Function merging the newest queued message with a new
+            one, required by the ``"coalesce"`` policy.
+        """
         queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=self._maxsize)
-        self._queues[topic].append(queue)
+        self._queues.setdefault(topic, {})[queue] = self._overflow(policy, merge)
         return queue
 
-    def unsubscribe(self, topic: str, queue: asyncio.Queue[Any]) -> None:
+    def subscribe_channel(
+        self,
+        topic: str,
+        policy: Optional[OverflowPolicy] = None,
+        merge: Optional[MergeFunction] = None,
+    ) -> Channel:
+        """
+        Create and return a new bounded :class:`Channel` for ``topic`` messages.
+
+        ``policy`` and ``merge`` work as in :meth:`subscribe`.
+        """
+        channel = Channel(maxsize=self._maxsize)
+        self._queues.setdefault(topic, {})[channel] = self._overflow(policy, merge)
+        return channel
+
+    @staticmethod
+    def _overflow(policy: Optional[OverflowPolicy], merge: Optional[MergeFunction]) -> Optional[_Overflow]:
+        if policy is None:
+            if merge is not None:
+                raise ValueError("merge is only used with the coalesce policy")
+            return None
+        if policy not in _OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy: {policy}")
+        if (policy == "coalesce") != (merge is not None):
+            raise ValueError("merge is required by, and only used with, the coalesce policy")
+        return policy, merge
+
+    def subscribe_broadcast(self, topic: str) -> BroadcastSubscription:
+        """
+        Subscribe to ``topic`` through its shared broadcast log.
+
+        The subscription receives messages published from now on. The log
+        keeps the last ``maxsize`` messages; overflow policies don't apply.
+        """
+        if self._maxsize <= 0:
+            raise ValueError("Broadcast topics need a broker with a positive maxsize")
+        log = self._broadcasts.get(topic)
+        if log is None:
+            log = self._broadcasts[topic] = _BroadcastLog(self._maxsize)
+        subscription = BroadcastSubscription(log)
+        log.subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, topic: str, queue: Union[Subscription, BroadcastSubscription]) -> None:
         """Remove ``queue`` from ``topic``'s subscribers."""
-        try:
-            self._queues[topic].remove(queue)
-            if not self._queues[topic]:
-                del self._queues[topic]
-        except (KeyError, ValueError):
-            pass
-
-    async def get(self, queue: asyncio.Queue[Any]) -> Any:
-        """Get the next message from the subscriber's ``queue``."""
+        if isinstance(queue, BroadcastSubscription):
+            log = self._broadcasts.get(topic)
+            if log is not None and queue in log.subscribers:
+                log.subscribers.discard(queue)
+                if not log.subscribers:
+                    del self._broadcasts[topic]
+            return
+
+        queues = self._queues.get(topic)
+        if queues is None or queue not in queues:
+            return
+        del queues[queue]
+        if not queues:
+            del self._queues[topic]
+
+    @staticmethod
+    async def get(queue: Union[Subscription, BroadcastSubscription]) -> Any:
+        """
+        Get the next message from the subscriber's ``queue``.
+
+        Deprecated: use ``await queue.get()`` directly.
+        """
         return await queue.get()
 
-    def queue_length(self, queue: asyncio.Queue[Any]) -> int:
-        """Return the current length of ``queue``."""
+    @staticmethod
+    def queue_length(queue: Union[Subscription, BroadcastSubscription]) -> int:
+        """
+        Return the current length of ``queue``.
+
+        Deprecated: use ``queue.qsize()`` directly.
+        """
         return queue.qsize()
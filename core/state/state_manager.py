@@ -6,7 +6,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Optional
 from uuid import UUID, uuid4
 
-from sqlalchemy import inspect, select
+from sqlalchemy import Row, inspect, select
 from tenacity import retry, stop_after_attempt, wait_fixed
 
 from core.config import FileSystemType, get_config
@@ -82,6 +82,15 @@ class StateManager:
         async with self.session_manager as session:
             return await Project.get_all_projects(session)
 
+    async def list_projects_summary(self) -> list[Row]:
+        """
+        List branches of all projects with their steps, aggregated in the database.
+
+        :return: Branch summary rows, see :meth:`Project.get_branch_summaries`.
+        """
+        async with self.session_manager as session:
+            return await Project.get_branch_summaries(session)
+
     async def create_project(self, name: str, folder_name: Optional[str] = None) -> Project:
         """
         Create a new project and set it as the current one.
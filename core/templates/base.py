@@ -1,6 +1,8 @@
+import os
+import shutil
 from json import loads
 from os.path import dirname, join
-from typing import TYPE_CHECKING, Any, Optional, Type
+from typing import TYPE_CHECKING, Any, Mapping, Optional, Type
 from uuid import uuid4
 
 from pydantic import BaseModel, ConfigDict
@@ -14,6 +16,12 @@ if TYPE_CHECKING:
 
 log = get_logger(__name__)
 
+PIP_INSTALL_COMMAND = "python -m pip install --disable-pip-version-check --no-input -r requirements.txt"
+UV_PIP_INSTALL_COMMAND = "uv pip install -r requirements.txt"
+
+# File description shared by templates with a generic README
+README_DESCRIPTION = "Project overview and setup instructions."
+
 
 class NoOptions(BaseModel):
     """
@@ -33,7 +41,8 @@ class BaseProjectTemplate:
     description: str
     options_class: Type[BaseModel]
     options_description: str
-    file_descriptions: dict
+    # Read-only (MappingProxyType); shared by all instances of a template
+    file_descriptions: Mapping[str, str]
 
     def __init__(
         self,
@@ -136,6 +145,20 @@ class BaseProjectTemplate:
         """
         raise NotImplementedError()
 
+    async def _pip_install(self):
+        """
+        Install the project's requirements.txt.
+
+        Uses uv, which resolves dependencies much faster than pip, when it is
+        available and a virtualenv is active (uv refuses to install into the
+        system Python otherwise).
+        """
+        if shutil.which("uv") and os.environ.get("VIRTUAL_ENV"):
+            cmd = UV_PIP_INSTALL_COMMAND
+        else:
+            cmd = PIP_INSTALL_COMMAND
+        await self.process_manager.run_command(cmd)
+
     def options_dict(self) -> dict[str, Any]:
         """Template options as a Python dictionary."""
         return loads(self.options.model_dump_json())
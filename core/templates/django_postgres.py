@@ -1,4 +1,6 @@
-from .base import BaseProjectTemplate, NoOptions
+from types import MappingProxyType
+
+from .base import README_DESCRIPTION, BaseProjectTemplate, NoOptions
 
 
 class DjangoPostgresProjectTemplate(BaseProjectTemplate):
@@ -6,13 +8,15 @@ class DjangoPostgresProjectTemplate(BaseProjectTemplate):
     name = "django_postgres"
     path = "django_postgres"
     description = "Django project configured for PostgreSQL"
-    file_descriptions = {
-        "manage.py": "Django management script.",
-        "project/settings.py": "Minimal settings configured for PostgreSQL.",
-        "app/models.py": "Simple model example.",
-        "requirements.txt": "Dependencies for Django and PostgreSQL driver.",
-        "README.md": "Project overview and setup instructions.",
-    }
+    file_descriptions = MappingProxyType(
+        {
+            "manage.py": "Django management script.",
+            "project/settings.py": "Minimal settings configured for PostgreSQL.",
+            "app/models.py": "Simple model example.",
+            "requirements.txt": "Dependencies for Django and PostgreSQL driver.",
+            "README.md": README_DESCRIPTION,
+        }
+    )
     summary = "\n".join(
         [
             "* Django project configured for PostgreSQL",
@@ -25,4 +29,4 @@ class DjangoPostgresProjectTemplate(BaseProjectTemplate):
     options_description = ""
 
     async def install_hook(self):
-        await self.process_manager.run_command("pip install -r requirements.txt")
+        await self._pip_install()
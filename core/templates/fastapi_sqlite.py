@@ -1,4 +1,6 @@
-from .base import BaseProjectTemplate, NoOptions
+from types import MappingProxyType
+
+from .base import README_DESCRIPTION, BaseProjectTemplate, NoOptions
 
 
 class FastapiSqliteProjectTemplate(BaseProjectTemplate):
@@ -6,12 +8,14 @@ class FastapiSqliteProjectTemplate(BaseProjectTemplate):
     name = "fastapi_sqlite"
     path = "fastapi_sqlite"
     description = "FastAPI app using SQLModel ORM with SQLite database"
-    file_descriptions = {
-        "main.py": "FastAPI application with startup hook and sample endpoint.",
-        "models.py": "SQLModel models used by the application.",
-        "requirements.txt": "Python dependencies for FastAPI and SQLModel.",
-        "README.md": "Project overview and setup instructions.",
-    }
+    file_descriptions = MappingProxyType(
+        {
+            "main.py": "FastAPI application with lifespan hook and sample endpoint.",
+            "models.py": "SQLModel models used by the application.",
+            "requirements.txt": "Python dependencies for FastAPI and SQLModel.",
+            "README.md": README_DESCRIPTION,
+        }
+    )
     summary = "\n".join(
         [
             "* FastAPI web app configured for SQLite using SQLModel",
@@ -24,4 +28,4 @@ class FastapiSqliteProjectTemplate(BaseProjectTemplate):
     options_description = ""
 
     async def install_hook(self):
-        await self.process_manager.run_command("pip install -r requirements.txt")
+        await self._pip_install()
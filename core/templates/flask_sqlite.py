@@ -1,4 +1,6 @@
-from .base import BaseProjectTemplate, NoOptions
+from types import MappingProxyType
+
+from .base import README_DESCRIPTION, BaseProjectTemplate, NoOptions
 
 
 class FlaskSqliteProjectTemplate(BaseProjectTemplate):
@@ -6,14 +8,16 @@ class FlaskSqliteProjectTemplate(BaseProjectTemplate):
     name = "flask_sqlite"
     path = "flask_sqlite"
     description = "Flask app using SQLAlchemy ORM with SQLite database"
-    file_descriptions = {
-        "app.py": "Entry point for the Flask application configuring SQLAlchemy and registering routes.",
-        "models.py": "Defines a basic User model using SQLAlchemy.",
-        "requirements.txt": "Python dependencies for Flask and SQLAlchemy.",
-        "templates/base.html": "Base Jinja2 template providing the page layout.",
-        "templates/index.html": "Simple index page extending the base template.",
-        "README.md": "Project overview and setup instructions.",
-    }
+    file_descriptions = MappingProxyType(
+        {
+            "app.py": "Flask application factory configuring SQLAlchemy, creating tables and registering routes.",
+            "models.py": "Defines a basic User model using SQLAlchemy.",
+            "requirements.txt": "Python dependencies for Flask and SQLAlchemy.",
+            "templates/base.html": "Base Jinja2 template providing the page layout.",
+            "templates/index.html": "Simple index page extending the base template.",
+            "README.md": README_DESCRIPTION,
+        }
+    )
     summary = "\n".join(
         [
             "* Flask web app configured for SQLite using SQLAlchemy",
@@ -26,4 +30,4 @@ class FlaskSqliteProjectTemplate(BaseProjectTemplate):
     options_description = ""
 
     async def install_hook(self):
-        await self.process_manager.run_command("pip install -r requirements.txt")
+        await self._pip_install()
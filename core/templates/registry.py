@@ -1,14 +1,12 @@
+from collections.abc import Iterator, Mapping
 from enum import Enum
+from importlib import import_module
+from typing import TYPE_CHECKING, Type
 
 from core.log import get_logger
 
-from .django_postgres import DjangoPostgresProjectTemplate
-from .fastapi_sqlite import FastapiSqliteProjectTemplate
-from .flask_sqlite import FlaskSqliteProjectTemplate
-from .node_express_mongoose import NodeExpressMongooseProjectTemplate
-from .react_express import ReactExpressProjectTemplate
-from .typer_cli import TyperCliProjectTemplate
-from .vite_react import ViteReactProjectTemplate
+if TYPE_CHECKING:
+    from .base import BaseProjectTemplate
 
 log = get_logger(__name__)
 
@@ -16,21 +14,55 @@ log = get_logger(__name__)
 class ProjectTemplateEnum(str, Enum):
     """Choices of available project templates."""
 
-    NODE_EXPRESS_MONGOOSE = NodeExpressMongooseProjectTemplate.name
-    REACT_EXPRESS = ReactExpressProjectTemplate.name
-    VITE_REACT = ViteReactProjectTemplate.name
-    FLASK_SQLITE = FlaskSqliteProjectTemplate.name
-    FASTAPI_SQLITE = FastapiSqliteProjectTemplate.name
-    DJANGO_POSTGRES = DjangoPostgresProjectTemplate.name
-    TYPER_CLI = TyperCliProjectTemplate.name
-
-
-PROJECT_TEMPLATES = {
-    NodeExpressMongooseProjectTemplate.name: NodeExpressMongooseProjectTemplate,
-    ReactExpressProjectTemplate.name: ReactExpressProjectTemplate,
-    ViteReactProjectTemplate.name: ViteReactProjectTemplate,
-    FlaskSqliteProjectTemplate.name: FlaskSqliteProjectTemplate,
-    FastapiSqliteProjectTemplate.name: FastapiSqliteProjectTemplate,
-    DjangoPostgresProjectTemplate.name: DjangoPostgresProjectTemplate,
-    TyperCliProjectTemplate.name: TyperCliProjectTemplate,
+    NODE_EXPRESS_MONGOOSE = "node_express_mongoose"
+    REACT_EXPRESS = "react_express"
+    VITE_REACT = "vite_react"
+    FLASK_SQLITE = "flask_sqlite"
+    FASTAPI_SQLITE = "fastapi_sqlite"
+    DJANGO_POSTGRES = "django_postgres"
+    TYPER_CLI = "typer_cli"
+
+
+# Template name -> (module, class name). Each template's ``name`` attribute
+# must match its key here.
+_TEMPLATE_CLASSES = {
+    ProjectTemplateEnum.NODE_EXPRESS_MONGOOSE.value: (".node_express_mongoose", "NodeExpressMongooseProjectTemplate"),
+    ProjectTemplateEnum.REACT_EXPRESS.value: (".react_express", "ReactExpressProjectTemplate"),
+    ProjectTemplateEnum.VITE_REACT.value: (".vite_react", "ViteReactProjectTemplate"),
+    ProjectTemplateEnum.FLASK_SQLITE.value: (".flask_sqlite", "FlaskSqliteProjectTemplate"),
+    ProjectTemplateEnum.FASTAPI_SQLITE.value: (".fastapi_sqlite", "FastapiSqliteProjectTemplate"),
+    ProjectTemplateEnum.DJANGO_POSTGRES.value: (".django_postgres", "DjangoPostgresProjectTemplate"),
+    ProjectTemplateEnum.TYPER_CLI.value: (".typer_cli", "TyperCliProjectTemplate"),
 }
+
+
+class _LazyTemplateRegistry(Mapping):
+    """
+    Read-only mapping of template names to template classes.
+
+    Template modules are imported the first time their class is looked up,
+    so importing the registry doesn't load every template.
+    """
+
+    def __init__(self, classes: dict[str, tuple[str, str]]):
+        self._classes = classes
+        self._loaded: dict[str, Type["BaseProjectTemplate"]] = {}
+
+    def __getitem__(self, name: str) -> Type["BaseProjectTemplate"]:
+        cls = self._loaded.get(name)
+        if cls is None:
+            module_name, class_name = self._classes[name]
+            cls = self._loaded[name] = getattr(import_module(module_name, __package__), class_name)
+        return cls
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._classes)
+
+    def __len__(self) -> int:
+        return len(self._classes)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._classes
+
+
+PROJECT_TEMPLATES = _LazyTemplateRegistry(_TEMPLATE_CLASSES)
@@ -1,17 +1,37 @@
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from models import User
-from sqlmodel import Session, SQLModel, create_engine
+from sqlalchemy import event
+from sqlmodel import Session, SQLModel, create_engine, select
+
+engine = create_engine("sqlite:///app.db", connect_args={"check_same_thread": False})
+
+
+@event.listens_for(engine, "connect")
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    # WAL lets readers and a writer work concurrently
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.close()
+
+
+LIST_USERS = select(User)
+
 
-app = FastAPI()
-engine = create_engine("sqlite:///app.db")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # create_all is blocking, so run it off the event loop
+    await asyncio.to_thread(SQLModel.metadata.create_all, engine)
+    yield
 
 
-@app.on_event("startup")
-def on_startup():
-    SQLModel.metadata.create_all(engine)
+app = FastAPI(lifespan=lifespan)
 
 
 @app.get("/")
 def read_root():
     with Session(engine) as session:
-        return {"users": session.query(User).all()}
+        return {"users": session.exec(LIST_USERS).all()}
@@ -1,19 +1,42 @@
 from flask import Flask, render_template
 from models import db
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
 
-app = Flask(__name__)
-app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite:///app.db"
-app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
 
-db.init_app(app)
+@event.listens_for(Engine, "connect")
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    # WAL lets readers and a writer work concurrently
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.close()
 
 
-@app.route("/")
-def index():
-    return render_template("index.html")
+def create_app():
+    app = Flask(__name__)
+    app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite:///app.db"
+    app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {
+        "connect_args": {"check_same_thread": False},
+    }
 
+    db.init_app(app)
 
-if __name__ == "__main__":
+    # Create tables when the app is imported, so WSGI servers like gunicorn
+    # get them too, not only `python app.py`.
     with app.app_context():
         db.create_all()
+
+    @app.route("/")
+    def index():
+        return render_template("index.html")
+
+    return app
+
+
+app = create_app()
+
+
+if __name__ == "__main__":
     app.run(debug=True)
@@ -1,3 +1,5 @@
+from types import MappingProxyType
+
 from .base import BaseProjectTemplate, NoOptions
 
 
@@ -6,11 +8,13 @@ class TyperCliProjectTemplate(BaseProjectTemplate):
     name = "typer_cli"
     path = "typer_cli"
     description = "CLI application using Typer"
-    file_descriptions = {
-        "main.py": "Entry point defining Typer commands.",
-        "requirements.txt": "Python dependencies for Typer.",
-        "README.md": "Project overview and usage instructions.",
-    }
+    file_descriptions = MappingProxyType(
+        {
+            "main.py": "Entry point defining Typer commands.",
+            "requirements.txt": "Python dependencies for Typer.",
+            "README.md": "Project overview and usage instructions.",
+        }
+    )
     summary = "\n".join(
         [
             "* Command-line interface built with Typer",
@@ -22,4 +26,4 @@ class TyperCliProjectTemplate(BaseProjectTemplate):
     options_description = ""
 
     async def install_hook(self):
-        await self.process_manager.run_command("pip install -r requirements.txt")
+        await self._pip_install()
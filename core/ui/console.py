@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import inspect
-from typing import Optional
+import sys
+from typing import Iterable, Optional
 
 from prompt_toolkit.shortcuts import PromptSession
 
@@ -14,21 +15,48 @@ log = get_logger(__name__)
 class PlainConsoleUI(UIBase):
     """UI adapter for plain (no color) console output."""
 
-    def __init__(self) -> None:
+    def __init__(self, show_progress: bool = True) -> None:
+        """
+        :param show_progress: Print task and step progress updates. These are
+            sent for every step of long runs, so they can be turned off.
+        """
+        self._show_progress = show_progress
         self._app_link: Optional[str] = None
         self._streaming_logs = False
         self._important_stream_open = False
         self._breakdown_stream_open = False
+        # Created on the first question and reused for all later ones
+        self._session: Optional[PromptSession[str]] = None
+        self._supports_placeholder = False
 
     # -- helpers -----------------------------------------------------------------
 
     def _write(self, text: str = "", *, end: str = "\n", flush: bool = False) -> None:
-        print(text, end=end, flush=flush)
+        # sys.stdout is looked up on each call so redirecting it still works
+        out = sys.stdout
+        out.write(text + end)
+        if flush:
+            out.flush()
+
+    def _get_session(self) -> PromptSession[str]:
+        if self._session is None:
+            self._session = PromptSession("> ")
+            # Older prompt_toolkit versions don't support placeholders
+            try:
+                sig = inspect.signature(self._session.prompt_async)
+            except (ValueError, TypeError):
+                sig = None
+            self._supports_placeholder = sig is not None and "placeholder" in sig.parameters
+        return self._session
 
     def _marker(self, tag: str, detail: Optional[str] = None) -> None:
         line = f"({tag})" if detail is None else f"({tag}) {detail}"
         self._write(line)
 
+    def _marker_list(self, tag: str, items: Iterable[object]) -> None:
+        # One write for the marker and all its items
+        self._write("\n".join([f"({tag})", *(f"  - {item}" for item in items)]))
+
     # -- UIBase methods -----------------------------------------------------------
 
     async def start(self) -> bool:
@@ -45,7 +73,10 @@ class PlainConsoleUI(UIBase):
             # end of stream
             self._write(flush=True)
         else:
-            self._write(chunk, end="", flush=True)
+            # No flush per chunk: stdout flushes complete lines on a terminal
+            # (and when its buffer fills otherwise), the end of stream
+            # flushes the rest.
+            sys.stdout.write(chunk)
 
     async def send_message(
         self,
@@ -88,16 +119,14 @@ class PlainConsoleUI(UIBase):
         default: Optional[str],
         source: Optional[UISource],
     ) -> None:
-        if source:
-            self._write(f"[{source}] {question}")
-        else:
-            self._write(question)
+        lines = [f"[{source}] {question}" if source else question]
         if hint:
-            self._write(f"Hint: {hint}")
+            lines.append(f"Hint: {hint}")
         if buttons:
             for k, v in buttons.items():
                 default_str = " (default)" if k == default else ""
-                self._write(f"  [{k}]: {v}{default_str}")
+                lines.append(f"  [{k}]: {v}{default_str}")
+        self._write("\n".join(lines))
 
     async def ask_question(
         self,
@@ -136,14 +165,10 @@ class PlainConsoleUI(UIBase):
         if verbose:
             self._print_question(question, hint, buttons, default, source)
 
-        session: PromptSession[str] = PromptSession("> ")
+        session = self._get_session()
 
         prompt_kwargs: dict[str, object] = {"default": initial_text or ""}
-        try:
-            sig = inspect.signature(session.prompt_async)
-        except (ValueError, TypeError):
-            sig = None
-        if sig and "placeholder" in sig.parameters:
+        if self._supports_placeholder:
             prompt_kwargs["placeholder"] = placeholder
 
         while True:
@@ -191,6 +216,8 @@ class PlainConsoleUI(UIBase):
         source_index: int = 1,
         tasks: JSONList | None = None,
     ) -> None:
+        if not self._show_progress:
+            return
         self._marker(
             "task-progress",
             f"{index}/{n_tasks} {description} [{status}] from {source}",
@@ -203,15 +230,15 @@ class PlainConsoleUI(UIBase):
         step: JSONDict,
         task_source: str,
     ) -> None:
+        if not self._show_progress:
+            return
         self._marker("step-progress", f"{index}/{n_steps} {step} from {task_source}")
 
     async def send_modified_files(
         self,
         modified_files: JSONList,
     ) -> None:
-        self._marker("modified-files")
-        for f in modified_files:
-            self._write(f"  - {f}")
+        self._marker_list("modified-files", modified_files)
 
     async def send_data_about_logs(
         self,
@@ -277,9 +304,7 @@ class PlainConsoleUI(UIBase):
         self._marker("project-description", description)
 
     async def send_features_list(self, features: list[str]):
-        self._marker("features-list")
-        for f in features:
-            self._write(f"  - {f}")
+        self._marker_list("features-list", features)
 
     async def import_project(self, project_dir: str):
         self._marker("import-project", project_dir)
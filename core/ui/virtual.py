@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections import deque
 from typing import Optional
 
 from core.log import get_logger
@@ -14,7 +15,7 @@ class VirtualUI(UIBase):
     """
 
     def __init__(self, inputs: list[dict[str, str]]):
-        self.virtual_inputs = [UserInput(**input) for input in inputs]
+        self.virtual_inputs = deque(UserInput(**input) for input in inputs)
         self._app_link = None
         self._important_stream_open = False
         self._breakdown_stream_open = False
@@ -90,9 +91,7 @@ class VirtualUI(UIBase):
             print(f"{question}")
 
         if self.virtual_inputs:
-            ret = self.virtual_inputs[0]
-            self.virtual_inputs = self.virtual_inputs[1:]
-            return ret
+            return self.virtual_inputs.popleft()
 
         if "continue" in buttons:
             return UserInput(button="continue", text=None)
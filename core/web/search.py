@@ -7,8 +7,9 @@ search API and returns page contents extracted with ``trafilatura``.
 from __future__ import annotations
 
 import asyncio
-import difflib
 import os
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Iterable, List, Optional
 from urllib.parse import urlparse
@@ -34,6 +35,17 @@ DEFAULT_TRUSTED_DOMAINS = {
     "who.int",
 }
 
+# Extracted page contents keyed by URL, stored with the monotonic time they
+# were fetched. Popular pages come up for many different queries.
+CONTENT_CACHE_SIZE = 512
+CONTENT_CACHE_TTL = 60 * 60
+_content_cache: "OrderedDict[str, tuple[float, str]]" = OrderedDict()
+
+# Results are compared as sets of word shingles (runs of this many words)
+SHINGLE_SIZE = 3
+# Shingle sets overlapping at least this much (Jaccard index) count as similar
+SIMILARITY_THRESHOLD = 0.2
+
 
 @dataclass
 class WebResult:
@@ -79,8 +91,8 @@ async def brave_search(
         If ``False`` the ``content`` field of each :class:`WebResult` will be an
         empty string. Defaults to ``True``.
     max_concurrency:
-        Maximum number of concurrent content fetches when ``fetch_content`` is
-        enabled. Defaults to ``5``.
+        Maximum number of concurrent connections, and so of content fetches
+        when ``fetch_content`` is enabled. Defaults to ``5``.
     trusted_domains:
         Iterable of domain names to treat as trusted. If ``None`` the
         :data:`DEFAULT_TRUSTED_DOMAINS` list is used.
@@ -93,48 +105,46 @@ async def brave_search(
     headers = {"Accept": "application/json", "X-Subscription-Token": key}
     params = {"q": query, "count": count}
 
-    resp = None
-    for attempt in range(3):
-        try:
-            async with httpx.AsyncClient(timeout=10) as client:
+    # One client for the search and all page fetches, so connections are
+    # reused and its pool limits how many pages are fetched at once. Waiting
+    # for a free connection doesn't count towards the timeout.
+    limits = httpx.Limits(max_connections=max_concurrency, max_keepalive_connections=max_concurrency)
+    async with httpx.AsyncClient(timeout=httpx.Timeout(10, pool=None), limits=limits) as client:
+        resp = None
+        for attempt in range(3):
+            try:
                 resp = await client.get(BRAVE_SEARCH_API, params=params, headers=headers)
                 resp.raise_for_status()
-            break
-        except (httpx.RequestError, httpx.HTTPStatusError) as exc:
-            if attempt == 2:
-                if isinstance(exc, httpx.HTTPStatusError):
-                    message = f"Brave search failed with status code {exc.response.status_code}: {exc.response.text}"
-                else:
-                    message = f"Brave search request failed: {exc}"
-                raise BraveSearchError(message) from exc
-            await asyncio.sleep(2**attempt)
-
-    data = resp.json()
-    web_results = data.get("web", {}).get("results", [])[:count]
-    results: List[WebResult] = []
+                break
+            except (httpx.RequestError, httpx.HTTPStatusError) as exc:
+                if attempt == 2:
+                    if isinstance(exc, httpx.HTTPStatusError):
+                        message = (
+                            f"Brave search failed with status code {exc.response.status_code}: {exc.response.text}"
+                        )
+                    else:
+                        message = f"Brave search request failed: {exc}"
+                    raise BraveSearchError(message) from exc
+                await asyncio.sleep(2**attempt)
+
+        data = resp.json()
+        web_results = data.get("web", {}).get("results", [])[:count]
+
+        # Keyed by URL: a page Brave lists twice is fetched and returned once
+        items: dict[str, tuple[str, Optional[str]]] = {}
+        for item in web_results:
+            url = item.get("url")
+            if not url or url in items:
+                continue
+            items[url] = (item.get("title", ""), item.get("description") or item.get("snippet"))
 
-    async def fetch_with_sem(url: str, sem: asyncio.Semaphore) -> str:
-        async with sem:
-            return await _fetch_content(url)
-
-    sem = asyncio.Semaphore(max_concurrency)
-    tasks = []
-    items = []
-    for item in web_results:
-        url = item.get("url")
-        if not url:
-            continue
-        title = item.get("title", "")
-        snippet = item.get("description") or item.get("snippet")
-        items.append((url, title, snippet))
         if fetch_content:
-            tasks.append(asyncio.create_task(fetch_with_sem(url, sem)))
+            contents = await asyncio.gather(*(_fetch_content(client, url) for url in items), return_exceptions=True)
         else:
-            tasks.append(asyncio.create_task(asyncio.sleep(0, result="")))
-
-    contents = await asyncio.gather(*tasks, return_exceptions=True)
+            contents = [""] * len(items)
 
-    for (url, title, snippet), content in zip(items, contents):
+    results: List[WebResult] = []
+    for (url, (title, snippet)), content in zip(items.items(), contents):
         if isinstance(content, Exception):
             log.warning("Failed to fetch content for URL: %s", url, exc_info=content)
             content = ""
@@ -144,17 +154,32 @@ async def brave_search(
     return results
 
 
-async def _fetch_content(url: str) -> str:
-    """Fetch and extract textual content from a URL."""
+async def _fetch_content(client: httpx.AsyncClient, url: str) -> str:
+    """Fetch a URL with ``client`` and extract its textual content.
+
+    Only the extraction, which is CPU-bound, runs in a worker thread.
+    Contents are cached for :data:`CONTENT_CACHE_TTL` seconds; failed or
+    empty fetches are not cached.
+    """
+
+    now = time.monotonic()
+    cached = _content_cache.get(url)
+    if cached is not None and now - cached[0] < CONTENT_CACHE_TTL:
+        _content_cache.move_to_end(url)
+        return cached[1]
 
-    def fetch() -> str:
-        downloaded = trafilatura.fetch_url(url)
-        if not downloaded:
-            return ""
-        extracted = trafilatura.extract(downloaded)
-        return extracted or ""
+    resp = await client.get(url, follow_redirects=True)
+    if resp.is_error or not resp.text:
+        return ""
+    extracted = await asyncio.to_thread(trafilatura.extract, resp.text)
+    if not extracted:
+        return ""
 
-    return await asyncio.to_thread(fetch)
+    _content_cache[url] = (now, extracted)
+    _content_cache.move_to_end(url)
+    if len(_content_cache) > CONTENT_CACHE_SIZE:
+        _content_cache.popitem(last=False)
+    return extracted
 
 
 def _evaluate_results(results: List[WebResult], trusted_domains: Iterable[str]) -> None:
@@ -169,23 +194,46 @@ def _evaluate_results(results: List[WebResult], trusted_domains: Iterable[str])
         treated as trusted.
     """
 
-    domain_set = {d.lower() for d in trusted_domains}
+    exact = frozenset(d.lower() for d in trusted_domains)
+    suffixes = tuple("." + d for d in exact)
     for res in results:
-        domain = urlparse(res.url).netloc.lower()
-        if any(domain == d or domain.endswith("." + d) for d in domain_set):
+        # hostname is lowercased and has no port or credentials
+        domain = urlparse(res.url).hostname or ""
+        if domain in exact or domain.endswith(suffixes):
             res.trusted = True
 
-    # Mark results as verified when similar content appears in multiple sources
+    # Mark results as verified when similar content appears in multiple sources.
+    # Shingles are computed once per result, so each pair is a set overlap.
+    shingles = [_shingles(res.content) for res in results]
     for i, a in enumerate(results):
-        for b in results[i + 1 :]:
-            if _similar_text(a.content, b.content):
+        for j in range(i + 1, len(results)):
+            if _similar_shingles(shingles[i], shingles[j]):
                 a.verified = True
-                b.verified = True
+                results[j].verified = True
 
 
-def _similar_text(a: str, b: str, threshold: float = 0.3) -> bool:
-    """Return ``True`` if two texts are similar based on a ratio threshold."""
+def _shingles(text: str, size: int = SHINGLE_SIZE) -> frozenset[int]:
+    """Return hashes of the lowercased ``size``-word runs in ``text``.
+
+    Texts shorter than ``size`` words are a single shingle.
+    """
+
+    words = text.lower().split()
+    if len(words) <= size:
+        return frozenset([hash(tuple(words))]) if words else frozenset()
+    return frozenset(hash(tuple(words[i : i + size])) for i in range(len(words) - size + 1))
+
+
+def _similar_shingles(a: frozenset[int], b: frozenset[int], threshold: float = SIMILARITY_THRESHOLD) -> bool:
+    """Return ``True`` if the Jaccard index of two shingle sets reaches ``threshold``."""
 
     if not a or not b:
         return False
-    return difflib.SequenceMatcher(None, a, b).ratio() >= threshold
+    common = len(a & b)
+    return common > 0 and common >= threshold * (len(a) + len(b) - common)
+
+
+def _similar_text(a: str, b: str, threshold: float = SIMILARITY_THRESHOLD) -> bool:
+    """Return ``True`` if two texts share enough word shingles, see :func:`_similar_shingles`."""
+
+    return _similar_shingles(_shingles(a), _shingles(b), threshold)
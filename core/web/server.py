@@ -1,12 +1,14 @@
+from itertools import groupby
+from operator import attrgetter
 from pathlib import Path
-from typing import Optional
+from typing import AsyncIterator, Optional
 from uuid import UUID
 
-from fastapi import FastAPI, HTTPException
+from fastapi import Depends, FastAPI, HTTPException
 from fastapi.responses import FileResponse, HTMLResponse, JSONResponse
 from fastapi.staticfiles import StaticFiles
 
-from core.config import DBConfig, get_config
+from core.config import get_config
 from core.db.session import SessionManager
 from core.db.setup import run_migrations
 from core.state.state_manager import StateManager
@@ -19,55 +21,79 @@ FRONTEND_DIST = FRONTEND_DIR / "dist"
 if FRONTEND_DIST.exists():
     app.mount("/assets", StaticFiles(directory=FRONTEND_DIST / "assets"), name="assets")
 
-db_config: Optional[DBConfig] = None
+# Owns the engine and connection pool shared by all requests
+db: Optional[SessionManager] = None
 
 
 @app.on_event("startup")
 def startup() -> None:
-    global db_config
+    global db
     config = get_config()
     run_migrations(config.db)
-    db_config = config.db
+    db = SessionManager(config.db)
+
+
+@app.on_event("shutdown")
+async def shutdown() -> None:
+    if db is not None:
+        await db.engine.dispose()
+
+
+async def get_state_manager() -> AsyncIterator[StateManager]:
+    """
+    State manager for a single request.
+
+    Each request gets its own session manager (they hold one session at a
+    time), but all of them use the connection pool created at startup. The
+    session is closed when the request is done.
+    """
+    session_manager = SessionManager(db.config, engine=db.engine)
+    try:
+        yield StateManager(session_manager)
+    finally:
+        if session_manager.session is not None:
+            await session_manager.close()
 
 
 @app.get("/api/projects")
-async def get_projects():
-    sm = StateManager(SessionManager(db_config))
-    projects = await sm.list_projects()
+async def get_projects(sm: StateManager = Depends(get_state_manager)):
     data = []
-    for project in projects:
-        last_updated = None
-        p = {"name": project.name, "id": project.id.hex, "branches": []}
-        for branch in project.branches:
-            b = {"name": branch.name, "id": branch.id.hex, "steps": []}
-            for state in branch.states:
-                if not last_updated or state.created_at > last_updated:
-                    last_updated = state.created_at
-                b["steps"].append({"name": state.action or f"Step #{state.step_index}", "step": state.step_index})
-            if b["steps"]:
-                b["steps"][-1]["name"] = "Latest step"
-            p["branches"].append(b)
-        p["updated_at"] = last_updated.isoformat() if last_updated else None
-        data.append(p)
+    # Rows are ordered by project, one per branch
+    for _, rows in groupby(await sm.list_projects_summary(), key=attrgetter("project_id")):
+        rows = list(rows)
+        branches = []
+        for row in rows:
+            steps = [
+                {"name": action or f"Step #{step_index}", "step": step_index}
+                for step_index, action in zip(row.step_indices, row.step_actions)
+            ]
+            if steps:
+                steps[-1]["name"] = "Latest step"
+            branches.append({"name": row.branch_name, "id": row.branch_id.hex, "steps": steps})
+        last_updated = max((row.last_updated for row in rows if row.last_updated), default=None)
+        data.append(
+            {
+                "name": rows[0].project_name,
+                "id": rows[0].project_id.hex,
+                "branches": branches,
+                "updated_at": last_updated.isoformat() if last_updated else None,
+            }
+        )
     return {"projects": data}
 
 
 @app.post("/api/projects")
-async def create_project(payload: dict):
+async def create_project(payload: dict, sm: StateManager = Depends(get_state_manager)):
     name = payload.get("name")
     if not name:
         raise HTTPException(status_code=400, detail="Missing project name")
-    sm = StateManager(SessionManager(db_config))
     project = await sm.create_project(name)
-    await sm.session_manager.close()
     return {"id": project.id.hex, "name": project.name}
 
 
 @app.delete("/api/projects/{project_id}")
-async def delete_project(project_id: UUID):
-    sm = StateManager(SessionManager(db_config))
+async def delete_project(project_id: UUID, sm: StateManager = Depends(get_state_manager)):
     deleted = await sm.delete_project(project_id)
-    await sm.session_manager.close()
     if not deleted:
         raise HTTPException(status_code=404, detail="Project not found")
     return JSONResponse(status_code=204, content=None)
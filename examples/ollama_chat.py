@@ -19,17 +19,18 @@ client = AsyncClient(host=OLLAMA_HOST)
 
 
 async def respond(message, history):
-    messages: List[dict] = []
-    for human, ai in history:
-        messages.append({"role": "user", "content": human})
-        messages.append({"role": "assistant", "content": ai})
+    # Yield the reply as it grows, so the chat shows it while it's generated
+    messages: List[dict] = [
+        {"role": role, "content": content} for turn in history for role, content in zip(("user", "assistant"), turn)
+    ]
     messages.append({"role": "user", "content": message})
 
     stream = await client.chat(model=OLLAMA_MODEL, messages=messages, stream=True)
     reply = ""
     async for chunk in stream:
-        reply += chunk.get("message", {}).get("content", "")
-    return reply
+        if "message" in chunk:
+            reply += chunk["message"]["content"] or ""
+        yield reply
 
 
 async def ensure_server():
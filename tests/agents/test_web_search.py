@@ -2,10 +2,20 @@ from unittest.mock import patch
 
 import pytest
 
-from core.agents.web_search import WebQueries, WebSearch
+from core.agents import web_search as web_search_module
+from core.agents.web_search import WebQueries, WebSearch, _dedupe_similar_queries, cached_brave_search
 from core.web import BraveSearchError, WebResult
 
 
+@pytest.fixture(autouse=True)
+def clear_caches():
+    web_search_module._query_cache.clear()
+    web_search_module._search_cache.clear()
+    yield
+    web_search_module._query_cache.clear()
+    web_search_module._search_cache.clear()
+
+
 @patch("core.agents.web_search.brave_search")
 @pytest.mark.asyncio
 async def test_web_search_stores_results(mock_search, agentcontext):
@@ -60,3 +70,140 @@ async def test_web_search_aggregates_multiple_queries(mock_search, agentcontext)
     await ws.run()
     urls = {r["url"] for r in ws.next_state.web}
     assert urls == {"http://example.com/1", "http://example.com/2"}
+
+
+@patch("core.agents.web_search.brave_search")
+@pytest.mark.asyncio
+async def test_web_search_keeps_results_when_some_queries_fail(mock_search, agentcontext):
+    sm, _, ui, mock_llm = agentcontext
+
+    sm.current_state.tasks = [{"description": "Some task", "status": "todo"}]
+    await sm.commit()
+
+    ws = WebSearch(sm, ui)
+    ws.get_llm = mock_llm(return_value=WebQueries(queries=["q1", "q2"]))
+    mock_search.side_effect = [
+        BraveSearchError("fail"),
+        [WebResult(url="http://example.com/2", title="2", snippet="", content="")],
+    ]
+
+    await ws.run()
+    assert [r["url"] for r in ws.next_state.web] == ["http://example.com/2"]
+    assert mock_search.call_count == 2
+
+
+@patch("core.agents.web_search.brave_search")
+@pytest.mark.asyncio
+async def test_web_search_truncates_content(mock_search, agentcontext):
+    sm, _, ui, mock_llm = agentcontext
+
+    sm.current_state.tasks = [{"description": "Some task", "status": "todo"}]
+    await sm.commit()
+
+    ws = WebSearch(sm, ui)
+    ws.get_llm = mock_llm(return_value=WebQueries(queries=["q"]))
+    mock_search.return_value = [
+        WebResult(
+            url="http://example.com", title="Example", snippet="s", content="x" * (WebSearch.MAX_CONTENT_LENGTH + 10)
+        )
+    ]
+
+    await ws.run()
+    assert ws.next_state.web == [
+        {
+            "url": "http://example.com",
+            "title": "Example",
+            "content": "x" * WebSearch.MAX_CONTENT_LENGTH,
+            "snippet": "s",
+            "trusted": False,
+            "verified": False,
+        }
+    ]
+
+
+@patch("core.agents.web_search.brave_search")
+@pytest.mark.asyncio
+async def test_web_search_reuses_cached_queries(mock_search, agentcontext):
+    sm, _, ui, mock_llm = agentcontext
+
+    sm.current_state.tasks = [{"description": "Some task", "status": "todo"}]
+    await sm.commit()
+
+    get_llm = mock_llm(return_value=WebQueries(queries=["q"]))
+    mock_search.return_value = [WebResult(url="http://example.com", title="Example", snippet="", content="")]
+
+    for _ in range(2):
+        ws = WebSearch(sm, ui)
+        ws.get_llm = get_llm
+        await ws.run()
+
+    assert get_llm.return_value.await_count == 1
+    assert mock_search.call_count == 1
+
+
+def test_dedupe_similar_queries_drops_reordered_paraphrases():
+    queries = ["python asyncio tutorial", "Asyncio tutorial python", "fastapi sqlite", "fastapi sqlite example"]
+    assert _dedupe_similar_queries(queries) == ["python asyncio tutorial", "fastapi sqlite", "fastapi sqlite example"]
+
+
+@patch("core.agents.web_search.brave_search")
+@pytest.mark.asyncio
+async def test_cached_brave_search_expires_entries(mock_search):
+    mock_search.return_value = [WebResult(url="http://example.com", title="Example", content="")]
+
+    await cached_brave_search("q")
+    await cached_brave_search("q")
+    assert mock_search.call_count == 1
+
+    await cached_brave_search("q", ttl=0)
+    assert mock_search.call_count == 2
+
+
+@patch("core.agents.web_search.brave_search")
+@pytest.mark.asyncio
+async def test_cached_brave_search_does_not_cache_errors(mock_search):
+    mock_search.side_effect = [BraveSearchError("fail"), []]
+
+    with pytest.raises(BraveSearchError):
+        await cached_brave_search("q")
+    assert await cached_brave_search("q") == []
+
+
+@patch("core.agents.web_search.brave_search")
+@pytest.mark.asyncio
+async def test_web_search_dedupes_results_by_url(mock_search, agentcontext):
+    sm, _, ui, mock_llm = agentcontext
+
+    sm.current_state.tasks = [{"description": "Some task", "status": "todo"}]
+    await sm.commit()
+
+    ws = WebSearch(sm, ui)
+    ws.get_llm = mock_llm(return_value=WebQueries(queries=["q1", "q2"]))
+    mock_search.side_effect = [
+        [
+            WebResult(url="http://example.com/1", title="first", content=""),
+            WebResult(url="http://example.com/2", title="2", content=""),
+        ],
+        [
+            WebResult(url="http://example.com/1", title="second", content=""),
+            WebResult(url="http://example.com/3", title="3", content=""),
+        ],
+    ]
+
+    await ws.run()
+    assert [(r["url"], r["title"]) for r in ws.next_state.web] == [
+        ("http://example.com/1", "first"),
+        ("http://example.com/2", "2"),
+        ("http://example.com/3", "3"),
+    ]
+
+
+@patch("core.agents.web_search.brave_search")
+@pytest.mark.asyncio
+async def test_cached_brave_search_truncates_before_caching(mock_search):
+    mock_search.return_value = [WebResult(url="http://example.com", title="Example", content="x" * 100)]
+
+    results = await cached_brave_search("q", max_content_length=10)
+
+    assert results[0].content == "x" * 10
+    assert web_search_module._search_cache[("q", 10)][1][0].content == "x" * 10
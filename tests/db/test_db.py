@@ -1,8 +1,13 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
 import pytest
 from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql.asyncpg import AsyncAdapt_asyncpg_connection
 
 from core.config import DBConfig
 from core.db.models import Project, ProjectState
+from core.db.session import SessionManager
 from core.db.setup import run_migrations
 
 from .factories import create_project_state
@@ -65,3 +70,97 @@ async def test_deleting_project_state_clears_back_references(testdb):
     # Alternative is to just assert `prev_state_id is None`, which works
     # without the attribute_names
     assert state2.prev_state is None
+
+
+def test_session_manager_pool_settings():
+    db_cfg = DBConfig(pool_size=7, max_overflow=3)
+    manager = SessionManager(db_cfg)
+
+    assert manager.engine.pool.size() == 7
+    assert manager.engine.pool._max_overflow == 3
+
+
+def test_session_manager_can_share_an_engine():
+    owner = SessionManager(DBConfig())
+    manager = SessionManager(owner.config, engine=owner.engine)
+
+    assert manager.engine is owner.engine
+    assert manager.session is None
+
+
+def _asyncpg_connection(driver_connection=None):
+    """Mock of the adapted asyncpg connection SQLAlchemy passes to connect handlers."""
+    driver_connection = driver_connection or AsyncMock()
+    conn = MagicMock(spec=AsyncAdapt_asyncpg_connection)
+    conn.run_async.side_effect = lambda fn: asyncio.run(fn(driver_connection))
+    return conn
+
+
+def test_vector_extension_is_ensured_once_per_database(monkeypatch):
+    monkeypatch.setattr("core.db.session._vector_extension_ensured", set())
+    monkeypatch.setattr("core.db.session.register_vector", None)
+    driver_connection = AsyncMock()
+    conn = _asyncpg_connection(driver_connection)
+    manager = SessionManager(DBConfig())
+
+    manager._on_connect(conn, None)
+    manager._on_connect(conn, None)
+    SessionManager(DBConfig())._on_connect(conn, None)
+
+    driver_connection.execute.assert_awaited_once_with("CREATE EXTENSION IF NOT EXISTS vector")
+
+
+def test_vector_extension_is_retried_after_failure(monkeypatch):
+    monkeypatch.setattr("core.db.session._vector_extension_ensured", set())
+    monkeypatch.setattr("core.db.session.register_vector", None)
+    driver_connection = AsyncMock()
+    driver_connection.execute.side_effect = [OSError("connection lost"), None, None]
+    manager = SessionManager(DBConfig())
+
+    manager._on_connect(_asyncpg_connection(driver_connection), None)
+    manager._on_connect(_asyncpg_connection(driver_connection), None)
+    manager._on_connect(_asyncpg_connection(driver_connection), None)
+
+    assert driver_connection.execute.await_count == 2
+
+
+def test_vector_codec_is_registered_on_each_connection(monkeypatch):
+    register_vector = pytest.importorskip("pgvector.asyncpg").register_vector
+    manager = SessionManager(DBConfig())
+    monkeypatch.setattr("core.db.session._vector_extension_ensured", {manager.config.url})
+    conn = MagicMock(spec=AsyncAdapt_asyncpg_connection)
+
+    manager._on_connect(conn, None)
+    manager._on_connect(conn, None)
+
+    assert conn.run_async.call_count == 2
+    conn.run_async.assert_called_with(register_vector)
+
+
+def test_session_manager_uses_orjson_when_available():
+    orjson = pytest.importorskip("orjson")
+    manager = SessionManager(DBConfig())
+
+    assert manager.engine.dialect._json_deserializer is orjson.loads
+    assert manager.engine.dialect._json_serializer({"a": [1.5], 2: None}) == '{"a":[1.5],"2":null}'
+
+
+@pytest.mark.parametrize("has_vector_type", [True, False])
+def test_connection_is_discarded_when_vector_codec_fails(monkeypatch, has_vector_type):
+    def register_vector(conn):
+        raise ValueError("unknown type: public.vector")
+
+    manager = SessionManager(DBConfig())
+    monkeypatch.setattr("core.db.session._vector_extension_ensured", {manager.config.url})
+    monkeypatch.setattr("core.db.session.register_vector", register_vector)
+    driver_connection = AsyncMock()
+    driver_connection.fetchval.return_value = has_vector_type
+    conn = _asyncpg_connection(driver_connection)
+
+    if has_vector_type:
+        with pytest.raises(ValueError):
+            manager._on_connect(conn, None)
+        conn.close.assert_called_once()
+    else:
+        manager._on_connect(conn, None)
+        conn.close.assert_not_called()
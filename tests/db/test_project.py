@@ -84,6 +84,25 @@ async def test_get_all_projects(testdb):
     assert state2.branch.project in projects
 
 
+@pytest.mark.asyncio
+async def test_get_branch_summaries(testdb):
+    state = create_project_state(project_name="Summary")
+    state.action = "Initial"
+    testdb.add(state)
+    empty = Branch(name="empty", project=state.branch.project)
+    testdb.add(empty)
+    await testdb.commit()
+    await state.create_next_state()
+    await testdb.commit()
+
+    rows = [row for row in await Project.get_branch_summaries(testdb) if row.project_id == state.branch.project.id]
+    assert [row.branch_name for row in rows] == ["empty", Branch.DEFAULT]
+    assert rows[0].step_indices == [] and rows[0].last_updated is None
+    assert rows[1].step_indices == [1, 2]
+    assert rows[1].step_actions == ["Initial", None]
+    assert rows[1].last_updated is not None
+
+
 @pytest.mark.asyncio
 async def test_default_folder_name(testdb):
     project = Project(name="test project")
@@ -1,5 +1,5 @@
 import pytest
-from sqlalchemy import select
+from sqlalchemy import select, text
 
 from core.db.models import Branch, File, FileContent, Project, ProjectState
 from core.db.models.project_state import IterationStatus
@@ -92,6 +92,39 @@ async def test_create_next_deep_copies_fields(testdb):
     assert state.modified_files == {}
 
 
+@pytest.mark.asyncio
+async def test_create_next_state_copies_web_results(testdb):
+    state = create_project_state()
+    testdb.add(state)
+
+    state.web = [{"url": "http://example.com", "title": "Example", "trusted": False}]
+    await testdb.commit()
+
+    next_state = await state.create_next_state()
+    next_state.web[0]["trusted"] = True
+    next_state.web.append({"url": "http://example.org", "title": "Other"})
+
+    assert state.web == [{"url": "http://example.com", "title": "Example", "trusted": False}]
+
+
+@pytest.mark.asyncio
+async def test_web_results_support_jsonb_containment(testdb):
+    state = create_project_state()
+    state.web = [{"url": "http://example.com", "title": "Example"}]
+    testdb.add(state)
+    await testdb.commit()
+
+    indexdef = (
+        await testdb.execute(text("SELECT indexdef FROM pg_indexes WHERE indexname = 'ix_project_states_web'"))
+    ).scalar_one()
+    found = (
+        await testdb.execute(select(ProjectState.id).where(ProjectState.web.contains([{"url": "http://example.com"}])))
+    ).scalar_one()
+
+    assert "gin" in indexdef
+    assert found == state.id
+
+
 @pytest.mark.asyncio
 async def test_deleting_state_removes_child_objects(testdb):
     file = File(path="test.txt", content=FileContent(id="test", content="hello world"))
@@ -1,10 +1,18 @@
+from array import array
+from unittest.mock import AsyncMock
+
 import pytest
-from sqlalchemy import select
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy import select, text
 
 from core.config import DBConfig
 from core.db.models import SharedMemory
+from core.db.models.shared_memory import from_blob, to_blob
 from core.db.session import SessionManager
 from core.db.setup import run_migrations
+from core.memory.context_engine import ContextEngine
+from core.memory.shared_memory import SharedMemory as Memory
+from core.memory.shared_memory import _set_ef_search
 
 
 @pytest.mark.asyncio
@@ -27,3 +35,133 @@ async def test_bulk_insert_generates_unique_ids(tmp_path, postgres_container):
         assert len(ids) == 2
         assert len(set(ids)) == 2
         assert all(isinstance(i, str) and len(i) == 36 for i in ids)
+
+
+@pytest.mark.asyncio
+async def test_bulk_insert_returns_ids_in_order(testdb):
+    rows = [
+        {"agent_type": "a", "content": "foo", "embedding": [0.0] * 1536},
+        {"id": "00000000-0000-0000-0000-000000000001", "agent_type": "b", "content": "bar", "embedding": [0.1] * 1536},
+    ]
+    ids = await SharedMemory.bulk_insert(testdb, rows)
+    await testdb.commit()
+
+    assert len(ids) == 2
+    assert ids[1] == "00000000-0000-0000-0000-000000000001"
+    q = await testdb.execute(select(SharedMemory.id, SharedMemory.content))
+    assert {row[0]: row[1] for row in q} == {ids[0]: "foo", ids[1]: "bar"}
+
+
+@pytest.mark.asyncio
+async def test_bulk_insert_empty_is_noop(testdb):
+    assert await SharedMemory.bulk_insert(testdb, []) == []
+
+
+@pytest.mark.asyncio
+async def test_migrations_create_shared_memory_indexes(postgres_container):
+    db_url = postgres_container.get_connection_url().replace("postgresql://", "postgresql+asyncpg://")
+    db_cfg = DBConfig(url=db_url)
+    run_migrations(db_cfg)
+    manager = SessionManager(db_cfg)
+    async with manager as db:
+        result = await db.execute(
+            text("SELECT indexdef FROM pg_indexes WHERE indexname = 'ix_shared_memory_embedding_hnsw'")
+        )
+        indexdef = result.scalar_one()
+        result = await db.execute(text("SELECT 1 FROM pg_indexes WHERE indexname = 'ix_shared_memory_agent_type'"))
+        has_agent_type_index = result.scalar_one_or_none() is not None
+
+    assert "hnsw" in indexdef
+    assert "vector_cosine_ops" in indexdef
+    assert has_agent_type_index
+
+
+def test_float32_blob_roundtrip():
+    embedding = [0.5, -1.25, 3.0]
+    blob = to_blob(embedding)
+
+    assert len(blob) == 4 * len(embedding)
+    assert from_blob(blob) == embedding
+
+
+def test_embedding_is_bound_binary_on_asyncpg():
+    from sqlalchemy.dialects.postgresql import asyncpg, psycopg2
+
+    column_type = SharedMemory.__table__.c.embedding.type
+    assert column_type.bind_processor(asyncpg.dialect()) is None
+    assert column_type.bind_processor(psycopg2.dialect())([0.5] * 1536).startswith("[0.5,0.5,")
+
+
+def test_float32_blob_copies_float32_buffers():
+    np = pytest.importorskip("numpy")
+    embedding = [0.5, -1.25, 3.0]
+
+    assert to_blob(array("f", embedding)) == to_blob(embedding)
+    assert to_blob(np.array(embedding, dtype=np.float32)) == to_blob(embedding)
+    assert to_blob(np.array(embedding, dtype=np.float64)) == to_blob(embedding)
+
+
+def test_validate_embedding_rejects_matrices():
+    np = pytest.importorskip("numpy")
+    memory = Memory(None, embedding_dim=3)
+    memory._validate_embedding(np.zeros(3, dtype=np.float32))
+
+    with pytest.raises(ValueError):
+        memory._validate_embedding(np.zeros((3, 3), dtype=np.float32))
+
+
+@pytest.mark.asyncio
+async def test_ids_are_generated_server_side(testdb):
+    record = SharedMemory(agent_type="a", content="foo", embedding=[0.0] * 1536)
+    testdb.add(record)
+    await testdb.flush()
+
+    assert isinstance(record.id, str) and len(record.id) == 36
+
+
+@pytest.mark.asyncio
+async def test_context_engine_ranks_in_database(testmanager):
+    memory = Memory(testmanager)
+    assert memory.supports_ranked_search
+
+    query = [1.0] + [0.0] * 1535
+    close = [1.0, 0.1] + [0.0] * 1534
+    far = [1.0, 1.0] + [0.0] * 1534
+    await memory.add_many("a", [("close", close), ("far", far)])
+    await memory.add_many("b", [("other", [0.0, 1.0] + [0.0] * 1534)])
+
+    items = await ContextEngine(memory, decay=0.0).gather(query, agent_type="a", limit=2)
+
+    assert [i.content for i in items] == ["close", "far"]
+    assert items[0].score == pytest.approx(1.1 * (1.0 / (1.01**0.5)), rel=1e-4)
+
+
+@pytest.mark.asyncio
+async def test_search_does_not_load_embeddings(testmanager):
+    memory = Memory(testmanager)
+    await memory.add("a", "foo", [1.0] * 1536)
+
+    records = await memory.search_with_scores([1.0] * 1536, limit=1)
+
+    assert [rec.content for rec, _ in records] == ["foo"]
+    assert "embedding" not in sa_inspect(records[0][0]).dict
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("candidates", "expected"), [(1, "40"), (200, "200"), (5000, "1000")])
+async def test_ef_search_is_kept_within_pgvector_limits(candidates, expected):
+    session = AsyncMock()
+
+    await _set_ef_search(session, candidates)
+
+    assert session.execute.await_args.args[1] == {"ef": expected}
+
+
+@pytest.mark.asyncio
+async def test_search_with_large_limit(testmanager):
+    memory = Memory(testmanager)
+    await memory.add("a", "foo", [1.0] * 1536)
+
+    assert [rec.content for rec in await memory.search([1.0] * 1536, limit=1001)] == ["foo"]
+    items = await ContextEngine(memory).gather([1.0] * 1536, limit=300)
+    assert [i.content for i in items] == ["foo"]
@@ -1,15 +1,26 @@
+import asyncio
 import os
+import subprocess
+import time
+from collections import OrderedDict
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
 import requests
 
 from core.git.github import (
+    _get_async_client,
     _get_repo_owner_and_name,
+    aclose_async_client,
     clone_repository,
     commit_all,
+    commit_all_many,
+    commit_and_push,
     create_pull_request,
+    create_pull_request_async,
+    list_pull_requests,
     push,
     set_pre_commit_hook,
 )
@@ -25,6 +36,32 @@ def test_clone_repository():
         )
 
 
+def test_clone_repository_shallow_with_submodules():
+    with patch("subprocess.run") as run:
+        clone_repository(
+            "https://example.com/repo.git",
+            "/tmp/repo",
+            depth=1,
+            filter_spec="blob:none",
+            recurse_submodules=True,
+            jobs=4,
+        )
+        run.assert_called_with(
+            [
+                "git",
+                "clone",
+                "--depth=1",
+                "--filter=blob:none",
+                "--recurse-submodules",
+                "--jobs=4",
+                "https://example.com/repo.git",
+                "/tmp/repo",
+            ],
+            check=True,
+            shell=False,
+        )
+
+
 def test_commit_and_push():
     with patch("subprocess.run") as run:
         commit_all("/tmp/repo", "msg")
@@ -32,6 +69,53 @@ def test_commit_and_push():
     assert run.call_count == 3  # add, commit, push
 
 
+def test_commit_all_tracked_only_skips_add():
+    with patch("subprocess.run") as run:
+        commit_all("/tmp/repo", "msg", include_untracked=False)
+    run.assert_called_once_with(["git", "commit", "-a", "-m", "msg"], cwd="/tmp/repo", check=True, shell=False)
+
+
+def test_commit_all_many():
+    with patch("subprocess.run") as run:
+        commit_all_many(["/tmp/a", "/tmp/b"], "msg", max_workers=2)
+    assert sorted((c.kwargs["cwd"], c.args[0][1]) for c in run.call_args_list) == [
+        ("/tmp/a", "add"),
+        ("/tmp/a", "commit"),
+        ("/tmp/b", "add"),
+        ("/tmp/b", "commit"),
+    ]
+
+
+def test_commit_all_many_reraises_failure():
+    def fail_in_b(cmd, cwd, **kwargs):
+        if cwd == "/tmp/b":
+            raise subprocess.CalledProcessError(1, cmd)
+
+    with patch("subprocess.run", side_effect=fail_in_b) as run:
+        with pytest.raises(subprocess.CalledProcessError):
+            commit_all_many(["/tmp/a", "/tmp/b", "/tmp/c"], "msg")
+    assert {c.kwargs["cwd"] for c in run.call_args_list} == {"/tmp/a", "/tmp/b", "/tmp/c"}
+
+
+def test_commit_and_push_tracked_only_skips_add():
+    with patch("subprocess.run") as run:
+        commit_and_push("/tmp/repo", "msg", "main", include_untracked=False)
+    assert [c.args[0] for c in run.call_args_list] == [
+        ["git", "commit", "-a", "-m", "msg"],
+        ["git", "push", "origin", "main"],
+    ]
+
+
+def test_commit_and_push_includes_untracked_by_default():
+    with patch("subprocess.run") as run:
+        commit_and_push("/tmp/repo", "msg", "feature", remote="fork")
+    assert [c.args[0] for c in run.call_args_list] == [
+        ["git", "add", "."],
+        ["git", "commit", "-m", "msg"],
+        ["git", "push", "fork", "feature"],
+    ]
+
+
 def test_set_pre_commit_hook(tmp_path: Path):
     repo = tmp_path
     hooks_dir = repo / ".git" / "hooks"
@@ -45,7 +129,7 @@ def test_set_pre_commit_hook(tmp_path: Path):
 def test_create_pull_request():
     with (
         patch("core.git.github._get_repo_owner_and_name", return_value=("owner", "repo")),
-        patch("requests.post") as post,
+        patch("core.git.github._session.post") as post,
     ):
         response = MagicMock()
         response.json.return_value = {"url": "https://api.github.com/repos/owner/repo/pulls/1"}
@@ -71,7 +155,7 @@ def test_create_pull_request():
 def test_create_pull_request_missing_or_invalid_token(token):
     with (
         patch("core.git.github._get_repo_owner_and_name", return_value=("owner", "repo")),
-        patch("requests.post") as post,
+        patch("core.git.github._session.post") as post,
     ):
         response = MagicMock()
         response.raise_for_status.side_effect = requests.HTTPError("401 Unauthorized")
@@ -92,18 +176,242 @@ def test_create_pull_request_missing_or_invalid_token(token):
         )
 
 
-def test_get_repo_owner_and_name(tmp_path: Path):
+@pytest.mark.parametrize(
+    "url",
+    [
+        "git@github.com:owner/repo.git",
+        "git@github.com:owner/repo",
+        "https://github.com/owner/repo.git",
+        "https://github.com/owner/repo",
+        "ssh://git@github.com/owner/repo.git",
+        "ssh://git@github.com:22/owner/repo.git",
+    ],
+)
+def test_get_repo_owner_and_name(tmp_path: Path, url: str):
+    git_dir = tmp_path / ".git"
+    git_dir.mkdir()
+    config = git_dir / "config"
+    config.write_text(f'[remote "origin"]\n    url = {url}\n')
+    assert _get_repo_owner_and_name(str(tmp_path)) == ("owner", "repo")
+
+
+def test_get_repo_owner_and_name_prefers_origin(tmp_path: Path):
+    git_dir = tmp_path / ".git"
+    git_dir.mkdir()
+    config = git_dir / "config"
+    config.write_text(
+        "[core]\n"
+        "\tbare = false\n"
+        '[remote "upstream"]\n'
+        "\turl = https://github.com/upstream/repo.git\n"
+        "\tfetch = +refs/heads/*:refs/remotes/upstream/*\n"
+        '[remote "origin"]\n'
+        "\turl = git@github.com:owner/repo.git\n"
+        "\tfetch = +refs/heads/*:refs/remotes/origin/*\n"
+        "\tfetch = +refs/tags/*:refs/tags/*\n"
+    )
+    assert _get_repo_owner_and_name(str(tmp_path)) == ("owner", "repo")
+
+
+def test_get_repo_owner_and_name_picks_up_config_changes(tmp_path: Path):
     git_dir = tmp_path / ".git"
     git_dir.mkdir()
     config = git_dir / "config"
     config.write_text('[remote "origin"]\n    url = git@github.com:owner/repo.git\n')
     assert _get_repo_owner_and_name(str(tmp_path)) == ("owner", "repo")
 
+    config.write_text('[remote "origin"]\n    url = git@github.com:other/project.git\n')
+    stat = config.stat()
+    os.utime(config, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert _get_repo_owner_and_name(str(tmp_path)) == ("other", "project")
 
-def test_get_repo_owner_and_name_invalid(tmp_path: Path):
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://example.com/owner/repo.git",
+        "git@example.com:owner/repo.git",
+        "http://github.com/owner/repo.git",
+        "https://github.com/owner",
+        "https://github.com/owner/repo/extra",
+        "git@github.com:/repo.git",
+    ],
+)
+def test_get_repo_owner_and_name_invalid(tmp_path: Path, url: str):
     git_dir = tmp_path / ".git"
     git_dir.mkdir()
     config = git_dir / "config"
-    config.write_text('[remote "origin"]\n    url = https://example.com/owner/repo.git\n')
+    config.write_text(f'[remote "origin"]\n    url = {url}\n')
     with pytest.raises(ValueError):
         _get_repo_owner_and_name(str(tmp_path))
+
+
+def test_get_repo_owner_and_name_valueless_key(tmp_path: Path):
+    git_dir = tmp_path / ".git"
+    git_dir.mkdir()
+    config = git_dir / "config"
+    config.write_text('[http]\n\tsslVerify\n[remote "origin"]\n\turl = git@github.com:owner/repo.git\n')
+    with patch("subprocess.run") as run:
+        assert _get_repo_owner_and_name(str(tmp_path)) == ("owner", "repo")
+    run.assert_not_called()
+
+
+def test_get_repo_owner_and_name_unparseable_config(tmp_path: Path):
+    git_dir = tmp_path / ".git"
+    git_dir.mkdir()
+    config = git_dir / "config"
+    config.write_text('\turl = git@example.com:other/repo.git\n[remote "origin"]\n')
+    with patch("subprocess.run") as run:
+        run.return_value = MagicMock(returncode=0, stdout="https://github.com/owner/repo.git\n")
+        assert _get_repo_owner_and_name(str(tmp_path)) == ("owner", "repo")
+    run.assert_called_once()
+
+
+def test_get_repo_owner_and_name_worktree(tmp_path: Path):
+    main_git_dir = tmp_path / "main" / ".git"
+    worktree_git_dir = main_git_dir / "worktrees" / "feature"
+    worktree_git_dir.mkdir(parents=True)
+    (main_git_dir / "config").write_text('[remote "origin"]\n    url = git@github.com:owner/repo.git\n')
+    (worktree_git_dir / "commondir").write_text("../..\n")
+
+    worktree = tmp_path / "feature"
+    worktree.mkdir()
+    (worktree / ".git").write_text(f"gitdir: {worktree_git_dir}\n")
+
+    with patch("subprocess.run") as run:
+        assert _get_repo_owner_and_name(str(worktree)) == ("owner", "repo")
+    run.assert_not_called()
+
+
+def test_get_repo_owner_and_name_falls_back_to_git_config(tmp_path: Path):
+    with patch("subprocess.run") as run:
+        run.return_value = MagicMock(returncode=0, stdout="https://github.com/owner/repo.git\n")
+        assert _get_repo_owner_and_name(str(tmp_path)) == ("owner", "repo")
+    run.assert_called_once_with(
+        ["git", "config", "--get", "remote.origin.url"],
+        cwd=str(tmp_path),
+        capture_output=True,
+        text=True,
+        shell=False,
+    )
+
+
+def test_get_repo_owner_and_name_missing_path(tmp_path: Path):
+    with pytest.raises(ValueError, match="Could not find git config"):
+        _get_repo_owner_and_name(str(tmp_path / "missing"))
+
+
+def test_get_repo_owner_and_name_without_git_binary(tmp_path: Path):
+    with patch("subprocess.run", side_effect=FileNotFoundError("git")):
+        with pytest.raises(ValueError, match="Could not find git config"):
+            _get_repo_owner_and_name(str(tmp_path))
+
+
+def test_session_pools_and_retries_github_connections():
+    from core.git.github import _session
+
+    adapter = _session.get_adapter("https://api.github.com/repos/owner/repo/pulls")
+    assert adapter._pool_maxsize == 10
+    assert adapter.max_retries.total == 3
+    assert "POST" not in adapter.max_retries.allowed_methods
+    assert _session.headers["X-GitHub-Api-Version"] == "2022-11-28"
+
+
+def test_async_client_is_shared_per_event_loop():
+    async def get_clients():
+        client = _get_async_client()
+        assert _get_async_client() is client
+        await aclose_async_client()
+        assert client.is_closed
+        return client
+
+    first = asyncio.run(get_clients())
+    second = asyncio.run(get_clients())
+    assert first is not second
+
+
+@pytest.mark.asyncio
+async def test_create_pull_request_async(monkeypatch):
+    requests_seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests_seen.append(request)
+        return httpx.Response(201, json={"number": 1})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr("core.git.github._get_async_client", lambda: client)
+    monkeypatch.setattr("core.git.github._rate_limit_resume_at", 0.0)
+
+    with patch("core.git.github._get_repo_owner_and_name", return_value=("owner", "repo")):
+        result = await create_pull_request_async("/tmp/repo", "feature", "Title", "Body", "token")
+
+    assert result == {"number": 1}
+    assert str(requests_seen[0].url) == "https://api.github.com/repos/owner/repo/pulls"
+    assert requests_seen[0].headers["Authorization"] == "Bearer token"
+
+
+@pytest.mark.asyncio
+async def test_create_pull_request_async_waits_for_rate_limit_reset(monkeypatch):
+    reset_at = time.time() + 60
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        headers = {"X-RateLimit-Remaining": "5", "X-RateLimit-Reset": str(int(reset_at))}
+        return httpx.Response(201, json={"number": 1}, headers=headers)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr("core.git.github._get_async_client", lambda: client)
+    monkeypatch.setattr("core.git.github._rate_limit_resume_at", 0.0)
+
+    with (
+        patch("core.git.github._get_repo_owner_and_name", return_value=("owner", "repo")),
+        patch("core.git.github.asyncio.sleep", new_callable=AsyncMock) as sleep,
+    ):
+        await create_pull_request_async("/tmp/repo", "feature", "Title", "Body", "token")
+        sleep.assert_not_called()
+        await create_pull_request_async("/tmp/repo", "other", "Title", "Body", "token")
+
+    sleep.assert_awaited_once()
+    assert 0 < sleep.call_args.args[0] <= 60
+
+
+def _github_response(status_code, json_data=None, headers=None):
+    response = MagicMock(status_code=status_code, headers=headers or {})
+    response.json.return_value = json_data
+    return response
+
+
+def test_list_pull_requests_revalidates_with_etag(monkeypatch):
+    monkeypatch.setattr("core.git.github._etag_cache", OrderedDict())
+    pulls = [{"number": 1}]
+    with (
+        patch("core.git.github._get_repo_owner_and_name", return_value=("owner", "repo")),
+        patch("core.git.github._session.get") as get,
+    ):
+        get.side_effect = [
+            _github_response(200, pulls, {"ETag": '"abc"'}),
+            _github_response(304),
+        ]
+        assert list_pull_requests("/tmp/repo", "token", head="feature") == pulls
+        assert list_pull_requests("/tmp/repo", "token", head="feature") == pulls
+
+    first, second = get.call_args_list
+    assert first.args[0] == "https://api.github.com/repos/owner/repo/pulls?state=open&head=owner%3Afeature"
+    assert "If-None-Match" not in first.kwargs["headers"]
+    assert second.kwargs["headers"]["If-None-Match"] == '"abc"'
+
+
+def test_list_pull_requests_backs_off_when_rate_limited(monkeypatch):
+    monkeypatch.setattr("core.git.github._etag_cache", OrderedDict())
+    with (
+        patch("core.git.github._get_repo_owner_and_name", return_value=("owner", "repo")),
+        patch("core.git.github._session.get") as get,
+        patch("core.git.github.time.sleep") as sleep,
+    ):
+        get.side_effect = [
+            _github_response(403, headers={"X-RateLimit-Remaining": "0"}),
+            _github_response(429),
+            _github_response(200, []),
+        ]
+        assert list_pull_requests("/tmp/repo", "token") == []
+
+    assert [c.args[0] for c in sleep.call_args_list] == [1, 2]
@@ -0,0 +1,178 @@
+import asyncio
+import json
+from collections import OrderedDict
+from unittest.mock import ANY, MagicMock, patch
+
+import httpx
+import pytest
+
+ollama = pytest.importorskip("ollama")
+
+from core.config import LLMConfig, LLMProvider  # noqa: E402
+from core.llm import ollama_client  # noqa: E402
+from core.llm.convo import Convo  # noqa: E402
+from core.llm.ollama_client import OllamaClient, _count_tokens  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def token_cache(monkeypatch):
+    cache = OrderedDict()
+    monkeypatch.setattr(ollama_client, "_token_cache", cache)
+    return cache
+
+
+@pytest.fixture
+def tokenizer(monkeypatch):
+    tokenizer = MagicMock()
+    tokenizer.encode_ordinary_batch.side_effect = lambda texts, num_threads: [text.split() for text in texts]
+    monkeypatch.setattr(ollama_client, "tokenizer", tokenizer)
+    return tokenizer
+
+
+def _config(**kwargs) -> LLMConfig:
+    return LLMConfig(provider=LLMProvider.OLLAMA, model="llama3", **kwargs)
+
+
+def _mock_server(llm: OllamaClient, chunks: list[dict], requests_seen: list) -> None:
+    """Make ``llm`` talk to a mocked server streaming ``chunks`` as NDJSON."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests_seen.append(request)
+        return httpx.Response(200, content="".join(json.dumps(chunk) + "\n" for chunk in chunks))
+
+    client = ollama.AsyncClient(host="http://localhost:11434", transport=httpx.MockTransport(handler))
+    OllamaClient._clients[asyncio.get_running_loop()] = {llm._client_key: client}
+
+
+def _chunk(content: str, done: bool = False, **kwargs) -> dict:
+    return {
+        "model": "llama3",
+        "created_at": "2024-01-01T00:00:00Z",
+        "message": {"role": "assistant", "content": content},
+        "done": done,
+        **kwargs,
+    }
+
+
+def test_count_tokens_encodes_uncached_texts_in_one_batch(tokenizer, token_cache):
+    assert _count_tokens("one two", "three", "one two") == 5
+    tokenizer.encode_ordinary_batch.assert_called_once_with(["one two", "three"], num_threads=ANY)
+    assert len(token_cache) == 2
+
+    tokenizer.encode_ordinary_batch.reset_mock()
+    assert _count_tokens("three", "one two") == 3
+    tokenizer.encode_ordinary_batch.assert_not_called()
+
+    assert _count_tokens("three", "four five six") == 4
+    tokenizer.encode_ordinary_batch.assert_called_once_with(["four five six"], num_threads=ANY)
+
+
+def test_count_tokens_evicts_least_recently_used(tokenizer, token_cache, monkeypatch):
+    monkeypatch.setattr(ollama_client, "TOKEN_CACHE_SIZE", 2)
+    _count_tokens("a")
+    _count_tokens("b")
+    _count_tokens("a")
+    _count_tokens("c")
+    assert len(token_cache) == 2
+
+    tokenizer.encode_ordinary_batch.reset_mock()
+    _count_tokens("a", "c")
+    tokenizer.encode_ordinary_batch.assert_not_called()
+    _count_tokens("b")
+    tokenizer.encode_ordinary_batch.assert_called_once_with(["b"], num_threads=ANY)
+
+
+@pytest.mark.asyncio
+async def test_ollama_streams_response_and_uses_eval_count(tokenizer):
+    llm = OllamaClient(_config())
+    requests_seen = []
+    _mock_server(
+        llm,
+        [_chunk("Hello"), _chunk(", world"), _chunk("", done=True, eval_count=42)],
+        requests_seen,
+    )
+    convo = Convo("system hello").user("user hello")
+
+    response, prompt_tokens, completion_tokens = await llm._make_request(convo, json_mode=True)
+
+    assert response == "Hello, world"
+    assert prompt_tokens == 4
+    assert completion_tokens == 42
+    # Only the prompt is counted locally; the completion count comes from the server
+    tokenizer.encode_ordinary_batch.assert_called_once_with(["system hello", "user hello"], num_threads=ANY)
+
+    body = json.loads(requests_seen[0].content)
+    assert str(requests_seen[0].url) == "http://localhost:11434/api/chat"
+    assert body["model"] == "llama3"
+    assert body["format"] == "json"
+    assert body["stream"] is True
+
+
+@pytest.mark.asyncio
+async def test_ollama_counts_completion_tokens_without_eval_count(tokenizer):
+    llm = OllamaClient(_config())
+    _mock_server(llm, [_chunk("one two"), _chunk(" three", done=True)], [])
+
+    response, prompt_tokens, completion_tokens = await llm._make_request(Convo("hi"))
+
+    assert response == "one two three"
+    assert prompt_tokens == 1
+    assert completion_tokens == 3
+
+
+@pytest.mark.asyncio
+async def test_ollama_track_tokens_false_skips_counting(tokenizer):
+    llm = OllamaClient(_config(extra={"track_tokens": False}))
+    _mock_server(llm, [_chunk("Hello"), _chunk("", done=True)], [])
+
+    with patch("core.llm.ollama_client._count_tokens") as count_tokens:
+        result = await llm._make_request(Convo("system hello"))
+
+    assert result == ("Hello", 0, 0)
+    count_tokens.assert_not_called()
+    tokenizer.encode_ordinary_batch.assert_not_called()
+
+
+def test_ollama_client_is_shared_per_event_loop():
+    first = OllamaClient(_config(base_url="http://ollama:11434"))
+    second = OllamaClient(_config(base_url="http://ollama:11434"))
+    other = OllamaClient(_config(base_url="http://other:11434"))
+
+    async def get_clients():
+        assert first.client is second.client
+        assert first.client is not other.client
+        return first.client
+
+    assert asyncio.run(get_clients()) is not asyncio.run(get_clients())
+
+
+def test_ollama_client_timeouts():
+    llm = OllamaClient(_config(connect_timeout=5, read_timeout=30))
+
+    async def get_client():
+        return llm.client
+
+    with (
+        patch("core.llm.ollama_client.ollama_supports_timeout_object", return_value=True),
+        patch("core.llm.ollama_client.AsyncClient") as client_cls,
+    ):
+        llm._init_client()
+        asyncio.run(get_client())
+
+    client_cls.assert_called_once_with(host="http://localhost:11434", timeout=httpx.Timeout(30, connect=5, read=30))
+
+
+def test_ollama_client_unix_socket_base_url():
+    llm = OllamaClient(_config(base_url="unix:///run/ollama.sock"))
+
+    async def get_client():
+        return llm.client
+
+    with (
+        patch("core.llm.ollama_client.httpx.AsyncHTTPTransport") as transport_cls,
+        patch("core.llm.ollama_client.AsyncClient") as client_cls,
+    ):
+        asyncio.run(get_client())
+
+    transport_cls.assert_called_once_with(uds="/run/ollama.sock")
+    client_cls.assert_called_once_with(host="http://localhost", transport=transport_cls.return_value, timeout=ANY)
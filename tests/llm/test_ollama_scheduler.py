@@ -2,7 +2,7 @@ import asyncio
 
 import pytest
 
-from core.llm.ollama_scheduler import OllamaJob, OllamaScheduler
+from core.llm.ollama_scheduler import OllamaJob, OllamaScheduler, WeightedSemaphore
 
 
 @pytest.mark.asyncio
@@ -18,6 +18,8 @@ async def test_scheduler_runs_jobs_and_frees_resources():
     assert scheduler.gpu_mem_free == scheduler.total_gpu_mem
     assert scheduler.completed[0] is job1
 
+    await scheduler.aclose()
+
 
 @pytest.mark.asyncio
 async def test_scheduler_runs_gpu_jobs_concurrently():
@@ -46,6 +48,8 @@ async def test_scheduler_runs_gpu_jobs_concurrently():
     priorities = [job.priority for job in scheduler.completed]
     assert priorities == sorted(priorities)
 
+    await scheduler.aclose()
+
 
 # Additional comprehensive tests for OllamaScheduler
 # Testing framework: pytest with pytest-asyncio style markers already used in this project.
@@ -72,6 +76,8 @@ async def test_scheduler_respects_cpu_capacity_when_gpu_is_plenty():
     assert scheduler.cpu_free == scheduler.total_cpu_threads
     assert scheduler.gpu_mem_free == scheduler.total_gpu_mem
 
+    await scheduler.aclose()
+
 
 @pytest.mark.asyncio
 async def test_scheduler_rejects_job_exceeding_total_resources():
@@ -89,6 +95,8 @@ async def test_scheduler_rejects_job_exceeding_total_resources():
     assert scheduler.cpu_free == scheduler.total_cpu_threads
     assert scheduler.gpu_mem_free == scheduler.total_gpu_mem
 
+    await scheduler.aclose()
+
 
 @pytest.mark.asyncio
 async def test_scheduler_zero_resource_job_executes_and_cleans_up():
@@ -101,6 +109,8 @@ async def test_scheduler_zero_resource_job_executes_and_cleans_up():
     assert scheduler.gpu_mem_free == scheduler.total_gpu_mem
     assert scheduler.completed[-1] is zero_job
 
+    await scheduler.aclose()
+
 
 @pytest.mark.asyncio
 async def test_scheduler_priority_ordering_with_contention():
@@ -125,6 +135,8 @@ async def test_scheduler_priority_ordering_with_contention():
     assert scheduler.cpu_free == scheduler.total_cpu_threads
     assert scheduler.gpu_mem_free == scheduler.total_gpu_mem
 
+    await scheduler.aclose()
+
 
 @pytest.mark.asyncio
 async def test_scheduler_handles_cancellation_and_releases_resources():
@@ -148,6 +160,8 @@ async def test_scheduler_handles_cancellation_and_releases_resources():
     assert scheduler.gpu_mem_free == scheduler.total_gpu_mem
     assert all(j is not long_job for j in scheduler.completed)
 
+    await scheduler.aclose()
+
 
 @pytest.mark.asyncio
 async def test_scheduler_many_small_gpu_jobs_hit_gpu_concurrency():
@@ -162,6 +176,8 @@ async def test_scheduler_many_small_gpu_jobs_hit_gpu_concurrency():
     assert scheduler.cpu_free == scheduler.total_cpu_threads
     assert scheduler.gpu_mem_free == scheduler.total_gpu_mem
 
+    await scheduler.aclose()
+
 
 @pytest.mark.asyncio
 async def test_scheduler_serializes_when_gpu_is_bottleneck():
@@ -180,6 +196,8 @@ async def test_scheduler_serializes_when_gpu_is_bottleneck():
     assert scheduler.cpu_free == scheduler.total_cpu_threads
     assert scheduler.gpu_mem_free == scheduler.total_gpu_mem
 
+    await scheduler.aclose()
+
 
 @pytest.mark.asyncio
 async def test_scheduler_invalid_inputs_raise_meaningful_errors():
@@ -200,6 +218,8 @@ async def test_scheduler_invalid_inputs_raise_meaningful_errors():
         # Dataclass/type validation may throw on construction; that's acceptable.
         pass
 
+    await scheduler.aclose()
+
 
 @pytest.mark.asyncio
 async def test_scheduler_completes_and_tracks_order_of_equal_priority():
@@ -220,3 +240,248 @@ async def test_scheduler_completes_and_tracks_order_of_equal_priority():
     assert set(completed_prompts[:2]).issubset({"e1", "e2"})
     assert scheduler.cpu_free == scheduler.total_cpu_threads
     assert scheduler.gpu_mem_free == scheduler.total_gpu_mem
+
+    await scheduler.aclose()
+
+
+@pytest.mark.asyncio
+async def test_weighted_semaphore_acquires_all_units_at_once():
+    sem = WeightedSemaphore(1000)
+    await sem.acquire(600)
+    assert sem.value == 400
+
+    # A waiter that can't be satisfied yet doesn't take any units
+    big = asyncio.create_task(sem.acquire(700))
+    await asyncio.sleep(0)
+    assert not big.done()
+    assert sem.value == 400
+
+    await sem.acquire(400)
+    assert sem.value == 0
+
+    sem.release(1000)
+    await asyncio.wait_for(big, timeout=1)
+    assert sem.value == 300
+
+
+@pytest.mark.asyncio
+async def test_weighted_semaphore_cancelled_waiter_takes_no_units():
+    sem = WeightedSemaphore(10)
+    await sem.acquire(10)
+
+    waiter = asyncio.create_task(sem.acquire(5))
+    await asyncio.sleep(0)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    sem.release(10)
+    assert sem.value == 10
+
+
+@pytest.mark.asyncio
+async def test_scheduler_runs_equal_priority_jobs_in_submission_order():
+    scheduler = OllamaScheduler(total_cpu_threads=1, total_gpu_mem=1)
+    jobs = [OllamaJob(priority=1, prompt=f"e{i}", cpu_threads=1, gpu_mem_mb=1) for i in range(5)]
+
+    await asyncio.gather(*(scheduler.submit(j) for j in jobs))
+
+    assert [j.prompt for j in scheduler.completed] == [f"e{i}" for i in range(5)]
+    assert len(scheduler._workers) == 1
+
+    await scheduler.aclose()
+
+
+@pytest.mark.asyncio
+async def test_scheduler_holds_cpu_threads_for_whole_job():
+    scheduler = OllamaScheduler(total_cpu_threads=2, total_gpu_mem=10)
+    jobs = [OllamaJob(priority=0, prompt=f"c{i}", cpu_threads=2, gpu_mem_mb=1, sleep_ms=5) for i in range(3)]
+
+    await asyncio.gather(*(scheduler.submit(j) for j in jobs))
+
+    # Every job needs both CPU threads, so they can't overlap even though GPU memory is plentiful
+    assert scheduler.max_gpu_concurrency == 1
+    assert scheduler.cpu_free == scheduler.total_cpu_threads
+    assert scheduler.gpu_mem_free == scheduler.total_gpu_mem
+
+    await scheduler.aclose()
+
+
+@pytest.mark.asyncio
+async def test_scheduler_bounds_queue_and_completed_history():
+    scheduler = OllamaScheduler(total_cpu_threads=1, total_gpu_mem=1, max_queue_size=2, max_completed=3)
+    jobs = [OllamaJob(priority=0, prompt=f"b{i}", cpu_threads=1, gpu_mem_mb=1) for i in range(6)]
+
+    tasks = [asyncio.create_task(scheduler.submit(j)) for j in jobs]
+    await asyncio.sleep(0)
+    assert scheduler.queue_depth <= 2
+
+    await asyncio.gather(*tasks)
+    assert scheduler.queue_depth == 0
+    assert scheduler.completed_count == 6
+    assert [j.prompt for j in scheduler.completed] == ["b3", "b4", "b5"]
+
+    await scheduler.aclose()
+
+
+@pytest.mark.asyncio
+async def test_scheduler_rejects_job_submitted_twice():
+    scheduler = OllamaScheduler(total_cpu_threads=1, total_gpu_mem=1)
+    job = OllamaJob(priority=0, prompt="dup", cpu_threads=1, gpu_mem_mb=1, sleep_ms=20)
+
+    first = asyncio.create_task(scheduler.submit(job))
+    await asyncio.sleep(0)
+    with pytest.raises(ValueError):
+        await scheduler.submit(job)
+
+    assert await first == "dup"
+    # Once finished, the same job can be submitted again
+    assert await scheduler.submit(job) == "dup"
+
+    await scheduler.aclose()
+
+
+@pytest.mark.asyncio
+async def test_scheduler_reports_job_errors_to_submitter(monkeypatch):
+    scheduler = OllamaScheduler(total_cpu_threads=1, total_gpu_mem=1)
+    run = scheduler._run
+
+    async def failing_run(job):
+        if job.prompt == "bad":
+            raise RuntimeError("boom")
+        await run(job)
+
+    monkeypatch.setattr(scheduler, "_run", failing_run)
+
+    bad = OllamaJob(priority=0, prompt="bad")
+    with pytest.raises(RuntimeError, match="boom"):
+        await scheduler.submit(bad)
+    assert bad.exception is not None
+
+    # The worker survives the failure and keeps processing jobs
+    good = OllamaJob(priority=0, prompt="good")
+    assert await scheduler.submit(good) == "good"
+    assert good.result == "good"
+
+    await scheduler.aclose()
+
+
+@pytest.mark.asyncio
+async def test_scheduler_drops_cancelled_queued_job():
+    scheduler = OllamaScheduler(total_cpu_threads=1, total_gpu_mem=1)
+    running = asyncio.create_task(scheduler.submit(OllamaJob(priority=0, prompt="running", sleep_ms=50)))
+    queued_job = OllamaJob(priority=1, prompt="queued")
+    queued = asyncio.create_task(scheduler.submit(queued_job))
+    await asyncio.sleep(0.01)
+    assert scheduler.queue_depth == 1
+
+    queued.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await queued
+    assert scheduler.queue_depth == 0
+    assert not running.done()
+
+    assert await running == "running"
+    assert all(j is not queued_job for j in scheduler.completed)
+
+    await scheduler.aclose()
+
+
+@pytest.mark.asyncio
+async def test_scheduler_coalesces_wakeups():
+    scheduler = OllamaScheduler(total_cpu_threads=1, total_gpu_mem=1)
+    await scheduler.submit(OllamaJob(priority=0, prompt="start"))
+    await asyncio.sleep(0)
+
+    wakeup = scheduler._wakeup
+    for _ in range(3):
+        scheduler._wake()
+    assert scheduler._wakeup is wakeup
+    assert not wakeup.is_set()
+
+    await asyncio.sleep(0)
+    assert wakeup.is_set()
+    assert scheduler._wakeup is not wakeup
+    assert not scheduler._wakeup.is_set()
+
+    await scheduler.aclose()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("strict_priority", [False, True])
+async def test_scheduler_runs_fitting_jobs_past_a_blocked_head(strict_priority):
+    scheduler = OllamaScheduler(total_cpu_threads=4, total_gpu_mem=4, strict_priority=strict_priority)
+    running = OllamaJob(priority=0, prompt="running", gpu_mem_mb=2, sleep_ms=30)
+    big = OllamaJob(priority=1, prompt="big", gpu_mem_mb=4)
+    small = OllamaJob(priority=2, prompt="small", gpu_mem_mb=1)
+
+    first = asyncio.create_task(scheduler.submit(running))
+    await asyncio.sleep(0.005)
+    await asyncio.gather(first, scheduler.submit(big), scheduler.submit(small))
+
+    prompts = [j.prompt for j in scheduler.completed]
+    if strict_priority:
+        assert prompts == ["running", "big", "small"]
+    else:
+        # The small job fits next to the running one, the big one has to wait
+        assert prompts == ["small", "running", "big"]
+
+    await scheduler.aclose()
+
+
+@pytest.mark.asyncio
+async def test_scheduler_rounds_gpu_memory_up_to_bins():
+    scheduler = OllamaScheduler(total_cpu_threads=4, total_gpu_mem=10, gpu_bin_sizes=[4, 2])
+    job = OllamaJob(priority=0, prompt="binned", gpu_mem_mb=3, sleep_ms=50)
+    large = OllamaJob(priority=0, prompt="large", gpu_mem_mb=5, sleep_ms=50)
+
+    tasks = [asyncio.create_task(scheduler.submit(j)) for j in (job, large)]
+    await asyncio.sleep(0.01)
+    # 3 MB takes a 4 MB bin; 5 MB is larger than every bin and is reserved as-is
+    assert scheduler.gpu_mem_free == 1
+    assert scheduler.fragmentation_ratio == pytest.approx(1 / 9)
+
+    await asyncio.gather(*tasks)
+    assert scheduler.gpu_mem_free == scheduler.total_gpu_mem
+    assert scheduler.fragmentation_ratio == 0.0
+
+    await scheduler.aclose()
+
+
+@pytest.mark.asyncio
+async def test_scheduler_num_workers_caps_concurrency():
+    scheduler = OllamaScheduler(total_cpu_threads=1, total_gpu_mem=10, num_workers=3)
+    jobs = [OllamaJob(priority=0, prompt=f"g{i}", cpu_threads=0, gpu_mem_mb=1, sleep_ms=20) for i in range(6)]
+
+    await asyncio.gather(*(scheduler.submit(j) for j in jobs))
+
+    assert len(scheduler._workers) == 3
+    assert scheduler.max_gpu_concurrency == 3
+
+    await scheduler.aclose()
+
+
+def test_jobs_compare_by_identity():
+    job1 = OllamaJob(priority=0, prompt="same")
+    job2 = OllamaJob(priority=0, prompt="same")
+
+    assert job1 != job2
+    assert len({job1, job2}) == 2
+    with pytest.raises(TypeError):
+        job1 < job2
+
+
+@pytest.mark.asyncio
+async def test_scheduler_aclose_fails_running_and_queued_jobs():
+    scheduler = OllamaScheduler(total_cpu_threads=1, total_gpu_mem=1)
+    running = asyncio.create_task(scheduler.submit(OllamaJob(priority=0, prompt="running", sleep_ms=1000)))
+    queued = asyncio.create_task(scheduler.submit(OllamaJob(priority=1, prompt="queued")))
+    await asyncio.sleep(0.01)
+
+    await scheduler.aclose()
+
+    for task in (running, queued):
+        with pytest.raises(RuntimeError, match="closed"):
+            await asyncio.wait_for(task, timeout=1)
+    assert scheduler.queue_depth == 0
+    assert scheduler.cpu_free == 1 and scheduler.gpu_mem_free == 1
@@ -168,6 +168,18 @@ def test_parse_json_schema():
     }
 
 
+def test_parse_json_reuses_extended_model():
+    class TestModel(BaseModel):
+        name: str
+
+    first = JSONParser(spec=TestModel)('{"name": "a"}')
+    second = JSONParser(spec=TestModel)('{"name": "b"}')
+
+    assert type(first) is type(second)
+    assert type(first).__name__ == "ExtendedTestModel"
+    assert second.model_dump() == {"name": "b", "original_response": '{"name": "b"}'}
+
+
 @pytest.mark.parametrize(
     ("input", "expected"),
     [
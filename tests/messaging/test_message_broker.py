@@ -47,3 +47,175 @@ async def test_unsubscribe_stops_receiving_messages():
     await broker.publish("topic", {"value": 1})
     with pytest.raises(asyncio.TimeoutError):
         await asyncio.wait_for(broker.get(queue), timeout=0.1)
+
+
+@pytest.mark.asyncio
+async def test_full_queue_does_not_delay_other_subscribers():
+    broker = MessageBroker(maxsize=1, publish_put_timeout=0.2)
+    slow = broker.subscribe("topic")
+    fast = broker.subscribe("topic")
+    await broker.publish("topic", 1)
+    await fast.get()
+
+    publish = asyncio.create_task(broker.publish("topic", 2))
+    await asyncio.sleep(0)
+    # Delivered to the fast subscriber while still waiting on the full queue
+    assert fast.get_nowait() == 2
+    assert not publish.done()
+    await publish
+    assert slow.qsize() == 1 and slow.get_nowait() == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("policy", "expected"),
+    [
+        ("drop_oldest", [2, 3]),
+        ("drop_new", [1, 2]),
+    ],
+)
+async def test_overflow_policy(policy, expected):
+    broker = MessageBroker(maxsize=2, policy=policy)
+    queue = broker.subscribe("topic")
+    for value in (1, 2, 3):
+        await broker.publish("topic", value)
+
+    assert [queue.get_nowait() for _ in range(queue.qsize())] == expected
+
+
+def test_unknown_overflow_policy():
+    with pytest.raises(ValueError):
+        MessageBroker(policy="spill")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("subscribe", ["subscribe", "subscribe_channel"])
+async def test_per_subscriber_overflow_policy(subscribe):
+    broker = MessageBroker(maxsize=2, publish_put_timeout=0.01)
+    blocking = getattr(broker, subscribe)("topic")
+    latest = getattr(broker, subscribe)("topic", policy="drop_oldest")
+    merged = getattr(broker, subscribe)("topic", policy="coalesce", merge=lambda old, new: old + new)
+    for value in (1, 2, 3, 4):
+        await broker.publish("topic", value)
+
+    assert [blocking.get_nowait() for _ in range(blocking.qsize())] == [1, 2]
+    assert [latest.get_nowait() for _ in range(latest.qsize())] == [3, 4]
+    assert [merged.get_nowait() for _ in range(merged.qsize())] == [1, 9]
+
+
+def test_coalesce_policy_needs_merge_function():
+    broker = MessageBroker()
+    with pytest.raises(ValueError):
+        broker.subscribe("topic", policy="coalesce")
+    with pytest.raises(ValueError):
+        broker.subscribe("topic", policy="drop_new", merge=max)
+    with pytest.raises(ValueError):
+        MessageBroker(policy="coalesce")
+
+
+@pytest.mark.asyncio
+async def test_publish_without_subscribers_does_not_register_topic():
+    broker = MessageBroker()
+    await broker.publish("nobody", 1)
+
+    queue = broker.subscribe("topic")
+    broker.unsubscribe("topic", queue)
+    broker.unsubscribe("topic", queue)
+    broker.unsubscribe("other", queue)
+
+    assert broker._queues == {}
+
+
+@pytest.mark.asyncio
+async def test_channel_subscription():
+    broker = MessageBroker(maxsize=1, publish_put_timeout=1)
+    channel = broker.subscribe_channel("topic")
+    await broker.publish("topic", 1)
+
+    # Full: publish waits until the consumer makes room
+    publish = asyncio.create_task(broker.publish("topic", 2))
+    await asyncio.sleep(0)
+    assert not publish.done()
+    assert await broker.get(channel) == 1
+    await asyncio.wait_for(publish, timeout=1)
+    assert broker.queue_length(channel) == 1
+    assert await broker.get(channel) == 2
+
+    broker.unsubscribe("topic", channel)
+    await broker.publish("topic", 3)
+    assert channel.empty()
+
+
+@pytest.mark.asyncio
+async def test_channel_concurrent_consumers_get_each_message_once():
+    broker = MessageBroker()
+    channel = broker.subscribe_channel("topic")
+    consumers = [asyncio.create_task(channel.get()) for _ in range(3)]
+    await asyncio.sleep(0)
+    for value in range(3):
+        await broker.publish("topic", value)
+
+    assert sorted(await asyncio.gather(*consumers)) == [0, 1, 2]
+
+
+@pytest.mark.asyncio
+async def test_publish_many():
+    broker = MessageBroker(maxsize=2, publish_put_timeout=0.05)
+    fast = broker.subscribe_channel("topic")
+    slow = broker.subscribe("topic")
+    await broker.publish_many("nobody", [1, 2])
+
+    async def consume():
+        return [await fast.get() for _ in range(4)]
+
+    consumer = asyncio.create_task(consume())
+    await broker.publish_many("topic", [1, 2, 3, 4])
+
+    # The fast subscriber gets the whole batch in order; the stuck one only
+    # what fit, and the rest is dropped after a single timeout
+    assert await consumer == [1, 2, 3, 4]
+    assert [slow.get_nowait() for _ in range(slow.qsize())] == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_broadcast_subscribers_share_one_log():
+    broker = MessageBroker(maxsize=3)
+    sub1 = broker.subscribe_broadcast("topic")
+    queue = broker.subscribe("topic")
+    waiter = asyncio.create_task(broker.get(sub1))
+    await asyncio.sleep(0)
+
+    await broker.publish("topic", 1)
+    assert await asyncio.wait_for(waiter, timeout=1) == 1
+    assert queue.get_nowait() == 1
+
+    # Late subscribers only see new messages
+    sub2 = broker.subscribe_broadcast("topic")
+    await broker.publish_many("topic", [2, 3, 4, 5])
+    assert broker.queue_length(sub2) == 3
+    # Fell behind the log: the oldest messages are skipped
+    assert [sub2.get_nowait() for _ in range(3)] == [3, 4, 5]
+    assert sub2.empty()
+    assert [await broker.get(sub1) for _ in range(3)] == [3, 4, 5]
+
+    broker.unsubscribe("topic", sub1)
+    broker.unsubscribe("topic", sub2)
+    broker.unsubscribe("topic", sub2)
+    assert "topic" not in broker._broadcasts
+
+
+@pytest.mark.asyncio
+async def test_get_and_queue_length_are_static():
+    broker = MessageBroker()
+    queue = broker.subscribe("topic")
+    await broker.publish("topic", "msg")
+
+    assert MessageBroker.queue_length(queue) == 1
+    assert await MessageBroker.get(queue) == "msg"
+
+
+def test_broker_and_subscribers_have_no_instance_dict():
+    broker = MessageBroker()
+
+    for obj in (broker, broker.subscribe_channel("a"), broker.subscribe_broadcast("b")):
+        assert not hasattr(obj, "__dict__")
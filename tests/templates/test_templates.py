@@ -1,3 +1,4 @@
+import sys
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -278,3 +279,47 @@ def test_accessing_unknown_template_key_raises_keyerror():
     # Accessing a non-existent template key in the registry should raise KeyError
     with pytest.raises(KeyError):
         _ = PROJECT_TEMPLATES["non_existent_template_key"]
+
+
+def test_registry_imports_templates_lazily(monkeypatch):
+    from core.templates.registry import ProjectTemplateEnum
+
+    monkeypatch.delitem(sys.modules, "core.templates.typer_cli", raising=False)
+    registry = type(PROJECT_TEMPLATES)(PROJECT_TEMPLATES._classes)
+    assert "core.templates.typer_cli" not in sys.modules
+    assert set(registry) == {e.value for e in ProjectTemplateEnum}
+
+    for name, cls in registry.items():
+        assert cls.name == name
+    assert registry["typer_cli"] is registry["typer_cli"]
+    assert registry.get("missing") is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("uv_path", "virtual_env", "expected"),
+    [
+        ("/usr/bin/uv", "/venv", "uv pip install -r requirements.txt"),
+        ("/usr/bin/uv", None, "python -m pip install --disable-pip-version-check --no-input -r requirements.txt"),
+        (None, "/venv", "python -m pip install --disable-pip-version-check --no-input -r requirements.txt"),
+    ],
+)
+async def test_python_templates_install_requirements(monkeypatch, uv_path, virtual_env, expected):
+    monkeypatch.setattr("core.templates.base.shutil.which", lambda name: uv_path)
+    if virtual_env:
+        monkeypatch.setenv("VIRTUAL_ENV", virtual_env)
+    else:
+        monkeypatch.delenv("VIRTUAL_ENV", raising=False)
+
+    TemplateClass = PROJECT_TEMPLATES["fastapi_sqlite"]
+    pm = MagicMock(run_command=AsyncMock())
+    template = TemplateClass(TemplateClass.options_class(), MagicMock(), pm)
+
+    await template.install_hook()
+    pm.run_command.assert_awaited_once_with(expected)
+
+
+def test_template_file_descriptions_are_read_only():
+    for name in PROJECT_TEMPLATES:
+        with pytest.raises(TypeError):
+            PROJECT_TEMPLATES[name].file_descriptions["new.txt"] = "description"
@@ -1,4 +1,5 @@
 import inspect
+import sys
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -228,3 +229,54 @@ async def test_ask_question_buttons_only_non_verbose_silent(mock_PromptSession,
     assert prompt_async.await_count == 2
     captured = capsys.readouterr()
     assert captured.out == ""
+
+
+@pytest.mark.asyncio
+async def test_stream_flushes_once_at_end(capsys):
+    ui = PlainConsoleUI()
+
+    with patch("sys.stdout.flush") as flush:
+        for word in ["one ", "two"]:
+            await ui.send_stream_chunk(word)
+        flush.assert_not_called()
+        await ui.send_stream_chunk(None)
+        flush.assert_called_once()
+
+    assert capsys.readouterr().out == "one two\n"
+
+
+@pytest.mark.asyncio
+@patch("core.ui.console.PromptSession")
+async def test_ask_question_reuses_prompt_session(mock_PromptSession):
+    prompt_async = mock_PromptSession.return_value.prompt_async = AsyncMock(return_value="hi")
+    ui = PlainConsoleUI()
+
+    await ui.ask_question("First?")
+    await ui.ask_question("Second?")
+
+    mock_PromptSession.assert_called_once_with("> ")
+    assert prompt_async.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_progress_can_be_hidden(capsys):
+    ui = PlainConsoleUI(show_progress=False)
+
+    await ui.send_task_progress(1, 2, "task", "app", "in_progress")
+    await ui.send_step_progress(1, 2, {"type": "command"}, "app")
+    assert capsys.readouterr().out == ""
+
+    await PlainConsoleUI().send_step_progress(1, 2, {"type": "command"}, "app")
+    assert capsys.readouterr().out == "(step-progress) 1/2 {'type': 'command'} from app\n"
+
+
+@pytest.mark.asyncio
+async def test_lists_are_written_at_once(capsys):
+    ui = PlainConsoleUI()
+
+    with patch.object(sys.stdout, "write", wraps=sys.stdout.write) as write:
+        await ui.send_features_list(["login", "search"])
+        await ui.send_modified_files([])
+
+    assert write.call_count == 2
+    assert capsys.readouterr().out == "(features-list)\n  - login\n  - search\n(modified-files)\n"
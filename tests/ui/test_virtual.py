@@ -0,0 +1,12 @@
+import pytest
+
+from core.ui.virtual import VirtualUI
+
+
+@pytest.mark.asyncio
+async def test_ask_question_returns_inputs_in_order():
+    ui = VirtualUI([{"text": "first"}, {"button": "yes"}])
+
+    assert (await ui.ask_question("One?")).text == "first"
+    assert (await ui.ask_question("Two?", buttons={"yes": "Yes"})).button == "yes"
+    assert (await ui.ask_question("Three?", buttons={"continue": "Continue"})).button == "continue"
@@ -1,8 +1,24 @@
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from core.web.search import BraveSearchError, brave_search
+from core.web import search as search_module
+from core.web.search import (
+    DEFAULT_TRUSTED_DOMAINS,
+    BraveSearchError,
+    WebResult,
+    _evaluate_results,
+    _fetch_content,
+    _similar_text,
+    brave_search,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    search_module._content_cache.clear()
+    yield
+    search_module._content_cache.clear()
 
 
 @pytest.mark.asyncio
@@ -16,18 +32,30 @@ async def test_brave_search_fetches_and_extracts(monkeypatch):
         def json(self):
             return sample_json
 
-    async def mock_get(self, url, params=None, headers=None):
-        assert url.startswith("https://api.search.brave.com")
-        return MockResponse()
+    class MockPage:
+        is_error = False
+        text = "<html></html>"
+
+    clients = set()
+
+    async def mock_get(self, url, params=None, headers=None, follow_redirects=False):
+        clients.add(self)
+        if url.startswith("https://api.search.brave.com"):
+            return MockResponse()
+        assert url == "https://example.com" and follow_redirects
+        return MockPage()
 
     monkeypatch.setenv("BRAVE_API_KEY", "test-key")
     with (
         patch("httpx.AsyncClient.get", new=mock_get),
-        patch("trafilatura.fetch_url", return_value="<html></html>"),
-        patch("trafilatura.extract", return_value="content"),
+        patch("trafilatura.extract", return_value="content") as extract,
     ):
         results = await brave_search("test query", count=1)
 
+    # The search and the page fetch share a client; only extraction is threaded
+    assert len(clients) == 1
+    extract.assert_called_once_with("<html></html>")
+
     assert len(results) == 1
     result = results[0]
     assert result.url == "https://example.com"
@@ -117,3 +145,80 @@ async def test_brave_search_fact_checks_overlapping_content(monkeypatch):
         results = await brave_search("q", count=2)
 
     assert all(r.verified for r in results)
+
+
+@pytest.mark.parametrize(
+    ("a", "b", "expected"),
+    [
+        ("same text", "same text", True),
+        ("", "", False),
+        (
+            "The quick brown fox jumps over the lazy dog near the river bank",
+            "Reports say the quick brown fox jumps over the lazy dog near the old mill",
+            True,
+        ),
+        (
+            "The quick brown fox jumps over the lazy dog",
+            "Python asyncio event loops schedule coroutines and callbacks",
+            False,
+        ),
+    ],
+)
+def test_similar_text(a, b, expected):
+    assert _similar_text(a, b) is expected
+
+
+@pytest.mark.asyncio
+async def test_fetch_content_caches_extracted_pages():
+    page = MagicMock(is_error=False, text="<html></html>")
+    client = MagicMock(get=AsyncMock(return_value=page))
+
+    with patch("trafilatura.extract", return_value="content"):
+        assert await _fetch_content(client, "https://example.com") == "content"
+        assert await _fetch_content(client, "https://example.com") == "content"
+    assert client.get.await_count == 1
+
+    with patch("trafilatura.extract", return_value=None):
+        assert await _fetch_content(client, "https://empty.example.com") == ""
+    assert "https://empty.example.com" not in search_module._content_cache
+
+
+@pytest.mark.parametrize(
+    ("url", "trusted"),
+    [
+        ("https://wikipedia.org/wiki/AI", True),
+        ("https://en.WIKIPEDIA.org/wiki/AI", True),
+        ("https://www.bbc.com:443/news", True),
+        ("https://notwikipedia.org/wiki/AI", False),
+        ("https://wikipedia.org.example.com/", False),
+    ],
+)
+def test_evaluate_results_trusted_domains(url, trusted):
+    result = WebResult(url=url, title="", content="")
+    _evaluate_results([result], DEFAULT_TRUSTED_DOMAINS)
+    assert result.trusted is trusted
+
+
+@pytest.mark.asyncio
+async def test_brave_search_fetches_duplicate_urls_once(monkeypatch):
+    sample_json = {
+        "web": {
+            "results": [
+                {"url": "https://a.com", "title": "A"},
+                {"url": "https://a.com", "title": "A again"},
+                {"url": "https://b.com", "title": "B"},
+            ]
+        }
+    }
+
+    async def mock_get(self, url, params=None, headers=None):
+        return MagicMock(json=lambda: sample_json)
+
+    content_mock = AsyncMock(side_effect=["same text", "other page"])
+    monkeypatch.setenv("BRAVE_API_KEY", "test-key")
+    with patch("httpx.AsyncClient.get", new=mock_get), patch("core.web.search._fetch_content", content_mock):
+        results = await brave_search("q", count=3)
+
+    assert [(r.url, r.title) for r in results] == [("https://a.com", "A"), ("https://b.com", "B")]
+    assert content_mock.await_count == 2
+    assert not any(r.verified for r in results)
@@ -0,0 +1,81 @@
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+from fastapi.testclient import TestClient
+
+from core.config import DBConfig
+from core.db.session import SessionManager
+from core.web import server
+
+
+def test_requests_share_the_startup_engine(postgres_container):
+    db_url = postgres_container.get_connection_url().replace("postgresql://", "postgresql+asyncpg://")
+    config = MagicMock(db=DBConfig(url=db_url))
+
+    with (
+        patch.object(server, "get_config", return_value=config),
+        patch.object(SessionManager, "_create_engine", wraps=SessionManager._create_engine) as create_engine,
+        TestClient(server.app) as client,
+    ):
+        created = client.post("/api/projects", json={"name": "Shared engine"}).json()
+        names = [p["name"] for p in client.get("/api/projects").json()["projects"]]
+        assert client.delete(f"/api/projects/{created['id']}").status_code == 204
+        remaining = [p["id"] for p in client.get("/api/projects").json()["projects"]]
+
+    assert "Shared engine" in names
+    assert created["id"] not in remaining
+    create_engine.assert_called_once()
+
+
+def test_get_projects_groups_branch_summaries():
+    project_id, main_id, empty_id = uuid4(), uuid4(), uuid4()
+    rows = [
+        SimpleNamespace(
+            project_id=project_id,
+            project_name="Project",
+            branch_id=empty_id,
+            branch_name="empty",
+            last_updated=None,
+            step_indices=[],
+            step_actions=[],
+        ),
+        SimpleNamespace(
+            project_id=project_id,
+            project_name="Project",
+            branch_id=main_id,
+            branch_name="main",
+            last_updated=datetime(2024, 1, 2),
+            step_indices=[1, 2, 3],
+            step_actions=["Initial", None, "Last"],
+        ),
+    ]
+    sm = MagicMock(list_projects_summary=AsyncMock(return_value=rows))
+    server.app.dependency_overrides[server.get_state_manager] = lambda: sm
+    try:
+        response = TestClient(server.app).get("/api/projects")
+    finally:
+        server.app.dependency_overrides.clear()
+
+    assert response.json() == {
+        "projects": [
+            {
+                "name": "Project",
+                "id": project_id.hex,
+                "branches": [
+                    {"name": "empty", "id": empty_id.hex, "steps": []},
+                    {
+                        "name": "main",
+                        "id": main_id.hex,
+                        "steps": [
+                            {"name": "Initial", "step": 1},
+                            {"name": "Step #2", "step": 2},
+                            {"name": "Latest step", "step": 3},
+                        ],
+                    },
+                ],
+                "updated_at": "2024-01-02T00:00:00",
+            }
+        ]
+    }